@@ -0,0 +1,293 @@
+"""
+AI paddle strategies.
+
+Every AI is a strategy class registered by name in STRATEGIES and created
+with create(name, difficulty). Strategies always play the top paddle; the
+bottom paddle in AI-vs-AI matches plays through update_mirrored_ai with the
+rink flipped. Each one picks a target, moves the paddle with
+Paddle.move_towards and counts what it decided, and update() times every
+call, so strategies can be compared for strength against CPU cost:
+
+- heuristic: the original AI - defend, intercept straight-line predictions,
+  chase the puck on its own half and dig it out of corners
+- bounce: predicts the puck's path off the side walls and hits it towards
+  the opponent's goal instead of just at it
+- lookahead: steps the puck forward with friction and wall bounces to find
+  the first spot the paddle can reach in time (the most expensive)
+- table: looks up a target the bounce AI precomputed for the puck's grid
+  cell and direction of travel, so its cost stays flat however elaborate
+  the aiming behind the table gets
+"""
+import math
+import time
+from array import array
+import utils
+from physics import PHYSICS
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, PUCK_RADIUS, AI_SPEED, AI_AGGRESSION, AI_DEFENSE_POSITION,
+    AI_DIFFICULTY_SPEEDS, AI_LOOKAHEAD_FRAMES, AI_TABLE_CELL, AI_TABLE_SPEED
+)
+from game_objects import Paddle, MirroredPuck
+
+
+def reflect(x, low, high):
+    """Fold a straight-line position back into [low, high] the way side-wall bounces would"""
+    width = high - low
+    if width <= 0:
+        return low
+    x = (x - low) % (2 * width)
+    return low + (x if x <= width else 2 * width - x)
+
+
+class Strategy:
+    """Base class: subclasses set name and DECISIONS and implement decide()"""
+    name = None
+    DECISIONS = ()
+
+    def __init__(self, difficulty=1):
+        self.difficulty = difficulty
+        self.speed = AI_DIFFICULTY_SPEEDS[difficulty]  # Paddle speed, pixels per 1/60 s
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.calls = 0
+        self.seconds = 0.0  # CPU time spent in update()
+        self.max_seconds = 0.0
+        self.decisions = dict.fromkeys(('frozen',) + self.DECISIONS, 0)
+
+    def update(self, paddle, puck, step=1.0):
+        """Move paddle (defending the top goal) for one tick (step as in Puck.update)"""
+        start = time.perf_counter()
+        if paddle.is_frozen:
+            decision = 'frozen'
+        else:
+            decision = self.decide(paddle, puck, step)
+        elapsed = time.perf_counter() - start
+        self.calls += 1
+        self.seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+        self.decisions[decision] += 1
+
+    def decide(self, paddle, puck, step):
+        """Move the paddle and return the name of the decision taken"""
+        raise NotImplementedError
+
+    def match_speed(self, paddle, puck):
+        """Paddle speed this tick, boosted while the paddle's speed power-up is active"""
+        return self.speed * (1.5 if (paddle.power_up_active and puck.speed_boost) else 1.0)
+
+    def stats(self):
+        """Cost and decision counts so far"""
+        return {
+            'strategy': self.name,
+            'difficulty': self.difficulty,
+            'calls': self.calls,
+            'mean_us': 1e6 * self.seconds / self.calls if self.calls else 0.0,
+            'max_us': 1e6 * self.max_seconds,
+            'decisions': dict(self.decisions)
+        }
+
+
+def dig_out_of_corner(paddle, puck, step):
+    """Go straight for a puck in one of the AI's corners. Returns False if it isn't in one."""
+    if not (utils.is_point_in_corner_region(puck.x, puck.y) >= 0 and puck.y > SCREEN_HEIGHT / 2):
+        return False
+    # Approach from the centre side, slightly above the puck, so it is hit back into play
+    offset_distance = paddle.radius + PUCK_RADIUS + 5
+    if puck.x < SCREEN_WIDTH // 2:
+        target_x = puck.x + offset_distance * 0.5
+    else:
+        target_x = puck.x - offset_distance * 0.5
+    paddle.move_towards(target_x, puck.y - 5, AI_SPEED * 1.5, step)
+    return True
+
+
+class HeuristicAI(Strategy):
+    name = "heuristic"
+    DECISIONS = ('corner', 'attack', 'intercept', 'defend')
+
+    def decide(self, paddle, puck, step):
+        if dig_out_of_corner(paddle, puck, step):
+            return 'corner'
+        decision = self.aim(paddle, puck)
+        paddle.move_towards(paddle.target_x, paddle.target_y, self.match_speed(paddle, puck), step)
+        return decision
+
+    def aim(self, paddle, puck):
+        """Set paddle.target_x/target_y and return the decision"""
+        decision = 'defend'
+        target_x = SCREEN_WIDTH // 2
+        target_y = SCREEN_HEIGHT * AI_DEFENSE_POSITION
+
+        # Predict where the puck crosses the defence line
+        if puck.dy > 0:
+            time_to_intersect = (target_y - puck.y) / puck.dy
+            predicted_x = puck.x + puck.dx * time_to_intersect
+            predicted_x = max(paddle.radius, min(SCREEN_WIDTH - paddle.radius, predicted_x))
+            if abs(puck.dy) > 1:  # Only if the puck is moving with significant speed
+                target_x = predicted_x
+                decision = 'intercept'
+
+        # Puck on the AI's half (or anywhere with the speed power-up): go for it
+        if puck.y > SCREEN_HEIGHT // 2 or paddle.can_cross_midline:
+            if puck.x != paddle.x or puck.y != paddle.y:
+                decision = 'attack'
+                target_x = puck.x
+                target_y = puck.y - paddle.radius
+                if puck.y > SCREEN_HEIGHT * 0.75:
+                    # More aggressive when the puck is close to the AI's goal
+                    target_x = puck.x + puck.dx * AI_AGGRESSION
+                    target_y = puck.y + puck.dy * AI_AGGRESSION
+
+        paddle.target_x = target_x
+        paddle.target_y = target_y
+        return decision
+
+
+class BounceAI(HeuristicAI):
+    name = "bounce"
+
+    def aim(self, paddle, puck):
+        decision = 'defend'
+        target_x = SCREEN_WIDTH / 2
+        target_y = SCREEN_HEIGHT * AI_DEFENSE_POSITION
+
+        if puck.y > SCREEN_HEIGHT / 2 or paddle.can_cross_midline:
+            # Stand behind the puck on the line through it from the opponent's goal
+            to_goal_x = SCREEN_WIDTH / 2 - puck.x
+            to_goal_y = -puck.y
+            distance = math.sqrt(to_goal_x * to_goal_x + to_goal_y * to_goal_y)
+            if distance > 0:
+                decision = 'attack'
+                behind = paddle.radius * 0.5
+                target_x = puck.x - to_goal_x / distance * behind
+                target_y = puck.y - to_goal_y / distance * behind
+        elif puck.dy > 1:
+            # Where the puck crosses the defence line, bouncing off the side walls on the way
+            time_to_intersect = (target_y - puck.y) / puck.dy
+            target_x = reflect(puck.x + puck.dx * time_to_intersect, paddle.radius, SCREEN_WIDTH - paddle.radius)
+            decision = 'intercept'
+
+        paddle.target_x = target_x
+        paddle.target_y = target_y
+        return decision
+
+
+class LookaheadAI(BounceAI):
+    name = "lookahead"
+    DECISIONS = BounceAI.DECISIONS + ('lookahead',)
+
+    def decide(self, paddle, puck, step):
+        if dig_out_of_corner(paddle, puck, step):
+            return 'corner'
+        speed = self.match_speed(paddle, puck)
+        if self.look_ahead(paddle, puck, speed):
+            decision = 'lookahead'
+        else:
+            decision = self.aim(paddle, puck)
+        paddle.move_towards(paddle.target_x, paddle.target_y, speed, step)
+        return decision
+
+    def look_ahead(self, paddle, puck, speed):
+        """Target the first future puck position the paddle can reach in time; False if there is none"""
+        x, y, dx, dy = puck.x, puck.y, puck.dx, puck.dy
+        friction = PHYSICS['friction']
+        damping = PHYSICS['wall_bounce_damping']
+        low = PUCK_RADIUS
+        high = SCREEN_WIDTH - PUCK_RADIUS
+        own_half = SCREEN_HEIGHT / 2 + PUCK_RADIUS
+        for frame in range(1, AI_LOOKAHEAD_FRAMES + 1):
+            x += dx
+            y += dy
+            dx *= friction
+            dy *= friction
+            if x < low:
+                x = 2 * low - x
+                dx = -dx * damping
+            elif x > high:
+                x = 2 * high - x
+                dx = -dx * damping
+            if y < PUCK_RADIUS or y > SCREEN_HEIGHT - PUCK_RADIUS:
+                return False  # Off an end wall or into a goal: too late to plan
+            if y < own_half and not paddle.can_cross_midline:
+                continue
+            # Meet it from above so it is sent back down
+            target_x = x
+            target_y = min(SCREEN_HEIGHT - paddle.radius, y + paddle.radius * 0.5)
+            reach_x = target_x - paddle.x
+            reach_y = target_y - paddle.y
+            if reach_x * reach_x + reach_y * reach_y <= (speed * frame) ** 2:
+                paddle.target_x = target_x
+                paddle.target_y = target_y
+                return True
+        return False
+
+
+class TableAI(Strategy):
+    name = "table"
+    DECISIONS = ('corner', 'table')
+
+    # Targets per grid cell and direction of travel, shared by every instance: one
+    # table for the paddle's own half and one for while it may cross the midline
+    columns = math.ceil(SCREEN_WIDTH / AI_TABLE_CELL)
+    rows = math.ceil(SCREEN_HEIGHT / AI_TABLE_CELL)
+    targets_x = None
+    targets_y = None
+
+    def __init__(self, difficulty=1):
+        super().__init__(difficulty)
+        if TableAI.targets_x is None:
+            TableAI.build_table()
+
+    @classmethod
+    def build_table(cls):
+        """Aim the bounce AI at a puck moving diagonally through the centre of every cell"""
+        size = cls.columns * cls.rows * 4
+        cls.targets_x = array('d', bytes(8 * 2 * size))
+        cls.targets_y = array('d', bytes(8 * 2 * size))
+        aimer = BounceAI()
+        paddle = Paddle(is_ai=True)
+        puck = MirroredPuck()
+        component = AI_TABLE_SPEED / math.sqrt(2)
+        for crossing in (False, True):
+            paddle.can_cross_midline = crossing
+            for row in range(cls.rows):
+                for column in range(cls.columns):
+                    for direction in range(4):
+                        puck.x = (column + 0.5) * AI_TABLE_CELL
+                        puck.y = (row + 0.5) * AI_TABLE_CELL
+                        puck.dx = component if direction & 1 else -component
+                        puck.dy = component if direction & 2 else -component
+                        aimer.aim(paddle, puck)
+                        index = crossing * size + (row * cls.columns + column) * 4 + direction
+                        cls.targets_x[index] = paddle.target_x
+                        cls.targets_y[index] = paddle.target_y
+
+    def decide(self, paddle, puck, step):
+        if dig_out_of_corner(paddle, puck, step):
+            return 'corner'
+        column = min(self.columns - 1, max(0, int(puck.x / AI_TABLE_CELL)))
+        row = min(self.rows - 1, max(0, int(puck.y / AI_TABLE_CELL)))
+        index = (row * self.columns + column) * 4 + (puck.dx > 0) + 2 * (puck.dy > 0)
+        if paddle.can_cross_midline:
+            index += self.columns * self.rows * 4
+        paddle.move_towards(self.targets_x[index], self.targets_y[index], self.match_speed(paddle, puck), step)
+        return 'table'
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (HeuristicAI, BounceAI, LookaheadAI, TableAI)}
+
+
+def create(name, difficulty=1):
+    """A new strategy instance by name"""
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown AI strategy '{name}' (choose from {', '.join(STRATEGIES)})")
+    return STRATEGIES[name](difficulty)
+
+
+def describe(stats):
+    """One line of a strategy's cost and most common decisions"""
+    decisions = ", ".join(f"{name} {count}" for name, count in stats['decisions'].items() if count)
+    return (f"{stats['strategy']} ({stats['difficulty']}): {stats['calls']} calls, "
+            f"mean {stats['mean_us']:.1f} us, max {stats['max_us']:.1f} us; {decisions}")
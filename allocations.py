@@ -0,0 +1,169 @@
+"""
+Allocation and garbage collector instrumentation.
+
+AllocationProbe traces Python allocations with tracemalloc while a match
+runs. For every frame it stores how many bytes the update and the draw
+allocated (the traced peak above where the phase started) and how many
+stayed allocated afterwards, and at the end it compares snapshots taken
+after the warm-up and at the end of the run to name the lines whose
+allocations kept growing. It also times every collection through
+gc.callbacks, since a generation 2 collection in the middle of a match is
+a visible hitch.
+
+pause_gc()/resume_gc() freeze everything allocated so far into the
+permanent generation and switch automatic collection off, for matches whose
+loop allocates nothing worth collecting.
+
+    python main.py --ai-vs-ai --alloc-report 30
+    python main.py --freeze-gc
+"""
+import gc
+import time
+import tracemalloc
+from array import array
+from frame_timing import percentile
+from constants import ALLOC_WARMUP_FRAMES, ALLOC_TOP_SITES
+
+PHASES = ('update', 'draw')
+
+
+def pause_gc():
+    """Collect once, then keep the collector out of the way until resume_gc()"""
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+
+
+def resume_gc():
+    gc.unfreeze()
+    gc.enable()
+
+
+class AllocationProbe:
+    def __init__(self, capacity=36000, warmup=ALLOC_WARMUP_FRAMES):
+        self.capacity = capacity
+        self.warmup = warmup  # Frames ignored while caches and pools fill up
+        # Per phase and frame: bytes allocated during the phase, and bytes still held after it
+        self.peak_bytes = {phase: array('q', bytes(8 * capacity)) for phase in PHASES}
+        self.net_bytes = {phase: array('q', bytes(8 * capacity)) for phase in PHASES}
+        self.counts = {phase: 0 for phase in PHASES}
+        self.frames = 0
+        self.phase_start = 0
+
+        # Collector pauses in seconds, with the generation collected
+        self.gc_pauses = array('d', bytes(8 * capacity))
+        self.gc_generations = array('b', bytes(capacity))
+        self.gc_count = 0
+        self.gc_started = 0.0
+
+        self.baseline = None  # Snapshot taken when the warm-up ends
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        tracemalloc.start()
+        gc.callbacks.append(self.on_gc)
+        self.running = True
+
+    def stop(self):
+        """Stop tracing and return the snapshot taken at the end"""
+        if not self.running:
+            return None
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        gc.callbacks.remove(self.on_gc)
+        self.running = False
+        return snapshot
+
+    def begin(self):
+        """Mark the start of an update or draw phase"""
+        if not self.running:
+            return
+        tracemalloc.reset_peak()
+        self.phase_start = tracemalloc.get_traced_memory()[0]
+
+    def end(self, phase):
+        """Record the phase started by the last begin()"""
+        if not self.running:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        if phase == 'update':
+            self.frames += 1
+            if self.frames == self.warmup:
+                self.baseline = tracemalloc.take_snapshot()
+        if self.frames <= self.warmup:
+            return
+        count = self.counts[phase]
+        if count < self.capacity:
+            self.peak_bytes[phase][count] = peak - self.phase_start
+            self.net_bytes[phase][count] = current - self.phase_start
+            self.counts[phase] = count + 1
+
+    def on_gc(self, phase, info):
+        """gc.callbacks hook: time each collection"""
+        if phase == 'start':
+            self.gc_started = time.perf_counter()
+        elif self.gc_count < self.capacity:
+            self.gc_pauses[self.gc_count] = time.perf_counter() - self.gc_started
+            self.gc_generations[self.gc_count] = info['generation']
+            self.gc_count += 1
+
+    def summary(self, snapshot=None):
+        """Per-frame allocation and collector statistics; snapshot adds the growing lines"""
+        result = {'frames': max(0, self.frames - self.warmup)}
+        for phase in PHASES:
+            count = self.counts[phase]
+            peaks = sorted(self.peak_bytes[phase][:count])
+            nets = self.net_bytes[phase][:count]
+            result[phase] = {
+                'frames_allocating': sum(1 for value in peaks if value > 0),
+                'mean_bytes': sum(peaks) / count if count else 0.0,
+                'p50_bytes': percentile(peaks, 0.50),
+                'p99_bytes': percentile(peaks, 0.99),
+                'max_bytes': peaks[-1] if peaks else 0,
+                'net_bytes': sum(nets)
+            }
+
+        pauses = self.gc_pauses[:self.gc_count]
+        generations = [0, 0, 0]
+        for generation in self.gc_generations[:self.gc_count]:
+            generations[generation] += 1
+        result['gc'] = {
+            'collections': self.gc_count,
+            'generations': generations,
+            'total_ms': 1000 * sum(pauses),
+            'max_ms': 1000 * max(pauses, default=0.0)
+        }
+
+        result['sites'] = []
+        if snapshot is not None and self.baseline is not None:
+            for stat in snapshot.compare_to(self.baseline, 'lineno')[:ALLOC_TOP_SITES]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                result['sites'].append((f"{frame.filename}:{frame.lineno}", stat.size_diff, stat.count_diff))
+        return result
+
+    def report(self, title="Allocations"):
+        """Stop tracing and describe the run"""
+        summary = self.summary(self.stop())
+        lines = [f"{title} ({summary['frames']} frames after {self.warmup} warm-up frames)"]
+        lines.append(f"  {'bytes':<8}{'frames':>8}{'mean':>10}{'p50':>10}{'p99':>10}{'max':>10}{'kept':>10}")
+        for phase in PHASES:
+            stats = summary[phase]
+            lines.append(
+                f"  {phase:<8}{stats['frames_allocating']:>8}{stats['mean_bytes']:>10.0f}"
+                f"{stats['p50_bytes']:>10}{stats['p99_bytes']:>10}{stats['max_bytes']:>10}"
+                f"{stats['net_bytes']:>10}"
+            )
+        if summary['sites']:
+            lines.append("  still allocated since the warm-up:")
+            for site, size, count in summary['sites']:
+                lines.append(f"    {size:>9} B {count:>6} blocks  {site}")
+        collector = summary['gc']
+        lines.append(
+            f"  GC: {collector['collections']} collections (by generation {collector['generations']}), "
+            f"{collector['total_ms']:.1f} ms total, longest {collector['max_ms']:.2f} ms"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,351 @@
+"""
+Offline analytics over recorded match telemetry.
+
+Reads telemetry files (.npz or .jsonl.gz, see telemetry.py) and builds,
+with vectorized NumPy histogramming:
+
+- a puck occupancy heatmap over the rounded rink
+- paddle coverage maps for each side
+- shot origin maps and shot speed distributions per side, including the
+  origins of the shots that actually scored (where the AI concedes goals)
+- time the puck spends in the four rounded corners
+
+Each input is converted once into a directory of uncompressed .npy
+columns in the user cache directory and memory-mapped from there, so
+reruns over thousands of matches only touch the pages they read. Results
+are written as PNG images (when Pillow is installed) and CSV files:
+
+    python analytics.py recordings/*.npz --output report
+    python analytics.py --simulate 1000 --seconds 120 --output report
+"""
+import os
+import sys
+import csv
+import gzip
+import json
+import shutil
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, CORNER_RADIUS
+from events import PADDLE_HIT, GOAL
+from sound_synth import user_cache_dir
+from telemetry import (
+    TelemetryRecorder, COLUMNS, ROW_NAMES, SIDE_NAMES, KIND_NAMES, PUCK_SAMPLE, PADDLE_SAMPLE
+)
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; CSV output still works without it
+    Image = None
+
+# Bump when the column cache layout changes
+ANALYTICS_VERSION = 1
+
+SHOT_SPEED_BINS = np.arange(0, 82, 2)  # Paddle hit speeds, pixels per 1/60 s (last bin open-ended)
+CORNER_NAMES = ("bottom_left", "bottom_right", "top_left", "top_right")
+
+
+def corner_index(x, y):
+    """Vectorized utils.is_point_in_corner_region: corner index per point, or -1"""
+    left = x < CORNER_RADIUS
+    right = x > SCREEN_WIDTH - CORNER_RADIUS
+    bottom = y < CORNER_RADIUS
+    top = y > SCREEN_HEIGHT - CORNER_RADIUS
+    return np.select(
+        [left & bottom, right & bottom, left & top, right & top],
+        [0, 1, 2, 3],
+        default=-1
+    )
+
+
+def rink_mask(cell):
+    """Boolean grid of the cells whose centers lie inside the rounded rink"""
+    x = (np.arange(int(np.ceil(SCREEN_WIDTH / cell))) + 0.5) * cell
+    y = (np.arange(int(np.ceil(SCREEN_HEIGHT / cell))) + 0.5) * cell
+    grid_x, grid_y = np.meshgrid(x, y)
+    corners = corner_index(grid_x, grid_y)
+    # Same corner centers as utils.get_rink_corner_positions
+    center_x = np.where((corners == 0) | (corners == 2), CORNER_RADIUS, SCREEN_WIDTH - CORNER_RADIUS)
+    center_y = np.where(corners < 2, CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS)
+    inside_corner = np.hypot(grid_x - center_x, grid_y - center_y) <= CORNER_RADIUS
+    return (corners < 0) | inside_corner
+
+
+def read_jsonl(path):
+    """Parse a .jsonl.gz telemetry file into column arrays"""
+    row_types = {name: row_type for row_type, name in ROW_NAMES.items()}
+    sides = {name: index for index, name in enumerate(SIDE_NAMES)}
+    kinds = {name: index for index, name in enumerate(KIND_NAMES)}
+    columns = {name: [] for name in COLUMNS}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            row = json.loads(line)
+            columns['match'].append(row['match'])
+            columns['time'].append(row['time'])
+            columns['type'].append(row_types.get(row['type'], -1))
+            columns['x'].append(row['x'])
+            columns['y'].append(row['y'])
+            columns['speed'].append(row['speed'])
+            columns['side'].append(sides.get(row['side'], -1))
+            columns['kind'].append(kinds.get(row['kind'], -1))
+    return {name: np.array(values, dtype=COLUMNS[name]) for name, values in columns.items()}
+
+
+def read_npz(path):
+    with np.load(path) as data:
+        return {name: data[name] for name in COLUMNS}
+
+
+def cached_columns(path, cache_dir):
+    """Memory-mapped columns of one telemetry file, converting it on first use"""
+    stat = os.stat(path)
+    key = json.dumps([os.path.abspath(path), stat.st_size, stat.st_mtime_ns, ANALYTICS_VERSION])
+    directory = os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest()[:20])
+
+    if not os.path.isdir(directory):
+        columns = read_npz(path) if path.endswith('.npz') else read_jsonl(path)
+        # Write into a temporary directory and rename it, so a half-written
+        # cache entry is never picked up
+        temporary = directory + '.tmp'
+        shutil.rmtree(temporary, ignore_errors=True)
+        os.makedirs(temporary)
+        for name, values in columns.items():
+            np.save(os.path.join(temporary, name + '.npy'), values)
+        os.replace(temporary, directory)
+
+    return {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r') for name in COLUMNS}
+
+
+class MatchAnalytics:
+    """Histograms accumulated over any number of telemetry files"""
+
+    def __init__(self, cell=10):
+        self.cell = cell
+        self.mask = rink_mask(cell)
+        self.shape = self.mask.shape  # (rows, columns), row 0 at the bottom of the rink
+        self.puck_occupancy = np.zeros(self.shape, dtype=np.int64)
+        self.paddle_coverage = [np.zeros(self.shape, dtype=np.int64) for _ in SIDE_NAMES]
+        self.shot_origins = [np.zeros(self.shape, dtype=np.int64) for _ in SIDE_NAMES]
+        self.goal_origins = [np.zeros(self.shape, dtype=np.int64) for _ in SIDE_NAMES]
+        self.shot_speeds = [np.zeros(len(SHOT_SPEED_BINS) - 1, dtype=np.int64) for _ in SIDE_NAMES]
+        self.goal_speeds = [np.zeros(len(SHOT_SPEED_BINS) - 1, dtype=np.int64) for _ in SIDE_NAMES]
+        self.goals = [0, 0]  # Scored by each side
+        self.unattributed_goals = 0  # Goals with no earlier hit by the scoring side
+        self.corner_samples = np.zeros(len(CORNER_NAMES), dtype=np.int64)
+        self.puck_samples = 0
+        self.matches = 0
+        self.seconds = 0.0
+        self.rows = 0
+
+    def histogram(self, x, y):
+        """Count positions per cell with one bincount"""
+        rows, columns = self.shape
+        cell_x = np.clip((x // self.cell).astype(np.int64), 0, columns - 1)
+        cell_y = np.clip((y // self.cell).astype(np.int64), 0, rows - 1)
+        return np.bincount(cell_y * columns + cell_x, minlength=rows * columns).reshape(self.shape)
+
+    def speed_histogram(self, speeds):
+        return np.histogram(np.minimum(speeds, SHOT_SPEED_BINS[-1]), SHOT_SPEED_BINS)[0]
+
+    def add(self, columns):
+        """Accumulate one file's columns (rows in recording order)"""
+        match = np.asarray(columns['match'])
+        row_type = np.asarray(columns['type'])
+        x = np.asarray(columns['x'], dtype=np.float64)
+        y = np.asarray(columns['y'], dtype=np.float64)
+        speed = np.asarray(columns['speed'])
+        side = np.asarray(columns['side'])
+        time = np.asarray(columns['time'])
+        count = len(row_type)
+        if count == 0:
+            return
+        self.rows += count
+
+        # Matches are consecutive runs of rows; each lasts until its last row
+        starts = np.flatnonzero(np.r_[True, match[1:] != match[:-1]])
+        ends = np.r_[starts[1:], count] - 1
+        self.matches += len(starts)
+        self.seconds += float(time[ends].sum())
+
+        pucks = row_type == PUCK_SAMPLE
+        self.puck_occupancy += self.histogram(x[pucks], y[pucks])
+        self.puck_samples += int(pucks.sum())
+        corners = corner_index(x[pucks], y[pucks])
+        self.corner_samples += np.bincount(corners[corners >= 0], minlength=len(CORNER_NAMES))
+
+        paddles = row_type == PADDLE_SAMPLE
+        hits = row_type == PADDLE_HIT
+        for index in range(len(SIDE_NAMES)):
+            on_side = side == index
+            selected = paddles & on_side
+            self.paddle_coverage[index] += self.histogram(x[selected], y[selected])
+            selected = hits & on_side
+            self.shot_origins[index] += self.histogram(x[selected], y[selected])
+            self.shot_speeds[index] += self.speed_histogram(speed[selected])
+
+        # Attribute every goal to the scoring side's last paddle hit before it
+        # in the same match: a running maximum of hit row numbers per side
+        goals = np.flatnonzero(row_type == GOAL)
+        rows = np.arange(count)
+        for index in range(len(SIDE_NAMES)):
+            scored = goals[side[goals] == index]
+            self.goals[index] += len(scored)
+            last_hit = np.maximum.accumulate(np.where(hits & (side == index), rows, -1))
+            shooter = last_hit[scored]
+            valid = shooter >= 0
+            valid[valid] = match[shooter[valid]] == match[scored[valid]]
+            shots = shooter[valid]
+            self.unattributed_goals += int(len(scored) - len(shots))
+            self.goal_origins[index] += self.histogram(x[shots], y[shots])
+            self.goal_speeds[index] += self.speed_histogram(speed[shots])
+
+    def corner_seconds(self):
+        """Estimated seconds of play the puck spent in each corner"""
+        if not self.puck_samples:
+            return np.zeros(len(CORNER_NAMES))
+        return self.corner_samples / self.puck_samples * self.seconds
+
+    def maps(self):
+        """Every heatmap by output name"""
+        maps = {'puck_occupancy': self.puck_occupancy}
+        for index, name in enumerate(SIDE_NAMES):
+            maps[f'paddle_coverage_{name}'] = self.paddle_coverage[index]
+            maps[f'shot_origins_{name}'] = self.shot_origins[index]
+            maps[f'goal_origins_{name}'] = self.goal_origins[index]
+        return maps
+
+    def summary(self):
+        summary = {
+            'rows': self.rows,
+            'matches': self.matches,
+            'seconds': round(self.seconds, 1),
+            'puck_samples': self.puck_samples,
+            'goals_bottom': self.goals[0],
+            'goals_top': self.goals[1],
+            'unattributed_goals': self.unattributed_goals
+        }
+        for name, seconds, samples in zip(CORNER_NAMES, self.corner_seconds(), self.corner_samples):
+            summary[f'corner_{name}_seconds'] = round(float(seconds), 1)
+            summary[f'corner_{name}_share'] = round(samples / max(1, self.puck_samples), 4)
+        return summary
+
+
+def heatmap_image(grid, mask, scale):
+    """Color a heatmap (log scale, black-blue-yellow-white) with the area outside the rink grey"""
+    values = np.log1p(grid.astype(np.float64))
+    if values.max() > 0:
+        values /= values.max()
+    # Piecewise-linear color ramp
+    stops = np.array([0.0, 0.35, 0.7, 1.0])
+    colors = np.array([[0, 0, 0], [30, 60, 200], [250, 210, 40], [255, 255, 255]], dtype=np.float64)
+    rgb = np.stack([np.interp(values, stops, colors[:, channel]) for channel in range(3)], axis=-1)
+    rgb[~mask] = (40, 40, 40)
+    # Row 0 is the bottom of the rink but the top of an image
+    rgb = rgb[::-1].astype(np.uint8)
+    return np.repeat(np.repeat(rgb, scale, axis=0), scale, axis=1)
+
+
+def write_report(analytics, output):
+    """Write heatmap PNGs and CSVs, the shot speed table and the summary into output"""
+    os.makedirs(output, exist_ok=True)
+    written = []
+    scale = max(1, round(4 * 10 / analytics.cell))
+    for name, grid in analytics.maps().items():
+        path = os.path.join(output, name + '.csv')
+        # Same orientation as the images: top of the rink first
+        np.savetxt(path, grid[::-1], fmt='%d', delimiter=',')
+        written.append(path)
+        if Image is not None:
+            path = os.path.join(output, name + '.png')
+            Image.fromarray(heatmap_image(grid, analytics.mask, scale)).save(path)
+            written.append(path)
+
+    path = os.path.join(output, 'shot_speeds.csv')
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['speed_from', 'speed_to', 'shots_bottom', 'shots_top', 'goals_bottom', 'goals_top'])
+        for i in range(len(SHOT_SPEED_BINS) - 1):
+            writer.writerow([
+                SHOT_SPEED_BINS[i], SHOT_SPEED_BINS[i + 1],
+                analytics.shot_speeds[0][i], analytics.shot_speeds[1][i],
+                analytics.goal_speeds[0][i], analytics.goal_speeds[1][i]
+            ])
+    written.append(path)
+
+    path = os.path.join(output, 'summary.csv')
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['metric', 'value'])
+        for name, value in analytics.summary().items():
+            writer.writerow([name, value])
+    written.append(path)
+    return written
+
+
+def _simulate_job(job):
+    """Record a batch of headless matches into one .npz file (runs in a worker process)"""
+    import simulation
+    path, seeds, frames, pucks, sample_interval = job
+    recorder = TelemetryRecorder(path, sample_interval=sample_interval)
+    recorder.start()
+    for seed in seeds:
+        simulation.HeadlessMatch(seed, puck_count=pucks).run(frames, recorder)
+    recorder.close()
+    return path
+
+
+def simulate(matches, directory, seconds=120, pucks=1, sample_interval=0.1, workers=None, batch=50):
+    """Record headless AI-vs-AI matches in parallel, batch matches per file. Returns the paths."""
+    os.makedirs(directory, exist_ok=True)
+    jobs = []
+    for first in range(0, matches, batch):
+        seeds = range(first, min(matches, first + batch))
+        path = os.path.join(directory, f'simulated-{first:06d}.npz')
+        jobs.append((path, seeds, int(seconds * 60), pucks, sample_interval))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_simulate_job, jobs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Heatmaps and shot maps from recorded match telemetry")
+    parser.add_argument("inputs", nargs="*", help="telemetry files (.npz or .jsonl.gz)")
+    parser.add_argument("--output", default="analytics", help="directory for the PNG and CSV files")
+    parser.add_argument("--cell", type=int, default=10, help="heatmap cell size in pixels")
+    parser.add_argument("--cache-dir", default=None, help="where converted columns are kept")
+    parser.add_argument("--simulate", type=int, default=0, metavar="MATCHES",
+                        help="first record this many headless AI-vs-AI matches and analyze them too")
+    parser.add_argument("--seconds", type=float, default=120, help="simulated seconds per match")
+    parser.add_argument("--pucks", type=int, default=1, help="pucks per simulated match")
+    parser.add_argument("--sample-interval", type=float, default=0.1,
+                        help="seconds between puck/paddle samples in simulated matches")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    inputs = list(args.inputs)
+    if args.simulate:
+        directory = os.path.join(args.output, 'recordings')
+        inputs += simulate(args.simulate, directory, args.seconds, args.pucks,
+                           args.sample_interval, args.workers)
+    if not inputs:
+        parser.error("no telemetry files given (record some with main.py --telemetry, or use --simulate)")
+
+    cache_dir = args.cache_dir or user_cache_dir('analytics')
+    analytics = MatchAnalytics(args.cell)
+    for path in inputs:
+        analytics.add(cached_columns(path, cache_dir))
+
+    written = write_report(analytics, args.output)
+    summary = analytics.summary()
+    print(f"{summary['matches']} matches, {summary['rows']} rows, {summary['seconds']} s of play")
+    print(f"  goals: bottom {summary['goals_bottom']}, top {summary['goals_top']}")
+    for name in CORNER_NAMES:
+        print(f"  corner {name:<13}{summary[f'corner_{name}_seconds']:>10.1f} s"
+              f"  ({100 * summary[f'corner_{name}_share']:.1f}% of puck samples)")
+    print(f"{len(written)} files written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
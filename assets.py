@@ -0,0 +1,233 @@
+"""
+Packed asset bundle.
+
+A build step packs every asset (sounds now, textures and fonts later) into a
+single indexed file:
+
+    python assets.py build
+
+At runtime the bundle is opened once with mmap and each asset is decoded on
+first use straight from a zero-copy memoryview of the mapping. The bundle is
+written to a temp file and renamed into place, so swapping asset versions is
+atomic.
+
+File layout:
+    8 bytes   magic (BUNDLE_MAGIC)
+    4 bytes   little-endian index length
+    N bytes   JSON index: {"version": ..., "assets": {name: {"offset", "length", "sha256"}}}
+    ...       asset data, each entry aligned to BUNDLE_ALIGNMENT bytes
+"""
+import os
+import io
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+import pyglet
+import arcade
+from constants import SOUND_FILES, ASSET_BUNDLE, ASSET_DIRS
+
+BUNDLE_MAGIC = b"AHBNDL01"
+BUNDLE_ALIGNMENT = 16
+_HEADER = struct.Struct("<8sI")
+
+
+class MemoryViewReader(io.RawIOBase):
+    """Read-only, seekable file object over a memoryview, for decoders that want a file"""
+
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        else:
+            self.position = len(self.view) + offset
+        self.position = max(0, min(len(self.view), self.position))
+        return self.position
+
+    def readinto(self, buffer):
+        count = min(len(buffer), len(self.view) - self.position)
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+
+class BundledSound(arcade.Sound):
+    """An arcade Sound decoded from bundle data instead of a file on disk"""
+
+    def __init__(self, name, view):
+        # arcade.Sound.__init__ insists on a real file, so set up the same fields here
+        self.file_name = name
+        self.source = pyglet.media.load(name, file=MemoryViewReader(view), streaming=False)
+        if self.source.duration is None:
+            raise ValueError(f"Audio duration of bundled sound '{name}' is unknown")
+        self.min_distance = 100000000  # Same as arcade.Sound: allows 2D panning with 3D audio
+
+
+class AssetBundle:
+    def __init__(self, path=ASSET_BUNDLE):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self.file.close()
+            raise
+        self.data = memoryview(self.map)
+
+        magic, index_length = _HEADER.unpack_from(self.data, 0)
+        if magic != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not an asset bundle")
+        index = json.loads(bytes(self.data[_HEADER.size:_HEADER.size + index_length]))
+        self.version = index["version"]
+        self.entries = index["assets"]
+
+        self.sounds = {}  # Decoded sounds, by asset name
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        return list(self.entries)
+
+    def view(self, name):
+        """Zero-copy memoryview of an asset's raw bytes"""
+        entry = self.entries[name]
+        return self.data[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def load_sound(self, name):
+        """Decode a sound on first use and return the cached Sound after that"""
+        sound = self.sounds.get(name)
+        if sound is None:
+            sound = BundledSound(name, self.view(name))
+            self.sounds[name] = sound
+        return sound
+
+    def close(self):
+        """Release the mapping. Views handed out earlier must no longer be used."""
+        self.sounds = {}
+        if getattr(self, "data", None) is not None:
+            self.data.release()
+            self.data = None
+        if getattr(self, "map", None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+
+def open_default_bundle():
+    """Open ASSET_BUNDLE if it has been built, otherwise return None"""
+    if not os.path.exists(ASSET_BUNDLE):
+        return None
+    try:
+        return AssetBundle(ASSET_BUNDLE)
+    except (OSError, ValueError) as e:
+        print(f"Could not open asset bundle {ASSET_BUNDLE}: {e}")
+        return None
+
+
+def collect_asset_paths():
+    """All files that belong in the bundle: the sounds plus anything under ASSET_DIRS"""
+    paths = [path for path in SOUND_FILES if os.path.exists(path)]
+    for directory in ASSET_DIRS:
+        if not os.path.isdir(directory):
+            continue
+        for root, _, files in os.walk(directory):
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name).replace(os.sep, "/")
+                if path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def build_bundle(output=ASSET_BUNDLE, paths=None):
+    """Pack the given asset files (default: collect_asset_paths()) into one bundle"""
+    if paths is None:
+        paths = collect_asset_paths()
+
+    blobs = []
+    for path in paths:
+        with open(path, "rb") as f:
+            blobs.append((path, f.read()))
+
+    # The index size depends on the offsets, so lay out data relative to the
+    # end of the index first and fix the offsets up once its length is known
+    bundle_hash = hashlib.sha256()
+    entries = {}
+    relative = 0
+    for name, blob in blobs:
+        digest = hashlib.sha256(blob).hexdigest()
+        bundle_hash.update(name.encode("utf-8"))
+        bundle_hash.update(digest.encode("ascii"))
+        entries[name] = {"offset": relative, "length": len(blob), "sha256": digest}
+        relative += _aligned(len(blob))
+
+    version = bundle_hash.hexdigest()[:16]
+    data_start = 0
+    while True:
+        index = {"version": version, "assets": {
+            name: dict(entry, offset=entry["offset"] + data_start)
+            for name, entry in entries.items()
+        }}
+        index_bytes = json.dumps(index, sort_keys=True).encode("utf-8")
+        needed = _aligned(_HEADER.size + len(index_bytes))
+        if needed == data_start:
+            break
+        data_start = needed
+
+    temp_path = output + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b"\0" * (data_start - _HEADER.size - len(index_bytes)))
+        for name, blob in blobs:
+            f.write(blob)
+            f.write(b"\0" * (_aligned(len(blob)) - len(blob)))
+    os.replace(temp_path, output)
+    return version, len(blobs)
+
+
+def _aligned(size):
+    return (size + BUNDLE_ALIGNMENT - 1) // BUNDLE_ALIGNMENT * BUNDLE_ALIGNMENT
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Air Hockey asset bundle tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="pack all assets into one bundle file")
+    build_parser.add_argument("--output", default=ASSET_BUNDLE, help="bundle path to write")
+    list_parser = subparsers.add_parser("list", help="show the contents of a bundle")
+    list_parser.add_argument("bundle", nargs="?", default=ASSET_BUNDLE)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        version, count = build_bundle(args.output)
+        print(f"Packed {count} assets into {args.output} (version {version})")
+    elif args.command == "list":
+        bundle = AssetBundle(args.bundle)
+        print(f"{args.bundle} (version {bundle.version})")
+        for name, entry in bundle.entries.items():
+            print(f"  {name:<32}{entry['length']:>10} bytes")
+        bundle.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
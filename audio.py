@@ -0,0 +1,118 @@
+"""
+Sound playback with voice limiting and hit coalescing.
+
+The game thread only records play requests during a frame; play() never
+touches pyglet. Requests for the same sound within one frame are merged
+into a single voice at the loudest requested volume, and drain() starts the
+merged voices once per frame. Every sound gets a small pool of pyglet
+Players created up front (preload), so a hit rewinds and restarts an idle
+player instead of building a new Player and driver voice the way
+arcade.play_sound does; when all of a sound's players are busy the request
+is skipped. pyglet is only called from the game thread, since its players
+schedule work on the same clock the game loop ticks.
+"""
+import time
+import pyglet
+from constants import AUDIO_MAX_VOICES, IMPACT_MIN_VOLUME, IMPACT_FULL_VOLUME_SPEED
+
+
+def impact_volume(speed):
+    """Map an impact speed to a playback volume between IMPACT_MIN_VOLUME and 1"""
+    volume = IMPACT_MIN_VOLUME + (1.0 - IMPACT_MIN_VOLUME) * (speed / IMPACT_FULL_VOLUME_SPEED)
+    return max(IMPACT_MIN_VOLUME, min(1.0, volume))
+
+
+class Voice(pyglet.media.Player):
+    """A Player that keeps its source (and driver voice) when it finishes, so it can be restarted"""
+
+    def __init__(self, length):
+        super().__init__()
+        self.length = length  # Seconds
+        self.end_time = 0.0  # perf_counter time the current playback finishes
+
+    def on_eos(self):
+        # End of stream arrives through the event loop, possibly after the
+        # voice was restarted; only a voice that has really finished pauses
+        if time.perf_counter() >= self.end_time:
+            self.pause()
+
+
+class AudioDispatcher:
+    def __init__(self, max_voices=AUDIO_MAX_VOICES):
+        self.max_voices = max_voices  # Simultaneous voices allowed per sound
+        self.pending = {}  # Sound -> loudest volume requested this frame
+        self.voices = {}  # Sound -> its Voice pool
+        self.voice_limited = 0  # Requests skipped because every voice was busy
+        self.coalesced = 0  # Requests merged into another voice
+
+    def preload(self, sounds):
+        """Create the voice pools for sounds, so the first hit doesn't have to"""
+        for sound in sounds:
+            if sound is not None and sound not in self.voices:
+                self._create_voices(sound)
+
+    def play(self, sound, volume=1.0):
+        """Request playback this frame. Never calls pyglet."""
+        if sound is None:
+            return
+        pending = self.pending
+        if sound in pending:
+            self.coalesced += 1
+            if volume > pending[sound]:
+                pending[sound] = volume
+        else:
+            pending[sound] = volume
+
+    def play_impact(self, sound, speed):
+        """Request playback with the volume scaled by impact speed"""
+        self.play(sound, impact_volume(speed))
+
+    def drain(self):
+        """Start this frame's merged voices (call once per frame from the game thread)"""
+        if not self.pending:
+            return
+        for sound, volume in self.pending.items():
+            self._start_voice(sound, volume)
+        self.pending.clear()
+
+    def stop(self):
+        """Release every voice"""
+        self.pending.clear()
+        for voices in self.voices.values():
+            for voice in voices:
+                voice.delete()
+        self.voices.clear()
+
+    def _create_voices(self, sound):
+        try:
+            length = sound.get_length()
+        except Exception:
+            length = 0.2  # Reasonable guess for a short effect
+        voices = []
+        for _ in range(self.max_voices):
+            voice = Voice(length)
+            voice.queue(sound.source)
+            voices.append(voice)
+        self.voices[sound] = voices
+        return voices
+
+    def _start_voice(self, sound, volume):
+        """Restart a finished voice of sound, unless all max_voices are still playing"""
+        voices = self.voices.get(sound)
+        if voices is None:
+            try:
+                voices = self._create_voices(sound)
+            except Exception as e:
+                print(f"Could not play sound: {e}")
+                self.voices[sound] = ()
+                return
+        now = time.perf_counter()
+        for voice in voices:
+            if voice.end_time <= now:
+                # Rewinding pauses and resumes a voice that is still marked playing
+                voice.volume = volume
+                voice.seek(0.0)
+                voice.play()
+                voice.end_time = now + voice.length
+                return
+        self.voice_limited += 1
@@ -0,0 +1,37 @@
+"""
+Batched circle drawing.
+
+arcade.draw_circle_filled issues one draw call per circle, which is fine for
+a puck or two but not for hundreds of them. CircleBatch keeps one sprite per
+circle in a SpriteList sharing a single white circle texture, moves and
+tints the sprites each frame, and draws them all with one call.
+"""
+import arcade
+
+
+class CircleBatch:
+    def __init__(self, radius):
+        self.radius = radius
+        # Every sprite shares this texture; color comes from the sprite tint
+        self.texture = arcade.make_circle_texture(radius * 2, arcade.color.WHITE)
+        self.sprites = arcade.SpriteList()
+
+    def resize(self, count):
+        """Grow or shrink the batch to exactly count sprites"""
+        sprites = self.sprites
+        while len(sprites) < count:
+            sprites.append(arcade.Sprite(self.texture))
+        while len(sprites) > count:
+            sprites.pop()
+
+    def draw(self, objects, color, scale=1.0, color_of=None):
+        """Draw a circle at every object's x/y.
+
+        color_of(obj), when given, overrides the shared color per object.
+        """
+        self.resize(len(objects))
+        for sprite, obj in zip(self.sprites, objects):
+            sprite.position = (obj.x, obj.y)
+            sprite.scale = scale
+            sprite.color = color_of(obj) if color_of else color
+        self.sprites.draw()
@@ -10,6 +10,12 @@ PADDLE_RADIUS = 30
 PUCK_RADIUS = 20
 FRICTION = 0.99
 WALL_BOUNCE_DAMPING = 0.8
+PUCK_MAX_SPEED = 75  # Maximum speed for puck (increased from 15 to 75)
+PADDLE_RESTITUTION = 1.2  # Puck speed multiplier when hit by a paddle
+PADDLE_MOMENTUM_FACTOR = 0.5  # Share of paddle velocity passed to the puck
+
+# Tuned physics values (written by tuner.py, loaded at start-up when present)
+PHYSICS_PROFILE_FILE = "physics_profile.json"
 
 # Goal dimensions
 GOAL_WIDTH = 170
@@ -19,6 +25,11 @@ GOAL_HEIGHT = 10
 AI_SPEED = 8
 AI_AGGRESSION = 0.7  # How aggressively AI moves to hit puck (0-1)
 AI_DEFENSE_POSITION = 0.75  # Default position (percentage of screen height)
+AI_DIFFICULTY_SPEEDS = [5, AI_SPEED, 10]  # Paddle speed for Easy, Medium, Hard
+AI_STRATEGY = "heuristic"  # Default AI strategy (see ai.py)
+AI_LOOKAHEAD_FRAMES = 90  # How far ahead the lookahead AI follows the puck
+AI_TABLE_CELL = 15  # Grid cell size of the table AI's lookup table, pixels
+AI_TABLE_SPEED = 8  # Puck speed the table AI's targets are computed for
 
 # Game states
 MENU_STATE = "menu"
@@ -28,6 +39,104 @@ GAME_OVER_STATE = "game_over"
 PAUSE_STATE = "pause"
 HOW_TO_PLAY_STATE = "how_to_play"  # Added new state for How To Play screen
 
+# Particle counts spawned by physics events
+WALL_HIT_PARTICLES = 5
+PADDLE_HIT_PARTICLES = 5  # Reduced from 10 for performance
+GOAL_PARTICLES = 15  # Reduced from 30 for performance
+
+# Visual quality levels, lowest first, stepped by the quality governor (quality.py)
+QUALITY_LEVELS = [
+    {'name': "Low", 'max_particles': 10, 'particle_scale': 0.4, 'glow_rings': 0,
+     'power_up_pulse': False, 'repulsor_arrow': False, 'icons': False, 'trail_length': 0},
+    {'name': "Medium", 'max_particles': 20, 'particle_scale': 0.7, 'glow_rings': 1,
+     'power_up_pulse': True, 'repulsor_arrow': True, 'icons': False, 'trail_length': 8},
+    {'name': "High", 'max_particles': 30, 'particle_scale': 1.0, 'glow_rings': 3,
+     'power_up_pulse': True, 'repulsor_arrow': True, 'icons': True, 'trail_length': 16},
+    {'name': "Ultra", 'max_particles': 80, 'particle_scale': 2.0, 'glow_rings': 3,
+     'power_up_pulse': True, 'repulsor_arrow': True, 'icons': True, 'trail_length': 24}
+]
+DEFAULT_QUALITY = 2  # Start at High
+QUALITY_WINDOW = 60  # Frames averaged per quality decision
+QUALITY_DOWNGRADE_LOAD = 0.9  # Step down when frame work exceeds this share of the budget
+QUALITY_UPGRADE_LOAD = 0.5  # Step up only when it stays below this share...
+QUALITY_UPGRADE_WINDOWS = 5  # ...for this many windows in a row
+
+# Puck trails (trails.py); speeds are in pixels per 1/60 s
+TRAIL_MIN_SPEED = 6  # Slower stretches of a trail aren't drawn
+TRAIL_FULL_SPEED = 16  # From this speed on a trail is drawn at TRAIL_OPACITY
+TRAIL_WIDTH = PUCK_RADIUS * 0.6  # Half width of a trail at the puck
+TRAIL_COLOR = arcade.color.LIGHT_GRAY
+TRAIL_OPACITY = 0.6
+
+# Events queued per frame before new ones are dropped
+EVENT_QUEUE_CAPACITY = 256
+
+# Multi-puck play
+PUCK_COUNT_OPTIONS = [1, 2, 3, 5, 10, 20, 30]
+
+# AI-vs-AI spectator mode
+SPECTATOR_SPEEDS = [1, 2, 4, 8, 0.5]  # Simulation speed multipliers offered in the settings menu
+
+# Power-ups
+POWER_UP_RADIUS = 15
+POWER_UP_SPAWN_TIMES = [15, 10, 5]  # Seconds between spawns for Low, Medium, High
+POWER_UP_MAX_COUNTS = [1, 2, 3]  # Power-ups on the rink at once for Low, Medium, High
+
+# Loop rates (Hz). Physics velocities are always in pixels per 1/60 s and
+# are scaled by the tick length, so the tick rate doesn't change how the game plays.
+TICK_RATE = 60  # Simulation steps per second
+DRAW_RATE = 60  # Frames drawn per second (use with --vsync on 120/144/240 Hz displays)
+UNCAPPED_RATE = 1000  # Loop rate used by the benchmark mode
+MAX_TICKS_PER_FRAME = 8  # Simulation steps per frame before falling behind is accepted
+INTERPOLATION_SNAP_DISTANCE = 100  # Moves longer than this in one tick (resets) aren't interpolated
+BENCHMARK_SECONDS = 20
+# Menus are only redrawn when something on them changes, and the loop slows
+# down while no match is being played
+IDLE_RATE = 30  # Loop rate in the menus and while paused
+BACKGROUND_RATE = 5  # Loop rate while the window is unfocused or minimized
+PAUSE_DIM_ALPHA = 180  # How much the frozen game behind the pause menu is darkened
+
+# Mouse input
+MOTION_BUFFER_SIZE = 256  # Mouse motion samples kept between frames (1000 Hz mice send ~17 per frame)
+MIN_SAMPLE_INTERVAL = 0.001  # Shortest time between samples used for paddle velocity, seconds
+MAX_SAMPLE_INTERVAL = 1 / 60  # Longest; a move after the mouse was at rest counts as one 60 Hz frame
+SWEEP_CONTACT_GAP = 0.01  # Pixels a swept hit leaves between paddle and puck, so they no longer touch
+
+# Stress mode (python main.py --stress / python stress.py)
+STRESS_PUCKS = 300
+STRESS_POWER_UPS = 100
+STRESS_SECONDS = 30
+FRAME_BUDGET = 1 / 60  # Seconds available per frame at 60 FPS
+BATCH_DRAW_THRESHOLD = 8  # Draw pucks/power-ups through a sprite batch above this count
+
+# Match telemetry (python main.py --telemetry)
+TELEMETRY_BUFFER_SIZE = 16384  # Rows buffered between writes
+TELEMETRY_FLUSH_INTERVAL = 0.25  # Seconds between background writes
+TELEMETRY_SAMPLE_INTERVAL = 1.0  # Simulated seconds between puck/paddle samples
+
+# Allocation report (python main.py --alloc-report)
+ALLOC_WARMUP_FRAMES = 120  # Frames before measuring, while pools and text caches fill
+ALLOC_TOP_SITES = 10  # Source lines listed in the report
+
+# Stuck puck detection (see stuck.py)
+STUCK_WINDOW = 4.0  # Seconds of puck movement looked at
+STUCK_MAX_DISPLACEMENT = 40  # A puck that moved less than this over the window is stuck
+STUCK_DEAD_SPEED = 0.5  # Mean speed over the window below which a stuck puck is dead, not pinned
+STUCK_CORNER_SECONDS = 3.0  # Time in a corner region before the puck counts as pinned there
+STUCK_NUDGE_SPEED = 8  # Speed a pinned puck is sent towards the centre with
+STUCK_MAX_NUDGES = 2  # Nudges in a row before a still-pinned puck is faced off
+
+# Physics soak test (python soak.py)
+SOAK_SEEDS = 32
+SOAK_FRAMES = 100000  # Frames per seed (about 28 minutes of play)
+SOAK_REPLAY_FRAMES = 120  # Frames kept before a violation in saved replays
+SOAK_TOLERANCE = 0.01  # Pixels of float error allowed by the position checks
+
+# Audio dispatcher
+AUDIO_MAX_VOICES = 3  # Simultaneous voices per sound; requests within one frame share a voice
+IMPACT_MIN_VOLUME = 0.2  # Volume of the softest impact
+IMPACT_FULL_VOLUME_SPEED = 30  # Impact speed that plays at full volume
+
 # Rink constants
 CORNER_RADIUS = 70  # Radius of the rounded corners
 
@@ -50,4 +159,31 @@ SOUND_FILES = [
     "sounds/paddle_hit.wav",
     "sounds/wall_hit.wav",
     "sounds/power_up.wav"
-]
\ No newline at end of file
+]
+
+# Packed asset bundle built with `python assets.py build`; loose files are used when it is missing
+ASSET_BUNDLE = "assets.bundle"
+ASSET_DIRS = ["textures", "fonts"]  # Extra asset folders packed into the bundle when present
+
+# Parameters for synthesizing any sound file that is missing (see sound_synth.py)
+SOUND_SPECS = {
+    "sounds/vgmenuselect.wav": {
+        'waveform': 'square', 'frequency': 880.0, 'duration': 0.08,
+        'attack': 0.002, 'release': 0.03, 'volume': 0.4
+    },
+    "sounds/goal_sound.wav": {
+        'waveform': 'triangle', 'frequency': 440.0, 'end_frequency': 990.0, 'duration': 0.6,
+        'noise': 0.1, 'attack': 0.01, 'release': 0.2, 'volume': 0.8, 'seed': 1
+    },
+    "sounds/paddle_hit.wav": {
+        'waveform': 'sine', 'frequency': 180.0, 'duration': 0.1,
+        'noise': 0.35, 'decay': 0.025, 'volume': 0.9, 'seed': 2
+    },
+    "sounds/wall_hit.wav": {
+        'waveform': 'noise', 'duration': 0.06, 'decay': 0.012, 'volume': 0.7, 'seed': 3
+    },
+    "sounds/power_up.wav": {
+        'waveform': 'square', 'frequency': 300.0, 'end_frequency': 1200.0, 'duration': 0.3,
+        'attack': 0.01, 'release': 0.08, 'volume': 0.35
+    }
+}
@@ -0,0 +1,100 @@
+"""
+Physics event queue.
+
+The physics code (Puck, Paddle, PowerUp) never plays sounds or spawns
+particles itself. Instead it emits small typed events into an EventQueue,
+and the game hands the whole batch to its subscribers (audio, particles,
+stats, ...) once per frame. Headless and batch runs simply pass no queue.
+"""
+
+# Event types
+WALL_HIT = 0
+PADDLE_HIT = 1
+GOAL = 2
+POWERUP_COLLECTED = 3
+PUCK_HIT = 4  # Two pucks colliding in multi-puck play
+POWERUP_SPAWNED = 5
+FREEZE = 6  # A paddle froze its opponent
+PUCK_NUDGED = 7  # A pinned puck was pushed free (see stuck.py)
+PUCK_FACEOFF = 8  # A stuck or dead puck was faced off at centre
+
+EVENT_NAMES = {
+    WALL_HIT: "wall_hit",
+    PADDLE_HIT: "paddle_hit",
+    GOAL: "goal",
+    POWERUP_COLLECTED: "powerup_collected",
+    PUCK_HIT: "puck_hit",
+    POWERUP_SPAWNED: "powerup_spawned",
+    FREEZE: "freeze",
+    PUCK_NUDGED: "puck_nudged",
+    PUCK_FACEOFF: "puck_faceoff"
+}
+
+
+class GameEvent:
+    """A single event record. Records are reused every frame, so subscribers
+    must copy any field they want to keep instead of holding on to the event."""
+
+    def __init__(self):
+        self.type = -1
+        self.x = 0.0
+        self.y = 0.0
+        self.speed = 0.0  # Impact or shot speed, when it applies
+        self.source = None  # Paddle, puck or scorer name
+        self.color = None
+        self.detail = None  # Power-up type for power-up events
+
+
+class EventQueue:
+    def __init__(self, capacity=64):
+        # Preallocate every record up front so emitting never allocates
+        self.events = [GameEvent() for _ in range(capacity)]
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0  # Events lost because the queue was full this frame
+        self.subscribers = {event_type: [] for event_type in EVENT_NAMES}
+
+    def subscribe(self, event_type, handler):
+        """Register handler(event) to be called for every event of this type"""
+        self.subscribers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        """Remove a previously registered handler"""
+        handlers = self.subscribers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def emit(self, event_type, x=0.0, y=0.0, speed=0.0, source=None, color=None, detail=None):
+        """Queue an event for the next dispatch. Returns False if the queue is full."""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+
+        event = self.events[self.count]
+        event.type = event_type
+        event.x = x
+        event.y = y
+        event.speed = speed
+        event.source = source
+        event.color = color
+        event.detail = detail
+        self.count += 1
+        return True
+
+    def dispatch(self):
+        """Deliver all queued events to their subscribers, then empty the queue"""
+        for i in range(self.count):
+            event = self.events[i]
+            for handler in self.subscribers.get(event.type, ()):
+                handler(event)
+            # Drop references so paddles/pucks aren't kept alive by old events
+            event.source = None
+            event.color = None
+        self.count = 0
+
+    def clear(self):
+        """Discard queued events without dispatching them"""
+        for i in range(self.count):
+            self.events[i].source = None
+            self.events[i].color = None
+        self.count = 0
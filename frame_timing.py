@@ -0,0 +1,94 @@
+"""
+Per-frame timing for the stress mode and benchmarks.
+
+FrameTimer stores update and draw durations in preallocated arrays, so
+recording a frame never allocates, and summarises them as percentiles and
+the share of frames that missed the frame budget. When frames are also
+marked as presented, it reports the frame rate actually sustained.
+"""
+from array import array
+from constants import FRAME_BUDGET
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameTimer:
+    def __init__(self, capacity=36000, budget=FRAME_BUDGET):
+        self.capacity = capacity
+        self.budget = budget
+        self.update_times = array('d', bytes(8 * capacity))
+        self.draw_times = array('d', bytes(8 * capacity))
+        self.count = 0  # Frames recorded (frames beyond capacity are ignored)
+        self.pending_update = 0.0  # Update time waiting for its draw
+        # Wall-clock time between presented frames
+        self.intervals = array('d', bytes(8 * capacity))
+        self.interval_count = 0
+        self.last_present = None
+
+    def record_update(self, seconds):
+        self.pending_update += seconds
+
+    def record_draw(self, seconds):
+        """Close the current frame with its draw time"""
+        if self.count < self.capacity:
+            self.update_times[self.count] = self.pending_update
+            self.draw_times[self.count] = seconds
+            self.count += 1
+        self.pending_update = 0.0
+
+    def record_present(self, now):
+        """Note the wall-clock time (perf_counter) at which a frame was finished"""
+        if self.last_present is not None and self.interval_count < self.capacity:
+            self.intervals[self.interval_count] = now - self.last_present
+            self.interval_count += 1
+        self.last_present = now
+
+    def summary(self):
+        """Timing statistics in milliseconds over all recorded frames"""
+        count = self.count
+        updates = self.update_times[:count]
+        draws = self.draw_times[:count]
+        totals = sorted(u + d for u, d in zip(updates, draws))
+        result = {'frames': count}
+        for name, values in (('update', sorted(updates)), ('draw', sorted(draws)), ('frame', totals)):
+            result[name] = {
+                'mean_ms': 1000 * sum(values) / count if count else 0.0,
+                'p50_ms': 1000 * percentile(values, 0.50),
+                'p95_ms': 1000 * percentile(values, 0.95),
+                'p99_ms': 1000 * percentile(values, 0.99),
+                'max_ms': 1000 * (values[-1] if values else 0.0)
+            }
+        over = sum(1 for total in totals if total > self.budget)
+        result['over_budget_share'] = over / count if count else 0.0
+        mean_frame = sum(totals) / count if count else 0.0
+        result['max_fps'] = 1.0 / mean_frame if mean_frame else 0.0
+        
+        intervals = sorted(self.intervals[:self.interval_count])
+        elapsed = sum(intervals)
+        result['fps'] = len(intervals) / elapsed if elapsed else 0.0
+        worst = percentile(intervals, 0.99)
+        result['low_1_percent_fps'] = 1.0 / worst if worst else 0.0
+        return result
+
+    def report(self, title="Frame timing"):
+        """Human readable version of summary()"""
+        summary = self.summary()
+        lines = [f"{title} ({summary['frames']} frames, budget {self.budget * 1000:.1f} ms)"]
+        lines.append(f"  {'':<8}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+        for name in ('update', 'draw', 'frame'):
+            stats = summary[name]
+            lines.append(
+                f"  {name:<8}{stats['mean_ms']:>8.2f}{stats['p50_ms']:>8.2f}"
+                f"{stats['p95_ms']:>8.2f}{stats['p99_ms']:>8.2f}{stats['max_ms']:>8.2f}"
+            )
+        lines.append(f"  over budget: {summary['over_budget_share'] * 100:.1f}% of frames")
+        lines.append(f"  CPU-bound FPS: {summary['max_fps']:.0f}")
+        if self.interval_count:
+            lines.append(f"  sustained FPS: {summary['fps']:.1f} (1% low {summary['low_1_percent_fps']:.1f})")
+        return "\n".join(lines)
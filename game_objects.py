@@ -2,13 +2,23 @@ import math
 import random
 import arcade
 import utils
+from events import WALL_HIT, PADDLE_HIT, PUCK_HIT
+from physics import PHYSICS
 from constants import (
-    PADDLE_RADIUS, PUCK_RADIUS, FRICTION, WALL_BOUNCE_DAMPING,
-    SCREEN_WIDTH, SCREEN_HEIGHT, GOAL_WIDTH, GOAL_HEIGHT,
-    AI_SPEED, AI_AGGRESSION, AI_DEFENSE_POSITION, CORNER_RADIUS
+    PADDLE_RADIUS, PUCK_RADIUS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, GOAL_WIDTH,
+    CORNER_RADIUS, MIN_SAMPLE_INTERVAL,
+    MAX_SAMPLE_INTERVAL, SWEEP_CONTACT_GAP
 )
 
 class Puck:
+    # Every field is declared up front: no per-instance __dict__, and no
+    # attribute ever needs a hasattr check
+    __slots__ = (
+        'x', 'y', 'dx', 'dy', 'speed_boost', 'freeze_opponent',
+        'repulsor_active', 'repulsor_owner', 'repulsor_strength', 'opponent_paddle'
+    )
+
     def __init__(self):
         self.reset()
         self.opponent_paddle = None  # Reference to opponent paddle for freeze power-up
@@ -19,7 +29,6 @@ class Puck:
         self.y = SCREEN_HEIGHT // 2
         self.dx = random.uniform(-2, 2)
         self.dy = random.uniform(-2, 2)
-        self.trail = []  # Keep this for compatibility but won't use it
         self.speed_boost = False
         self.freeze_opponent = False
         
@@ -29,15 +38,20 @@ class Puck:
         self.repulsor_strength = 0.5  # Strength of the repulsion effect
 
     # Update the update method to handle the repulsor power-up
-    def update(self):
-        """Update puck position and apply friction"""
+    def update(self, step=1.0):
+        """Update puck position and apply friction.
+
+        Velocities are in pixels per 1/60 s; step is the tick length in those
+        units (0.5 when simulating at 120 Hz).
+        """
         # Calculate new position
-        new_x = self.x + self.dx
-        new_y = self.y + self.dy
+        new_x = self.x + self.dx * step
+        new_y = self.y + self.dy * step
         
         # Apply friction
-        self.dx *= FRICTION
-        self.dy *= FRICTION
+        friction = PHYSICS['friction'] if step == 1.0 else PHYSICS['friction'] ** step
+        self.dx *= friction
+        self.dy *= friction
         
         # Apply repulsor effect if active
         if self.repulsor_active and self.repulsor_owner:
@@ -51,16 +65,16 @@ class Puck:
             # Normalize and apply attraction
             attract_distance = math.sqrt(attract_dx**2 + attract_dy**2)
             if attract_distance > 0:
-                self.dx += (attract_dx / attract_distance) * self.repulsor_strength
-                self.dy += (attract_dy / attract_distance) * self.repulsor_strength
+                self.dx += (attract_dx / attract_distance) * self.repulsor_strength * step
+                self.dy += (attract_dy / attract_distance) * self.repulsor_strength * step
         
         # Apply maximum speed limit
-        MAX_SPEED = 75  # Maximum speed for puck (increased from 15 to 75)
+        max_speed = PHYSICS['max_speed']
         current_speed = math.sqrt(self.dx**2 + self.dy**2)
         
-        if current_speed > MAX_SPEED:
+        if current_speed > max_speed:
             # Scale down the velocity to the maximum speed
-            speed_factor = MAX_SPEED / current_speed
+            speed_factor = max_speed / current_speed
             self.dx *= speed_factor
             self.dy *= speed_factor
         
@@ -78,9 +92,21 @@ class Puck:
         # Trail is disabled
 
     # Add visualizations for the repulsor in the draw method
-    def draw(self):
+    def draw(self, show_arrow=True):
         """Draw the puck with power-up effects"""
-        # Draw repulsor effect if active
+        if show_arrow:
+            self.draw_repulsor_arrow()
+        
+        # Draw puck
+        arcade.draw_circle_filled(
+            self.x,
+            self.y,
+            PUCK_RADIUS,
+            arcade.color.GRAY
+        )
+    
+    def draw_repulsor_arrow(self):
+        """Draw the repulsor force arrow if the effect is active"""
         if self.repulsor_active and self.repulsor_owner:
             # Determine which goal to attract towards
             target_y = 0 if self.repulsor_owner.is_ai else SCREEN_HEIGHT
@@ -115,19 +141,10 @@ class Puck:
                 point3[0], point3[1],
                 arrow_color
             )
-        
-        # Draw puck
-        arcade.draw_circle_filled(
-            self.x,
-            self.y,
-            PUCK_RADIUS,
-            arcade.color.GRAY
-        )
                 
-    def handle_boundary_collision(self, sound=None):
-        """Handle collision with the rounded rink boundaries"""
+    def handle_boundary_collision(self, events=None):
+        """Handle collision with the rounded rink boundaries, emitting a WALL_HIT event on impact"""
         collision_happened = False
-        particles = []
         
         # Get goal boundaries for collision checking
         GOAL_LEFT = SCREEN_WIDTH // 2 - GOAL_WIDTH // 2
@@ -135,6 +152,8 @@ class Puck:
         
         # Store original position and velocity
         original_x, original_y = self.x, self.y
+        impact_speed = math.sqrt(self.dx**2 + self.dy**2)
+        bounce_damping = PHYSICS['wall_bounce_damping']
         
         # Check for corner collisions
         corner_positions = utils.get_rink_corner_positions()
@@ -166,8 +185,8 @@ class Puck:
                 
                 # Calculate reflection vector
                 dot_product = self.dx * normal_x + self.dy * normal_y
-                self.dx = (self.dx - 2 * dot_product * normal_x) * WALL_BOUNCE_DAMPING
-                self.dy = (self.dy - 2 * dot_product * normal_y) * WALL_BOUNCE_DAMPING
+                self.dx = (self.dx - 2 * dot_product * normal_x) * bounce_damping
+                self.dy = (self.dy - 2 * dot_product * normal_y) * bounce_damping
                 
                 collision_happened = True
         
@@ -176,34 +195,32 @@ class Puck:
             # Left boundary
             if self.x - PUCK_RADIUS < 0:
                 self.x = PUCK_RADIUS
-                self.dx *= -WALL_BOUNCE_DAMPING
+                self.dx *= -bounce_damping
                 collision_happened = True
                     
             # Right boundary
             elif self.x + PUCK_RADIUS > SCREEN_WIDTH:
                 self.x = SCREEN_WIDTH - PUCK_RADIUS
-                self.dx *= -WALL_BOUNCE_DAMPING
+                self.dx *= -bounce_damping
                 collision_happened = True
                     
             # Bottom boundary (check if not in goal)
             if self.y - PUCK_RADIUS < 0:
                 if not (GOAL_LEFT <= self.x <= GOAL_RIGHT):
                     self.y = PUCK_RADIUS
-                    self.dy *= -WALL_BOUNCE_DAMPING
+                    self.dy *= -bounce_damping
                     collision_happened = True
                         
             # Top boundary (check if not in goal)
             elif self.y + PUCK_RADIUS > SCREEN_HEIGHT:
                 if not (GOAL_LEFT <= self.x <= GOAL_RIGHT):
                     self.y = SCREEN_HEIGHT - PUCK_RADIUS
-                    self.dy *= -WALL_BOUNCE_DAMPING
+                    self.dy *= -bounce_damping
                     collision_happened = True
         
-        # Play sound and create particles if collision happened
-        if collision_happened:
-            if sound:
-                arcade.play_sound(sound)
-            particles = utils.spawn_particles(self.x, self.y, arcade.color.WHITE, 5)
+        # Let the audio/particle subscribers know about the impact
+        if collision_happened and events is not None:
+            events.emit(WALL_HIT, self.x, self.y, impact_speed, self, arcade.color.WHITE)
             
         # Add minimum speed threshold to prevent extremely slow movement
         total_speed = math.sqrt(self.dx**2 + self.dy**2)
@@ -211,28 +228,24 @@ class Puck:
             self.dx = 0
             self.dy = 0
             
-        return collision_happened, particles
+        return collision_happened
     
     def is_in_goal(self):
         """Check if puck is in either goal, accounting for shrunk goals"""
         # Get references to the paddles (if available)
-        player_paddle = None
-        ai_paddle = None
-        
-        if hasattr(self, 'opponent_paddle') and self.opponent_paddle:
-            player_paddle = self.opponent_paddle.opponent_paddle  # This is the human player's paddle
-            ai_paddle = self.opponent_paddle  # This is the AI paddle
+        ai_paddle = self.opponent_paddle  # This is the AI paddle
+        player_paddle = ai_paddle.opponent_paddle if ai_paddle is not None else None  # The human player's
         
         # Adjust goal width if goal shrink is active on the respective paddle
         player_goal_width = GOAL_WIDTH
         ai_goal_width = GOAL_WIDTH
         
         # Check if player has goal shrink active (affects player's goal)
-        if player_paddle and hasattr(player_paddle, 'goal_shrink_active') and player_paddle.goal_shrink_active:
+        if player_paddle is not None and player_paddle.goal_shrink_active:
             player_goal_width = GOAL_WIDTH * 0.5
         
         # Check if AI has goal shrink active (affects AI's goal)
-        if ai_paddle and hasattr(ai_paddle, 'goal_shrink_active') and ai_paddle.goal_shrink_active:
+        if ai_paddle is not None and ai_paddle.goal_shrink_active:
             ai_goal_width = GOAL_WIDTH * 0.5
         
         # Calculate actual goal boundaries
@@ -250,37 +263,111 @@ class Puck:
             AI_GOAL_LEFT <= self.x <= AI_GOAL_RIGHT):
             return "PLAYER"  # Player scored
         return None  # No goal
-        
-        # Calculate actual goal boundaries
-        PLAYER_GOAL_LEFT = SCREEN_WIDTH // 2 - player_goal_width // 2
-        PLAYER_GOAL_RIGHT = SCREEN_WIDTH // 2 + player_goal_width // 2
-        
-        AI_GOAL_LEFT = SCREEN_WIDTH // 2 - ai_goal_width // 2
-        AI_GOAL_RIGHT = SCREEN_WIDTH // 2 + ai_goal_width // 2
-        
-        # Check if puck is completely past the goal line
-        if (self.y + PUCK_RADIUS <= 0 and 
-            PLAYER_GOAL_LEFT <= self.x <= PLAYER_GOAL_RIGHT):
-            return "AI"  # AI scored
-        elif (self.y - PUCK_RADIUS >= SCREEN_HEIGHT and 
-            AI_GOAL_LEFT <= self.x <= AI_GOAL_RIGHT):
-            return "PLAYER"  # Player scored
-        return None  # No goal
 
-    def check_stuck(self, delta_time, last_pos, stuck_timer):
-        """Check if puck is stuck and apply escape velocity if needed"""
-        # We're disabling automatic escape velocity to prevent random movement
-        current_pos = (self.x, self.y)
-        return current_pos, 0, False
-    
-    def check_for_stuck_in_corner(self):
-        """Explicitly check and fix if puck is stuck in corners"""
-        # We're disabling this function as it can cause unexpected movement
-        return False, []
+    def collide_with_puck(self, other, events=None):
+        """Elastic collision with another (equal mass) puck, emitting a PUCK_HIT event"""
+        dx = other.x - self.x
+        dy = other.y - self.y
+        min_distance = PUCK_RADIUS * 2
+        distance_squared = dx * dx + dy * dy
+        if distance_squared >= min_distance * min_distance:
+            return False
+        
+        distance = math.sqrt(distance_squared)
+        if distance > 0:
+            normal_x = dx / distance
+            normal_y = dy / distance
+        else:
+            normal_x, normal_y = 1.0, 0.0  # Exactly on top of each other - pick a direction
+        
+        # Push both pucks apart by half the overlap each
+        overlap = (min_distance - distance) / 2
+        self.x -= normal_x * overlap
+        self.y -= normal_y * overlap
+        other.x += normal_x * overlap
+        other.y += normal_y * overlap
+        
+        # Equal masses: swap the velocity components along the normal
+        closing_speed = (self.dx - other.dx) * normal_x + (self.dy - other.dy) * normal_y
+        if closing_speed > 0:
+            self.dx -= closing_speed * normal_x
+            self.dy -= closing_speed * normal_y
+            other.dx += closing_speed * normal_x
+            other.dy += closing_speed * normal_y
+            
+            if events is not None:
+                events.emit(
+                    PUCK_HIT, (self.x + other.x) / 2, (self.y + other.y) / 2,
+                    closing_speed, self, arcade.color.WHITE
+                )
+        return True
+
+def resolve_puck_collisions(pucks, grid, events=None):
+    """Resolve puck-to-puck collisions using a spatial hash for the broad phase"""
+    if len(pucks) < 2:
+        return
+    grid.build(pucks)
+    for puck, other in grid.pairs():
+        puck.collide_with_puck(other, events)
+
+def most_threatening_puck(pucks, defending_top=True):
+    """Pick the puck an AI defending the given end should play"""
+    best = pucks[0]
+    best_threat = None
+    for puck in pucks:
+        # Distance to the defended goal line, shortened for pucks heading towards it
+        if defending_top:
+            distance = SCREEN_HEIGHT - puck.y
+            approach = puck.dy
+        else:
+            distance = puck.y
+            approach = -puck.dy
+        threat = distance - max(0.0, approach) * 30
+        if best_threat is None or threat < best_threat:
+            best = puck
+            best_threat = threat
+    return best
+
+def segment_circle_toi(start_x, start_y, end_x, end_y, center_x, center_y, radius):
+    """Fraction (0-1) along the segment where it first enters the circle, or None.
+
+    Segments that start inside the circle return None; overlaps are left to
+    the regular collision check.
+    """
+    dir_x = end_x - start_x
+    dir_y = end_y - start_y
+    rel_x = start_x - center_x
+    rel_y = start_y - center_y
+    c = rel_x * rel_x + rel_y * rel_y - radius * radius
+    if c <= 0:
+        return None
+    a = dir_x * dir_x + dir_y * dir_y
+    if a == 0:
+        return None
+    b = rel_x * dir_x + rel_y * dir_y
+    if b >= 0:
+        return None  # Moving away from the circle
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+    toi = (-b - math.sqrt(discriminant)) / a
+    return toi if toi <= 1.0 else None
 
-# Complete Paddle class with fixed update_player method
 
+# The parts of a paddle that hit pucks, as (x offset, radius) in paddle radii:
+# the paddle itself, plus two smaller side paddles while multi-puck is active
+PADDLE_PARTS = ((0.0, 1.0),)
+MULTI_PUCK_PADDLE_PARTS = ((0.0, 1.0), (-1.8, 0.8), (1.8, 0.8))
+
+
+# Complete Paddle class
 class Paddle:
+    __slots__ = (
+        'is_ai', 'x', 'y', 'dx', 'dy', 'radius', 'target_x', 'target_y', 'power_up_active',
+        'active_effects', 'can_cross_midline', 'is_frozen', 'path_time', 'opponent_paddle',
+        'multi_puck_active', 'goal_shrink_active', 'swept'
+    )
+
     def __init__(self, is_ai=False):
         self.is_ai = is_ai
         self.x = SCREEN_WIDTH // 2
@@ -290,181 +377,113 @@ class Paddle:
         self.radius = PADDLE_RADIUS
         self.target_x = SCREEN_WIDTH // 2
         self.target_y = self.y
-        self.power_up_active = False
-        self.power_up_time = 0
+        self.power_up_active = False  # Any power-up effect running (kept by EffectScheduler)
+        self.active_effects = 0  # Number of running power-up effects
         self.can_cross_midline = False  # For speed power-up
         self.is_frozen = False  # For freeze power-up
-        self.freeze_timer = 0   # Timer for freeze duration
+        self.path_time = 0.0  # Simulation time of the last mouse sample (player paddle)
+        self.swept = []  # Pucks hit by the last sweep_player call
         self.opponent_paddle = None  # Reference to opponent paddle
-        self.multi_puck_active = False  # For multi-puck power-up
 
 
         # New properties for additional power-ups
         self.multi_puck_active = False  # For multi-puck power-up
         self.goal_shrink_active = False  # For goal shrink power-up
-        self.goal_shrink_timer = 0  # Timer for goal shrink duration
-    
-    def on_update(self, delta_time):
-        """Update paddle's status effects"""
-        # Handle freeze timer
-        if self.is_frozen:
-            self.freeze_timer -= delta_time
-            if self.freeze_timer <= 0:
-                self.is_frozen = False
-                self.freeze_timer = 0
-        
-        # Handle goal shrink timer
-        if self.goal_shrink_active:
-            self.goal_shrink_timer -= delta_time
-            if self.goal_shrink_timer <= 0:
-                self.goal_shrink_active = False
-                self.goal_shrink_timer = 0
     
-    def update_player(self, mouse_x, mouse_y):
-        """Update player paddle based on mouse position"""
-        # Calculate movement deltas
-        self.dx = mouse_x - self.x
-        self.dy = mouse_y - self.y
-        
-        # Skip movement if frozen
-        if self.is_frozen:
-            return
-            
-        # Update paddle position with constraint
-        if self.can_cross_midline:
-            # Can go anywhere in rink
-            self.x, self.y = utils.constrain_to_rink(mouse_x, mouse_y, self.radius)
-        else:
-            # Constrained to bottom half
-            self.x, self.y = utils.constrain_to_rink(mouse_x, mouse_y, self.radius, 'bottom')
-    
-    def update_ai(self, puck, ai_difficulty):
-        """Update AI paddle movement"""
-        # If AI is frozen by power-up, don't move
-        if self.is_frozen:
-            return []
-            
-        # Default defensive position
-        target_x = SCREEN_WIDTH // 2
-        target_y = SCREEN_HEIGHT * AI_DEFENSE_POSITION
-        
-        # Enhanced corner handling
-        corner_index = utils.is_point_in_corner_region(puck.x, puck.y)
-        is_in_corner = corner_index >= 0 and puck.y > SCREEN_HEIGHT / 2
-        
-        if is_in_corner:
-            # For corner situations, move more directly toward the puck
-            corner_angle = math.atan2(puck.y - self.y, puck.x - self.x)
-            
-            # Calculate a position slightly offset from the puck to hit it toward center
-            offset_distance = self.radius + PUCK_RADIUS + 5
-            
-            if puck.x < SCREEN_WIDTH // 2:
-                # Left corner - approach from right
-                target_x = puck.x + offset_distance * 0.5
-            else:
-                # Right corner - approach from left
-                target_x = puck.x - offset_distance * 0.5
-                
-            target_y = puck.y - 5  # Slightly above the puck
-            
-            # Increase AI speed for corner retrieval
-            ai_speed = AI_SPEED * 1.5
-            
-            # Move directly toward the calculated position
-            dx = target_x - self.x
-            dy = target_y - self.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance > 0:
-                self.dx = (dx / distance) * ai_speed
-                self.dy = (dy / distance) * ai_speed
-                
-                # Update position with constraint
-                new_x = self.x + self.dx
-                new_y = self.y + self.dy
-                
-                # Check if we can cross midline
-                if self.can_cross_midline:
-                    # Constrain to full rink
-                    self.x, self.y = utils.constrain_to_rink(new_x, new_y, self.radius)
-                else:
-                    # Constrain to top half
-                    self.x, self.y = utils.constrain_to_rink(new_x, new_y, self.radius, 'top')
-                
-            # Skip the rest of the AI logic if in corner mode
-            return []
-        
-        # Predict where puck will intersect AI's y-position
-        if puck.dy > 0:  # Puck moving upward
-            time_to_intersect = (target_y - puck.y) / puck.dy if puck.dy != 0 else 0
-            predicted_x = puck.x + puck.dx * time_to_intersect
+    def sweep_player(self, path, pucks, events=None, paddle_color=arcade.color.WHITE):
+        """Move the player paddle along path, this tick's (time, x, y) mouse samples.
 
-            # Keep prediction within bounds
-            predicted_x = max(self.radius, 
-                            min(SCREEN_WIDTH - self.radius, predicted_x))
+        Each segment between samples is swept against every puck, so a fast
+        swipe hits the puck at its time of impact instead of jumping past it,
+        and the hit uses that segment's velocity rather than the whole jump.
+        Times are simulation seconds; velocities come out in pixels per 1/60 s.
+        Each puck is hit at most once per call; the pucks hit are returned
+        (and kept in self.swept) so the regular collision check can skip them.
+        """
+        self.swept.clear()
+        if not path or self.is_frozen:
+            # Frozen paddles ignore the mouse; either way the paddle is at rest
+            self.dx = 0
+            self.dy = 0
+            if path:
+                self.path_time = path[-1][0]
+            return self.swept
 
-            # Move towards predicted position
-            if abs(puck.dy) > 1:  # Only if puck moving with significant speed
-                target_x = predicted_x
+        half = None if self.can_cross_midline else 'bottom'
+        parts = MULTI_PUCK_PADDLE_PARTS if self.multi_puck_active else PADDLE_PARTS
+        for sample_time, mouse_x, mouse_y in path:
+            if half:
+                end_x, end_y = utils.constrain_to_rink(mouse_x, mouse_y, self.radius, half)
+            else:
+                end_x, end_y = utils.constrain_to_rink(mouse_x, mouse_y, self.radius)
+            
+            # Local path velocity over this segment
+            duration = min(max(sample_time - self.path_time, MIN_SAMPLE_INTERVAL), MAX_SAMPLE_INTERVAL)
+            self.dx = (end_x - self.x) / (duration * 60)
+            self.dy = (end_y - self.y) / (duration * 60)
+            self.path_time = sample_time
+            
+            # Earliest puck any part of the paddle runs into
+            first_hit = None
+            first_toi = 2.0
+            hit_offset = 0.0
+            hit_reach = 0.0
+            for offset, scale in parts:
+                offset *= self.radius
+                reach = self.radius * scale + PUCK_RADIUS
+                for puck in pucks:
+                    toi = segment_circle_toi(
+                        self.x + offset, self.y, end_x + offset, end_y, puck.x, puck.y, reach
+                    )
+                    if toi is not None and toi < first_toi:
+                        first_toi = toi
+                        first_hit = puck
+                        hit_offset = offset
+                        hit_reach = reach
 
-        # If puck is in AI's half, move to intercept
-        if puck.y > SCREEN_HEIGHT // 2 or self.can_cross_midline:  # Allow crossing midline with power-up
-            dx = puck.x - self.x
-            dy = puck.y - self.y
-            distance = math.sqrt(dx**2 + dy**2)
+            if first_hit is not None:
+                # Stop at the contact point and hit the puck, unless an earlier
+                # segment already did and the paddle is only carrying it on
+                self.x += (end_x - self.x) * first_toi
+                self.y += (end_y - self.y) * first_toi
+                if first_hit not in self.swept:
+                    self.swept.append(first_hit)
+                    self.hit_puck(
+                        first_hit, first_hit.x - (self.x + hit_offset), first_hit.y - self.y,
+                        hit_reach, hit_reach + SWEEP_CONTACT_GAP, events, paddle_color
+                    )
+                # The puck is pushed along for the rest of the segment so the
+                # paddle doesn't finish its move on the far side of it - but
+                # not through the boards, which have already been checked this tick
+                first_hit.x += end_x - self.x
+                first_hit.y += end_y - self.y
+                first_hit.handle_boundary_collision(events)
 
-            if distance > 0:
-                target_x = puck.x
-                target_y = puck.y - self.radius
-                
-                # Adjust aggression based on puck position
-                if puck.y > SCREEN_HEIGHT * 0.75:
-                    # More aggressive when puck is close to AI's goal
-                    target_x = puck.x + puck.dx * AI_AGGRESSION
-                    target_y = puck.y + puck.dy * AI_AGGRESSION
+            self.x = end_x
+            self.y = end_y
+        return self.swept
+    
+    def move_towards(self, target_x, target_y, speed, step=1.0):
+        """Head for a target at speed (pixels per 1/60 s), as the AI paddle does.
 
-        # Move AI paddle towards target
+        Stays on the top half unless the paddle may cross the midline.
+        """
+        self.target_x = target_x
+        self.target_y = target_y
         dx = target_x - self.x
         dy = target_y - self.y
         distance = math.sqrt(dx**2 + dy**2)
-
         if distance > 0:
-            # Apply speed boost if power-up is active
-            speed_multiplier = 1.5 if (self.power_up_active and puck.speed_boost) else 1.0
-            
-            # Adjust base speed by difficulty
-            base_speed = AI_SPEED
-            if ai_difficulty == 0:  # Easy
-                base_speed = 5
-            elif ai_difficulty == 2:  # Hard
-                base_speed = 10
-            
-            speed = base_speed * speed_multiplier
-            
-            # Normalize movement vector
-            move_x = (dx / distance) * speed
-            move_y = (dy / distance) * speed
-            
-            # Update position
-            new_x = self.x + move_x
-            new_y = self.y + move_y
-            
-            # Check if we can cross midline
+            self.dx = (dx / distance) * speed
+            self.dy = (dy / distance) * speed
+            new_x = self.x + self.dx * step
+            new_y = self.y + self.dy * step
             if self.can_cross_midline:
-                # Constrain to full rink
-                self.x, self.y = utils.constrain_to_rink(new_x, new_y, self.radius)
+                utils.move_within_rink(self, new_x, new_y, self.radius)
             else:
-                # Constrain to top half
-                self.x, self.y = utils.constrain_to_rink(new_x, new_y, self.radius, 'top')
-            
-            # Update velocity for collision physics
-            self.dx = move_x
-            self.dy = move_y
-        
-        return []
+                utils.move_within_rink(self, new_x, new_y, self.radius, 'top')
     
-    def draw(self, color, power_up_active=False):
+    def draw(self, color, power_up_active=False, glow_rings=3, show_icons=True):
         """Draw the paddle with optional power-up effects"""
         # Draw multi-puck effect (3 side-by-side paddles)
         if self.multi_puck_active:
@@ -490,7 +509,7 @@ class Paddle:
         # Add glow effect if power-up is active
         if power_up_active:
             # Draw glow
-            for i in range(3):
+            for i in range(glow_rings):
                 size_multiplier = 1.1 + (i * 0.1)
                 alpha = 100 - (i * 30)
                 glow_color = (color[0], color[1], color[2], alpha)
@@ -510,42 +529,7 @@ class Paddle:
         )
         
         # Draw freeze visual indicator if frozen
-        if self.is_frozen:
-            # Draw freeze indicator (snowflake symbol)
-            arcade.draw_text(
-                "❄",
-                self.x,
-                self.y,
-                arcade.color.CYAN,
-                20,
-                anchor_x="center",
-                anchor_y="center"
-            )
-        
-        # Add glow effect if power-up is active
-        if power_up_active:
-            # Draw glow
-            for i in range(3):
-                size_multiplier = 1.1 + (i * 0.1)
-                alpha = 100 - (i * 30)
-                glow_color = (color[0], color[1], color[2], alpha)
-                arcade.draw_circle_filled(
-                    self.x,
-                    self.y,
-                    self.radius * size_multiplier,
-                    glow_color
-                )
-        
-        # Draw the paddle
-        arcade.draw_circle_filled(
-            self.x,
-            self.y,
-            self.radius,
-            color
-        )
-        
-        # Draw freeze visual indicator if frozen
-        if self.is_frozen:
+        if self.is_frozen and show_icons:
             # Draw freeze indicator (snowflake symbol)
             arcade.draw_text(
                 "❄",
@@ -557,78 +541,79 @@ class Paddle:
                 anchor_y="center"
             )
     
-    def check_collision_with_puck(self, puck, sound=None, paddle_color=arcade.color.WHITE):
-        """Check and handle collision with puck"""
-        # Normal collision detection for the main paddle
-        dx = puck.x - self.x
-        dy = puck.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-        collision_happened = False
-        particles = []
-        
-        # Check main paddle collision
-        if distance <= self.radius + PUCK_RADIUS:
-            collision_happened = True
-        
-        # Check side paddles if multi-puck is active
-        if self.multi_puck_active and not collision_happened:
-            # Left paddle
-            dx_left = puck.x - (self.x - self.radius * 1.8)
-            dy_left = puck.y - self.y
-            distance_left = math.sqrt(dx_left**2 + dy_left**2)
-            
-            # Right paddle
-            dx_right = puck.x - (self.x + self.radius * 1.8)
-            dy_right = puck.y - self.y
-            distance_right = math.sqrt(dx_right**2 + dy_right**2)
-            
-            # Check if puck collides with either side paddle
-            if distance_left <= self.radius * 0.8 + PUCK_RADIUS:
-                collision_happened = True
-                # Update collision vector to use the left paddle's position
-                dx = dx_left
-                dy = dy_left
-                distance = distance_left
-            elif distance_right <= self.radius * 0.8 + PUCK_RADIUS:
-                collision_happened = True
-                # Update collision vector to use the right paddle's position
-                dx = dx_right
-                dy = dy_right
-                distance = distance_right
-        
-        if collision_happened:
-            # Calculate collision angle and normalize the direction
-            angle = math.atan2(dy, dx)
-            
-            # Move puck outside of paddle to prevent sticking
-            overlap = (self.radius if not self.multi_puck_active else self.radius * 0.8) + PUCK_RADIUS - distance
-            puck.x += math.cos(angle) * overlap
-            puck.y += math.sin(angle) * overlap
-            
-            # Calculate new velocity
-            speed = math.sqrt(puck.dx**2 + puck.dy**2)
-            speed = max(speed, 5)  # Minimum speed after collision
-            
-            # Combine paddle and puck momentum
-            momentum_factor = 0.5
-            
-            # Apply power-up effects to collision
-            if self.power_up_active and puck.speed_boost:
-                speed *= 1.5  # Boost speed
-                momentum_factor = 0.8  # More paddle momentum transfer
-            
-            puck.dx = (math.cos(angle) * speed * 1.2 + self.dx * momentum_factor)
-            puck.dy = (math.sin(angle) * speed * 1.2 + self.dy * momentum_factor)
-            
-            # Play sound effect
-            if sound:
-                arcade.play_sound(sound)
+    def check_collision_with_puck(self, puck, events=None, paddle_color=arcade.color.WHITE):
+        """Check and handle collision with puck, emitting a PADDLE_HIT event on impact"""
+        # The main paddle first, then the side paddles if multi-puck is active
+        for offset, scale in (MULTI_PUCK_PADDLE_PARTS if self.multi_puck_active else PADDLE_PARTS):
+            dx = puck.x - (self.x + offset * self.radius)
+            dy = puck.y - self.y
+            distance = math.sqrt(dx**2 + dy**2)
+            reach = self.radius * scale + PUCK_RADIUS
+            if distance <= reach:
+                self.hit_puck(puck, dx, dy, distance, reach, events, paddle_color)
+                return True
             
-            # Spawn particles at collision point with paddle color
+        return False
+
+    def hit_puck(self, puck, dx, dy, distance, reach, events=None, paddle_color=arcade.color.WHITE):
+        """Bounce puck off the paddle; (dx, dy) points from the paddle center to the puck"""
+        # Calculate collision angle and normalize the direction
+        angle = math.atan2(dy, dx)
+        
+        # Move puck outside of paddle to prevent sticking
+        overlap = reach - distance
+        puck.x += math.cos(angle) * overlap
+        puck.y += math.sin(angle) * overlap
+        
+        # Calculate new velocity
+        speed = math.sqrt(puck.dx**2 + puck.dy**2)
+        speed = max(speed, 5)  # Minimum speed after collision
+        
+        # Combine paddle and puck momentum
+        momentum_factor = PHYSICS['momentum_factor']
+        
+        # Apply power-up effects to collision
+        if self.power_up_active and puck.speed_boost:
+            speed *= 1.5  # Boost speed
+            momentum_factor = 0.8  # More paddle momentum transfer
+        
+        restitution = PHYSICS['restitution']
+        puck.dx = (math.cos(angle) * speed * restitution + self.dx * momentum_factor)
+        puck.dy = (math.sin(angle) * speed * restitution + self.dy * momentum_factor)
+        
+        # Report the hit at the contact point with the paddle color
+        if events is not None:
             collision_x = puck.x - math.cos(angle) * PUCK_RADIUS
             collision_y = puck.y - math.sin(angle) * PUCK_RADIUS
-            particles = utils.spawn_particles(collision_x, collision_y, paddle_color, 10)
-            
-            return True, particles
-            
-        return False, particles
\ No newline at end of file
+            events.emit(
+                PADDLE_HIT, collision_x, collision_y,
+                math.sqrt(puck.dx**2 + puck.dy**2), self, paddle_color
+            )
+
+class MirroredPuck:
+    """The puck as seen from the other end of the rink (y flipped)"""
+    __slots__ = ('x', 'y', 'dx', 'dy', 'speed_boost')
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.dx = 0.0
+        self.dy = 0.0
+        self.speed_boost = False
+
+    def sync(self, puck):
+        self.x = puck.x
+        self.y = SCREEN_HEIGHT - puck.y
+        self.dx = puck.dx
+        self.dy = -puck.dy
+        self.speed_boost = puck.speed_boost
+
+
+def update_mirrored_ai(paddle, puck, strategy, mirror, step=1.0):
+    """Drive a bottom-half paddle with a top-half AI strategy by flipping the rink around it"""
+    mirror.sync(puck)
+    paddle.y = SCREEN_HEIGHT - paddle.y
+    paddle.dy = -paddle.dy
+    strategy.update(paddle, mirror, step)
+    paddle.y = SCREEN_HEIGHT - paddle.y
+    paddle.dy = -paddle.dy
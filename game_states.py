@@ -1,6 +1,6 @@
 import arcade
 from constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, PADDLE_COLORS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, PADDLE_COLORS, PUCK_COUNT_OPTIONS, SPECTATOR_SPEEDS,
     MENU_STATE, SETTINGS_STATE, PAUSE_STATE, GAME_OVER_STATE, HOW_TO_PLAY_STATE
 )
 
@@ -18,6 +18,9 @@ class MenuManager:
                 "Time Limit",
                 "Power-ups",
                 "Power-up Frequency",
+                "Pucks",
+                "Bottom Paddle",
+                "Spectator Speed",
                 "Back"
             ],
             PAUSE_STATE: ["Resume", "Restart", "Main Menu"],
@@ -138,6 +141,14 @@ class MenuManager:
                 elif item == "Power-up Frequency":
                     frequency_names = ["Low", "Medium", "High"]
                     display_item += f": {frequency_names[settings['power_up_frequency']]}"
+                elif item == "Pucks":
+                    display_item += f": {settings['puck_count']}"
+                elif item == "Bottom Paddle":
+                    difficulty = settings['bottom_ai_difficulty']
+                    difficulty_names = ["AI Easy", "AI Medium", "AI Hard"]
+                    display_item += f": {'Player' if difficulty is None else difficulty_names[difficulty]}"
+                elif item == "Spectator Speed":
+                    display_item += f": {settings['speed_multiplier']}x"
 
             # Draw text for non-color settings or if it hasn't been drawn yet
             if item not in ["AI Color", "Player Color"] or current_state != SETTINGS_STATE:
@@ -342,7 +353,22 @@ class MenuManager:
                 settings['power_ups_enabled'] = not settings['power_ups_enabled']
             elif item_index == 7:  # Power-up Frequency
                 settings['power_up_frequency'] = (settings['power_up_frequency'] + 1) % 3
-            elif item_index == 8:  # Back to main menu
+            elif item_index == 8:  # Puck count
+                current_index = PUCK_COUNT_OPTIONS.index(settings['puck_count']) if settings['puck_count'] in PUCK_COUNT_OPTIONS else 0
+                settings['puck_count'] = PUCK_COUNT_OPTIONS[(current_index + 1) % len(PUCK_COUNT_OPTIONS)]
+            elif item_index == 9:  # Bottom paddle: the player, or an AI for AI-vs-AI
+                # Player -> AI Easy -> AI Medium -> AI Hard -> Player
+                difficulty = settings['bottom_ai_difficulty']
+                if difficulty is None:
+                    settings['bottom_ai_difficulty'] = 0
+                elif difficulty < 2:
+                    settings['bottom_ai_difficulty'] = difficulty + 1
+                else:
+                    settings['bottom_ai_difficulty'] = None
+            elif item_index == 10:  # Spectator speed
+                current_index = SPECTATOR_SPEEDS.index(settings['speed_multiplier']) if settings['speed_multiplier'] in SPECTATOR_SPEEDS else 0
+                settings['speed_multiplier'] = SPECTATOR_SPEEDS[(current_index + 1) % len(SPECTATOR_SPEEDS)]
+            elif item_index == 11:  # Back to main menu
                 return MENU_STATE
                 
         elif current_state == PAUSE_STATE:
@@ -0,0 +1,120 @@
+"""
+Input-to-photon latency measurement.
+
+LatencyProbe follows every mouse motion event through the frame loop: when
+it arrives (on_mouse_motion), when the paddle update that consumes it runs
+(on_update), when the frame showing it has been drawn (on_draw) and when
+that frame is presented (after the buffer flip, which waits for vsync when
+it is on). SyntheticMouse injects motion events on the pyglet clock at a
+fixed rate, so runs can be automated and compared:
+
+    python main.py --latency 10 --inject-rate 1000
+"""
+import math
+from array import array
+import pyglet
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from frame_timing import percentile
+
+STAGES = ('applied', 'drawn', 'presented')
+
+
+class LatencyProbe:
+    def __init__(self, capacity=200000):
+        self.capacity = capacity
+        # Arrival times of events the game hasn't consumed yet, and of events
+        # consumed in the last update and waiting for their frame
+        self.waiting = []
+        self.applied = []
+        self.drawn = []
+        self.latencies = {stage: array('d') for stage in STAGES}
+
+    def on_arrival(self, now):
+        self.waiting.append(now)
+
+    def _record(self, stage, arrivals, now):
+        samples = self.latencies[stage]
+        for arrival in arrivals:
+            if len(samples) < self.capacity:
+                samples.append(now - arrival)
+
+    def on_applied(self, now):
+        """The events received so far have moved the paddle"""
+        if self.waiting:
+            self._record('applied', self.waiting, now)
+            self.applied.extend(self.waiting)
+            self.waiting.clear()
+
+    def on_drawn(self, now):
+        """A frame including every applied event has been drawn"""
+        if self.applied:
+            self._record('drawn', self.applied, now)
+            self.drawn.extend(self.applied)
+            self.applied.clear()
+
+    def on_presented(self, now):
+        """That frame has been handed to the display"""
+        if self.drawn:
+            self._record('presented', self.drawn, now)
+            self.drawn.clear()
+
+    def summary(self):
+        """Latency distribution per stage in milliseconds"""
+        result = {}
+        for stage in STAGES:
+            values = sorted(self.latencies[stage])
+            result[stage] = {
+                'events': len(values),
+                'mean_ms': 1000 * sum(values) / len(values) if values else 0.0,
+                'p50_ms': 1000 * percentile(values, 0.50),
+                'p95_ms': 1000 * percentile(values, 0.95),
+                'p99_ms': 1000 * percentile(values, 0.99),
+                'max_ms': 1000 * (values[-1] if values else 0.0)
+            }
+        return result
+
+    def report(self, title="Input latency"):
+        summary = self.summary()
+        lines = [f"{title} (mouse event to ...)"]
+        lines.append(f"  {'':<10}{'events':>8}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+        for stage in STAGES:
+            stats = summary[stage]
+            lines.append(
+                f"  {stage:<10}{stats['events']:>8}{stats['mean_ms']:>8.2f}{stats['p50_ms']:>8.2f}"
+                f"{stats['p95_ms']:>8.2f}{stats['p99_ms']:>8.2f}{stats['max_ms']:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+class SyntheticMouse:
+    """Feeds the window a figure-eight of mouse motion events over the player's half"""
+
+    def __init__(self, window, rate=1000, period=2.0):
+        self.window = window
+        self.interval = 1 / rate
+        self.period = period  # Seconds per figure-eight
+        self.time = 0.0
+        self.last = None
+
+    def start(self):
+        pyglet.clock.schedule_interval(self.inject, self.interval)
+
+    def stop(self):
+        pyglet.clock.unschedule(self.inject)
+
+    def position(self, t):
+        """Rink position of the pointer at time t"""
+        phase = 2 * math.pi * t / self.period
+        x = SCREEN_WIDTH / 2 + SCREEN_WIDTH * 0.3 * math.sin(phase)
+        y = SCREEN_HEIGHT * 0.25 + SCREEN_HEIGHT * 0.12 * math.sin(2 * phase)
+        return x, y
+
+    def inject(self, delta_time):
+        """Send one motion event (scheduled on the pyglet clock)"""
+        self.time += delta_time
+        x, y = self.window.renderer.from_rink(*self.position(self.time))
+        x = int(x)
+        y = int(y)
+        dx, dy = (x - self.last[0], y - self.last[1]) if self.last else (0, 0)
+        self.last = (x, y)
+        self.window.dispatch_event('on_mouse_motion', x, y, dx, dy)
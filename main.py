@@ -1,32 +1,118 @@
+import time
+_start_time = time.perf_counter()  # Taken before the heavy imports for the start-up report
+
 import os
 import math
 import random
+import argparse
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 import arcade
 
 # Import game modules
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, GOAL_WIDTH, GOAL_HEIGHT,
     MENU_STATE, GAME_STATE, SETTINGS_STATE, GAME_OVER_STATE, PAUSE_STATE, HOW_TO_PLAY_STATE,
-    PADDLE_COLORS, PADDLE_RADIUS, PUCK_RADIUS, CORNER_RADIUS
+    PADDLE_COLORS, PADDLE_RADIUS, PUCK_RADIUS, CORNER_RADIUS,
+    WALL_HIT_PARTICLES, PADDLE_HIT_PARTICLES, GOAL_PARTICLES, EVENT_QUEUE_CAPACITY,
+    POWER_UP_RADIUS, BATCH_DRAW_THRESHOLD, QUALITY_LEVELS, TICK_RATE, DRAW_RATE, UNCAPPED_RATE,
+    MAX_TICKS_PER_FRAME, INTERPOLATION_SNAP_DISTANCE, BENCHMARK_SECONDS, STRESS_PUCKS, STRESS_POWER_UPS, STRESS_SECONDS,
+    IDLE_RATE, BACKGROUND_RATE, PAUSE_DIM_ALPHA, AI_STRATEGY
 )
 import utils
-from game_objects import Puck, Paddle
-from power_ups import PowerUp
+import assets
+import physics
+import simulation
+import ai
+from audio import AudioDispatcher
+from events import EventQueue, WALL_HIT, PADDLE_HIT, GOAL, POWERUP_COLLECTED, PUCK_HIT
+from game_objects import (
+    Puck, Paddle, MirroredPuck, resolve_puck_collisions, most_threatening_puck, update_mirrored_ai
+)
+from spatial import SpatialHash
+from power_ups import PowerUpField, power_up_color
+from batch_render import CircleBatch
+from frame_timing import FrameTimer
+from scaled_render import ScaledRenderer
+from quality import QualityGovernor
+from mouse_path import MotionBuffer
+from particles import ParticlePool
+from latency import LatencyProbe, SyntheticMouse
+from allocations import AllocationProbe, pause_gc, resume_gc
+from telemetry import TelemetryRecorder, default_path as default_telemetry_path
 from game_states import MenuManager
+from startup import StartupTimer
+from stuck import StuckMonitor
+from trails import PuckTrails
+_imports_done_time = time.perf_counter()
 
 class AirHockeyGame(arcade.Window):
-    def __init__(self):
-        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    def __init__(self, startup_timer=None, startup_report=False, stress=None,
+                 fullscreen=False, render_scale=None, quality=None,
+                 tick_rate=TICK_RATE, draw_rate=DRAW_RATE, vsync=False, benchmark=None,
+                 latency=None, inject_rate=0, telemetry=None, spectator=None, alloc_report=None,
+                 freeze_gc=False, ai_strategy=AI_STRATEGY):
+        # Start-up timing
+        self.startup = startup_timer or StartupTimer()
+        self.startup_report = startup_report
+        self.startup_report_printed = False
+        window_start = time.perf_counter()
+        
+        # The benchmark mode runs the loop as fast as it can go
+        if benchmark is not None:
+            draw_rate = UNCAPPED_RATE
+            vsync = False
+        super().__init__(
+            SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE,
+            fullscreen=fullscreen, resizable=True, vsync=vsync,
+            update_rate=1 / draw_rate, draw_rate=1 / draw_rate
+        )
         arcade.set_background_color(arcade.color.BLACK)
         
-        # Set update rate for performance (60 FPS cap)
-        self.set_update_rate(1/60)
+        # Everything is drawn in rink coordinates into an offscreen framebuffer
+        # and scaled to the window (render_scale None follows the window size)
+        self.renderer = ScaledRenderer(self, render_scale)
+        
+        # Fixed-step simulation, independent of the draw rate: on_update runs
+        # as many ticks as the elapsed time covers, and drawing interpolates
+        # between the last two ticks
+        self.tick_time = 1 / tick_rate
+        self.physics_step = 60 * self.tick_time  # Tick length in the 1/60 s units of the physics
+        self.tick_accumulator = 0.0
+        self.sim_time = 0.0  # Simulated seconds since the match started
+        self.last_update_wall = time.perf_counter()  # Real time the last ticks ran up to
+        self.interpolated = []  # Objects drawn between ticks (pucks and AI paddle)
+        # Their positions before the last tick, and the real ones while a frame is drawn
+        self.previous_x = array('d')
+        self.previous_y = array('d')
+        self.current_x = array('d')
+        self.current_y = array('d')
+        
+        # Menus are only drawn again when something on them changes, and the
+        # loop runs slower while no match is being played (see update_loop_rate)
+        self.play_rate = draw_rate
+        self.loop_rate = draw_rate
+        self.needs_redraw = True  # Resizes, exposes, clicks and key presses
+        self.drawn_state = None  # What the last drawn frame showed
+        self.drawn_selection = None
+        self.drawn_loading = False
+        self.frame_skipped = False  # on_draw kept the last frame, so there is nothing to flip
+        self.focused = True
+        self.minimized = False
 
         # Game objects
         self.player1_paddle = None
         self.player2_paddle = None
-        self.puck = None
-        self.power_ups = []
+        self.paddles = ()
+        self.puck = None  # The first puck; multi-puck matches have more in self.pucks
+        self.pucks = []
+        self.puck_grid = SpatialHash(PUCK_RADIUS * 2)  # Broad phase for puck-to-puck collisions
+        self.mirror = MirroredPuck()  # The puck as the bottom AI sees it in spectator mode
+        self.power_up_field = PowerUpField()
+        
+        # One-draw-call batches used once there are many pucks or power-ups
+        self.puck_batch = CircleBatch(PUCK_RADIUS)
+        self.power_up_batch = CircleBatch(POWER_UP_RADIUS)
         
         # Game state
         self.current_state = MENU_STATE
@@ -36,92 +122,395 @@ class AirHockeyGame(arcade.Window):
         self.mouse_x = 0
         self.mouse_y = 0
         
+        # Every mouse motion event between frames, swept by the player paddle
+        self.motion = MotionBuffer()
+        self.frame_path = []  # This frame's samples in simulation time
+        self.tick_path = []  # The part of frame_path covered by the current tick
+        self.last_mouse_sample = (0, 0)
+        
         # Game timer
         self.game_time = 0
         self.timer_active = False
         
         # Particle effects
-        self.particles = []
-        self.max_particles = 30  # Limit maximum particles for performance
+        self.particles = ParticlePool()
+        self.max_particles = 30  # Limit maximum particles for performance (set by the quality level)
+        
+        # Fading streaks behind fast pucks (their length is set by the quality level)
+        self.trails = PuckTrails(self.ctx)
+        
+        # HUD labels, created with the first match; their strings are only
+        # rebuilt when a score or the clock's whole seconds change
+        self.player_score_text = None
+        self.ai_score_text = None
+        self.timer_text = None
+        self.timer_seconds = None
+        
+        # Visual quality follows measured frame time unless a level is pinned. The
+        # budget is the frame interval actually shown (the benchmark's uncapped
+        # loop is held to the 60 FPS budget instead).
+        if benchmark is None:
+            self.quality = QualityGovernor(budget=1 / self.presented_rate(draw_rate, vsync))
+        else:
+            self.quality = QualityGovernor()
+        if quality is not None:
+            self.quality.set_level(quality)
+            self.quality.enabled = False
+        self.update_work = 0.0  # Seconds spent in on_update since the last draw
+        self.apply_quality()
         
-        # Power-up system
-        self.power_up_timer = 0
+        # Physics events, handled in one batch at the end of each frame
+        self.events = EventQueue(EVENT_QUEUE_CAPACITY)
+        self.match_stats = {}
+        self.reset_match_stats()
+        self.events.subscribe(WALL_HIT, self.on_wall_hit)
+        self.events.subscribe(PADDLE_HIT, self.on_paddle_hit)
+        self.events.subscribe(GOAL, self.on_goal)
+        self.events.subscribe(POWERUP_COLLECTED, self.on_power_up_collected)
+        self.events.subscribe(PUCK_HIT, self.on_puck_hit)
         
-        # Stuck detection
-        self.stuck_timer = 0
-        self.last_puck_pos = (0, 0)
+        # Optional match telemetry, written to telemetry (a file path) by a background thread
+        self.telemetry = None
+        if telemetry is not None:
+            self.telemetry = TelemetryRecorder(telemetry)
+            self.telemetry.attach(self.events)
+            self.telemetry.start()
+        
+        # Frees pucks that are pinned against the boards or lie dead
+        self.stuck_monitor = StuckMonitor(self.tick_time)
+        
+        # AI strategies driving the top paddle (and the bottom one when spectating), made in setup
+        self.top_ai = None
+        self.bottom_ai = None
         
         # Game settings
         self.settings = {
             'ai_difficulty': 1,  # 0: Easy, 1: Medium, 2: Hard
+            'ai_strategy': ai_strategy,  # See ai.STRATEGIES
             'ai_color': "Blue",    # Default AI color
             'player_color': "Red",  # Default player color
             'max_score': 7,
             'game_mode': 0,  # 0: Score-based, 1: Time-based
             'time_limit': 2,  # Minutes (only used in time-based mode)
             'power_ups_enabled': True,  # Enable/disable power-ups
-            'power_up_frequency': 1  # 0: Low, 1: Medium, 2: High
+            'power_up_frequency': 1,  # 0: Low, 1: Medium, 2: High
+            'puck_count': 1,  # Pucks in play at once (party mode uses 20+)
+            'bottom_ai_difficulty': None,  # None: the player; 0-2: AI-vs-AI spectator mode
+            'bottom_ai_strategy': AI_STRATEGY,
+            'speed_multiplier': 1  # Simulation speed in spectator mode
         }
         
+        # Spectator mode from the command line: {'bottom_difficulty', 'top_difficulty',
+        # 'bottom_strategy', 'top_strategy', 'speed', 'pucks'} - an AI-vs-AI match that starts by itself
+        if spectator is not None:
+            self.settings['bottom_ai_difficulty'] = spectator['bottom_difficulty']
+            self.settings['ai_difficulty'] = spectator['top_difficulty']
+            self.settings['bottom_ai_strategy'] = spectator['bottom_strategy']
+            self.settings['ai_strategy'] = spectator['top_strategy']
+            self.settings['speed_multiplier'] = spectator['speed']
+            self.settings['puck_count'] = spectator['pucks']
+        
+        # Stress mode: {'pucks', 'power_ups', 'seconds'} - starts straight into an
+        # endless match and prints frame timings when the time is up
+        self.stress = stress
+        self.frame_timer = None
+        if stress is not None:
+            self.settings['puck_count'] = stress['pucks']
+            self.settings['max_score'] = float('inf')
+            self.frame_timer = FrameTimer(capacity=int(stress['seconds'] * 60) + 60)
+        
+        # Benchmark mode: an endless match drawn uncapped for this many seconds
+        self.benchmark = benchmark
+        if benchmark is not None:
+            self.settings['max_score'] = float('inf')
+            self.frame_timer = FrameTimer(capacity=int(benchmark * UNCAPPED_RATE))
+        
+        # Latency mode: an endless match that follows every mouse event to the
+        # screen, optionally fed by synthetic input
+        self.latency = None
+        self.injector = None
+        if latency is not None:
+            self.settings['max_score'] = float('inf')
+            self.latency = LatencyProbe()
+            if inject_rate:
+                self.injector = SyntheticMouse(self, inject_rate)
+        
+        # Allocation report: an endless match with every frame's allocations traced
+        self.allocations = None
+        if alloc_report is not None:
+            self.settings['max_score'] = float('inf')
+            self.allocations = AllocationProbe()
+        
+        # Keep the garbage collector paused while a match is being played
+        self.freeze_gc = freeze_gc
+        self.gc_paused = False
+        
+        # Benchmark, latency and allocation runs end after this many seconds of play
+        self.run_seconds = benchmark if benchmark is not None else latency
+        if alloc_report is not None:
+            self.run_seconds = alloc_report
+        self.run_start = None
+        
         # Game over message
         self.game_over_message = ""
         
         # Debug mode for visualizing boundaries
         self.debug_mode = False
 
-        # Create and load sound effects
-        utils.create_default_sound_files()
+        # Hits are merged per frame and played on pooled voices
+        self.audio = AudioDispatcher()
+        
+        # Sounds stay None until the background loader has finished
+        self.menu_select_sound = None
+        self.goal_sound = None
+        self.paddle_hit_sound = None
+        self.wall_hit_sound = None
+        self.power_up_sound = None
+        
+        # Load assets and build gameplay objects on a background thread so the
+        # main menu can show immediately
+        self.asset_bundle = None
+        self.prepared_objects = None
+        # Start Game was chosen before loading finished (stress, benchmark,
+        # latency and spectator runs start by themselves)
+        self.start_pending = (stress is not None or benchmark is not None or latency is not None
+                              or alloc_report is not None or spectator is not None)
+        self.loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AssetLoader")
+        self.assets_future = self.loader.submit(self.load_assets)
+        
+        self.startup.add_phase("window", window_start, time.perf_counter())
+
+    def load_assets(self):
+        """Create and load sound effects and prepare gameplay objects (runs on the loader thread)"""
+        start = time.perf_counter()
+        # Prefer the packed bundle: one mmap instead of a file open per sound
+        self.asset_bundle = assets.open_default_bundle()
+        if self.asset_bundle is None:
+            utils.create_default_sound_files()
         self.load_sounds()
+        self.prepared_objects = self.create_game_objects(self.settings['puck_count'])
+        self.startup.add_phase("assets", start, time.perf_counter())
+
+    def finish_loading(self):
+        """Called on the game thread once the background loader is done"""
+        future = self.assets_future
+        self.assets_future = None
+        self.loader.shutdown(wait=False)
+        
+        error = future.exception()
+        if error is not None:
+            print(f"Could not load game assets: {error}")
+        
+        # Voices are pyglet Players, so they are made here on the game thread
+        self.audio.preload((
+            self.menu_select_sound, self.goal_sound, self.paddle_hit_sound,
+            self.wall_hit_sound, self.power_up_sound
+        ))
+        
+        # Start the match the player already asked for
+        if self.start_pending:
+            self.start_pending = False
+            self.current_state = GAME_STATE
+            self.setup()
+
+    def load_sound(self, path):
+        """Load a sound from the asset bundle if it has one, otherwise from disk"""
+        if self.asset_bundle is not None and path in self.asset_bundle:
+            return self.asset_bundle.load_sound(path)
+        return arcade.load_sound(path)
 
     def load_sounds(self):
         """Load all game sound effects"""
-        self.menu_select_sound = arcade.load_sound("sounds/vgmenuselect.wav")
-        self.goal_sound = arcade.load_sound("sounds/goal_sound.wav")
-        self.paddle_hit_sound = arcade.load_sound("sounds/paddle_hit.wav")
-        self.wall_hit_sound = arcade.load_sound("sounds/wall_hit.wav")
-        self.power_up_sound = arcade.load_sound("sounds/power_up.wav")
+        self.menu_select_sound = self.load_sound("sounds/vgmenuselect.wav")
+        self.goal_sound = self.load_sound("sounds/goal_sound.wav")
+        self.paddle_hit_sound = self.load_sound("sounds/paddle_hit.wav")
+        self.wall_hit_sound = self.load_sound("sounds/wall_hit.wav")
+        self.power_up_sound = self.load_sound("sounds/power_up.wav")
 
-    def setup(self):
-        """Set up the game and initialize the variables"""
-        # Create game objects
-        self.player1_paddle = Paddle(is_ai=False)
-        self.player2_paddle = Paddle(is_ai=True)
-        self.puck = Puck()
+    def create_game_objects(self, puck_count=1):
+        """Build a fresh set of paddles and pucks"""
+        player1_paddle = Paddle(is_ai=False)
+        player2_paddle = Paddle(is_ai=True)
         
         # Connect paddles to each other for freeze power-up
-        self.player1_paddle.opponent_paddle = self.player2_paddle
-        self.player2_paddle.opponent_paddle = self.player1_paddle
-        self.puck.opponent_paddle = self.player2_paddle  # For freeze power-up
+        player1_paddle.opponent_paddle = player2_paddle
+        player2_paddle.opponent_paddle = player1_paddle
+        
+        # Spread the pucks around the center spot so they don't start overlapping
+        pucks = []
+        for x, y in utils.faceoff_positions(puck_count, PUCK_RADIUS):
+            puck = Puck()
+            puck.x = x
+            puck.y = y
+            puck.opponent_paddle = player2_paddle  # For freeze power-up
+            pucks.append(puck)
+        return player1_paddle, player2_paddle, pucks
+
+    def setup(self):
+        """Set up the game and initialize the variables"""
+        # Use the objects the loader prepared for the first match, fresh ones after that
+        objects = self.prepared_objects
+        if objects is None or len(objects[2]) != self.settings['puck_count']:
+            objects = self.create_game_objects(self.settings['puck_count'])
+        self.prepared_objects = None
+        self.player1_paddle, self.player2_paddle, self.pucks = objects
+        self.paddles = (self.player1_paddle, self.player2_paddle)
+        self.puck = self.pucks[0]
         
         # Reset scores
         self.player1_score = 0
         self.player2_score = 0
+        self.update_score_labels()
         
         # Reset timer
         self.game_time = 0
         self.timer_active = True
         
         # Reset power-ups
-        self.power_ups = []
-        self.power_up_timer = 0
+        self.power_up_field.reset()
         
-        # Reset particles
-        self.particles = []
+        # Reset particles, pending events and match stats
+        self.particles.clear()
+        self.trails.resize(len(self.pucks))
+        self.events.clear()
+        self.reset_match_stats()
+        if self.telemetry is not None:
+            self.telemetry.new_match()
         
         # Reset stuck detection
-        self.stuck_timer = 0
-        self.last_puck_pos = (self.puck.x, self.puck.y)
+        self.stuck_monitor.reset()
+        
+        # Fresh AI strategies, so their cost and decision counts cover this match
+        self.top_ai = ai.create(self.settings['ai_strategy'], self.settings['ai_difficulty'])
+        self.bottom_ai = None
+        if self.spectating():
+            self.bottom_ai = ai.create(self.settings['bottom_ai_strategy'], self.settings['bottom_ai_difficulty'])
+        
+        # Reset the fixed-step clock; the player paddle follows the mouse and is never interpolated
+        self.tick_accumulator = 0.0
+        self.sim_time = 0.0
+        self.last_update_wall = time.perf_counter()
+        self.motion.clear()
+        self.last_mouse_sample = (self.mouse_x, self.mouse_y)
+        self.interpolated = self.pucks + [self.player2_paddle]
+        if self.spectating():
+            self.interpolated.append(self.player1_paddle)
+        for positions in (self.previous_x, self.previous_y, self.current_x, self.current_y):
+            positions[:] = array('d', bytes(8 * len(self.interpolated)))
+        self.remember_positions()
 
     def on_draw(self):
         """Render the screen"""
-        self.clear()
+        if self.current_state != GAME_STATE and not self.menu_changed():
+            self.frame_skipped = True  # The menu on screen is still up to date
+            return
+        self.drawn_state = self.current_state
+        self.drawn_selection = self.menu_manager.selected_item
+        self.drawn_loading = self.start_pending
+        self.needs_redraw = False
+        
+        start = time.perf_counter()
+        if self.current_state == GAME_STATE:
+            if self.allocations is not None:
+                self.allocations.begin()
+            self.draw_interpolated()
+            if self.allocations is not None:
+                self.allocations.end('draw')
+        else:
+            self.draw_frame()
+        end = time.perf_counter()
+        draw_work = end - start
+        
+        if self.frame_timer is not None:
+            self.frame_timer.record_draw(draw_work)
+            if self.current_state == GAME_STATE:
+                self.frame_timer.record_present(end)
+        if self.latency is not None and self.current_state == GAME_STATE:
+            self.latency.on_drawn(end)
+        
+        if self.run_seconds is not None and self.current_state == GAME_STATE:
+            if self.run_start is None:
+                self.run_start = end
+                if self.injector is not None:
+                    self.injector.start()
+                if self.allocations is not None:
+                    self.allocations.start()
+            elif end - self.run_start >= self.run_seconds:
+                self.finish_timed_run()
+        
+        # Only gameplay frames say anything about how much detail we can afford
+        if self.current_state == GAME_STATE and self.quality.record(self.update_work + draw_work):
+            self.apply_quality()
+        self.update_work = 0.0
+        
+        self.startup.mark("first frame")
+
+    def menu_changed(self):
+        """True when the menu frame on screen no longer shows the current state"""
+        return (self.needs_redraw or self.current_state != self.drawn_state
+                or self.menu_manager.selected_item != self.drawn_selection
+                or self.start_pending != self.drawn_loading)
+
+    def remember_positions(self):
+        """Store interpolated objects' positions before a tick"""
+        interpolated = self.interpolated
+        for i in range(len(interpolated)):
+            self.previous_x[i] = interpolated[i].x
+            self.previous_y[i] = interpolated[i].y
+
+    def draw_interpolated(self):
+        """Draw with moving objects placed between the last two ticks"""
+        alpha = self.tick_accumulator / self.tick_time
+        interpolated = self.interpolated
+        for i in range(len(interpolated)):
+            obj = interpolated[i]
+            x = self.current_x[i] = obj.x
+            y = self.current_y[i] = obj.y
+            previous_x = self.previous_x[i]
+            previous_y = self.previous_y[i]
+            if abs(x - previous_x) + abs(y - previous_y) < INTERPOLATION_SNAP_DISTANCE:
+                obj.x = previous_x + (x - previous_x) * alpha
+                obj.y = previous_y + (y - previous_y) * alpha
+        
+        self.draw_frame()
+        
+        for i in range(len(interpolated)):
+            interpolated[i].x = self.current_x[i]
+            interpolated[i].y = self.current_y[i]
+
+    def draw_frame(self):
+        """Draw the current state, scaled from the internal resolution to the window"""
+        self.renderer.begin()
+        self.draw_rink_space()
+        self.renderer.end()
+
+    def draw_rink_space(self):
+        """Draw the current state in rink coordinates"""
         
         if self.current_state in [MENU_STATE, SETTINGS_STATE, PAUSE_STATE, GAME_OVER_STATE, HOW_TO_PLAY_STATE]:
+            # The match stays visible, frozen and darkened, behind the pause menu
+            if self.current_state == PAUSE_STATE and self.renderer.draw_frozen():
+                arcade.draw_lrbt_rectangle_filled(
+                    0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, PAUSE_DIM_ALPHA)
+                )
+            
             self.menu_manager.draw_menu(
                 self.current_state,
                 self.settings,
                 self.game_over_message
             )
+            
+            # Start Game was chosen while assets were still loading
+            if self.start_pending:
+                arcade.draw_text(
+                    "Loading...",
+                    SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT * 0.55,
+                    arcade.color.WHITE,
+                    18,
+                    anchor_x="center",
+                    anchor_y="center"
+                )
         elif self.current_state == GAME_STATE:
             # Draw game board with rounded corners
             utils.draw_rounded_hockey_rink()
@@ -132,9 +521,9 @@ class AirHockeyGame(arcade.Window):
             ai_goal_width = GOAL_WIDTH
             
             # Apply goal shrink if active - each player's goal shrink affects their OWN goal
-            if hasattr(self.player1_paddle, 'goal_shrink_active') and self.player1_paddle.goal_shrink_active:
+            if self.player1_paddle.goal_shrink_active:
                 player_goal_width = GOAL_WIDTH * 0.5  # 50% reduction
-            if hasattr(self.player2_paddle, 'goal_shrink_active') and self.player2_paddle.goal_shrink_active:
+            if self.player2_paddle.goal_shrink_active:
                 ai_goal_width = GOAL_WIDTH * 0.5  # 50% reduction
                 
             # Player goal (bottom)
@@ -173,65 +562,60 @@ class AirHockeyGame(arcade.Window):
                 border_width=2
             )
             
+            quality = self.quality.settings
+            
             # Draw paddles
             self.player1_paddle.draw(
                 PADDLE_COLORS[self.settings['player_color']],
-                self.player1_paddle.power_up_active
+                self.player1_paddle.power_up_active,
+                quality['glow_rings'],
+                quality['icons']
             )
             
             self.player2_paddle.draw(
                 PADDLE_COLORS[self.settings['ai_color']],
-                self.player2_paddle.power_up_active
+                self.player2_paddle.power_up_active,
+                quality['glow_rings'],
+                quality['icons']
             )
             
-            # Draw puck
-            self.puck.draw()
+            # Puck trails, all in one draw call, under the pucks
+            self.trails.draw(self.pucks)
             
-            # Draw power-ups
-            for power_up in self.power_ups:
-                power_up.draw()
+            # Draw pucks - one batched draw call when there are many
+            if len(self.pucks) > BATCH_DRAW_THRESHOLD:
+                self.puck_batch.draw(self.pucks, arcade.color.GRAY)
+                if quality['repulsor_arrow']:
+                    self.puck.draw_repulsor_arrow()
+            else:
+                for puck in self.pucks:
+                    puck.draw(quality['repulsor_arrow'])
             
-            # Draw particles
-            for particle in self.particles:
-                arcade.draw_circle_filled(
-                    particle['x'],
-                    particle['y'],
-                    particle['radius'],
-                    particle['color']
+            # Draw power-ups - batched ones are plain colored circles without icons
+            power_ups = self.power_up_field.power_ups
+            if len(power_ups) > BATCH_DRAW_THRESHOLD:
+                self.power_up_batch.draw(
+                    power_ups, arcade.color.WHITE,
+                    color_of=power_up_color
                 )
+            else:
+                for power_up in power_ups:
+                    power_up.draw(quality['power_up_pulse'], quality['icons'])
             
-            # Draw scores - simple version for better performance
-            # Player score
-            arcade.draw_text(
-                f"PLAYER: {self.player1_score}",
-                20,
-                20,
-                PADDLE_COLORS[self.settings['player_color']],
-                20,
-                bold=True
-            )
+            # Draw particles
+            self.particles.draw()
             
-            # AI score
-            arcade.draw_text(
-                f"AI: {self.player2_score}",
-                20,
-                SCREEN_HEIGHT - 40,
-                PADDLE_COLORS[self.settings['ai_color']],
-                20,
-                bold=True
-            )
+            # Draw scores
+            self.player_score_text.draw()
+            self.ai_score_text.draw()
             
             # Draw timer if in time-based mode
             if self.settings['game_mode'] == 1:  # Time-based mode
-                minutes = int(self.settings['time_limit'] * 60 - self.game_time) // 60
-                seconds = int(self.settings['time_limit'] * 60 - self.game_time) % 60
-                arcade.draw_text(
-                    f"Time: {minutes}:{seconds:02d}",
-                    SCREEN_WIDTH - 120,
-                    SCREEN_HEIGHT - 30,
-                    arcade.color.WHITE,
-                    20
-                )
+                remaining = int(self.settings['time_limit'] * 60 - self.game_time)
+                if remaining != self.timer_seconds:
+                    self.timer_seconds = remaining
+                    self.timer_text.text = f"Time: {remaining // 60}:{remaining % 60:02d}"
+                self.timer_text.draw()
             
             # Debug visualization of boundaries
             if self.debug_mode:
@@ -239,6 +623,24 @@ class AirHockeyGame(arcade.Window):
 
     def draw_debug_boundaries(self):
         """Draw debug visualization for boundary detection"""
+        # Current quality level and frame load
+        arcade.draw_text(
+            self.quality.describe(),
+            SCREEN_WIDTH - 10,
+            SCREEN_HEIGHT - 60,
+            arcade.color.YELLOW,
+            10,
+            anchor_x="right"
+        )
+        arcade.draw_text(
+            f"AI {self.top_ai.name}: {1e6 * self.top_ai.seconds / max(1, self.top_ai.calls):.1f} us/call",
+            SCREEN_WIDTH - 10,
+            SCREEN_HEIGHT - 75,
+            arcade.color.YELLOW,
+            10,
+            anchor_x="right"
+        )
+        
         # Get corner positions
         corner_positions = utils.get_rink_corner_positions()
         
@@ -288,221 +690,439 @@ class AirHockeyGame(arcade.Window):
 
     def on_update(self, delta_time):
         """Movement and game logic"""
-        if self.current_state == GAME_STATE:
-            # Performance optimization: Limit particles
-            if len(self.particles) > self.max_particles:
-                # If we have too many particles, remove the oldest ones
-                self.particles = self.particles[-self.max_particles:]
-            
-            # Update paddle freeze states
-            self.player1_paddle.on_update(delta_time)
-            self.player2_paddle.on_update(delta_time)
-            
-            # Update game timer if active
-            if self.timer_active:
-                self.game_time += delta_time
-                
-                # Check for time-based game end
-                if self.settings['game_mode'] == 1 and self.game_time >= self.settings['time_limit'] * 60:
-                    # Time's up, determine winner
-                    if self.player1_score > self.player2_score:
-                        self.game_over_message = "You Win!"
-                    elif self.player2_score > self.player1_score:
-                        self.game_over_message = "AI Wins!"
-                    else:
-                        self.game_over_message = "It's a Tie!"
-                    
-                    self.current_state = GAME_OVER_STATE
-                    self.menu_manager.selected_item = 0
-                    return
-            
-            # Check for stuck puck
-            self.last_puck_pos, self.stuck_timer, was_stuck = self.puck.check_stuck(
-                delta_time, self.last_puck_pos, self.stuck_timer
-            )
+        # Pick up the background loader's results once it is done
+        if self.assets_future is not None and self.assets_future.done():
+            self.finish_loading()
+        
+        if (self.startup_report and not self.startup_report_printed
+                and self.assets_future is None and self.startup.has_mark("first frame")):
+            print(self.startup.report())
+            self.startup_report_printed = True
+        
+        # Automatic collection stays off from the start of a match until it ends or is paused
+        in_match = self.current_state == GAME_STATE
+        if self.freeze_gc and in_match != self.gc_paused:
+            if in_match:
+                pause_gc()
+            else:
+                resume_gc()
+            self.gc_paused = in_match
+        
+        if in_match:
+            start = time.perf_counter()
+            if self.allocations is not None:
+                self.allocations.begin()
             
-            # Try to unstick from corners
-            was_stuck_in_corner, corner_particles = self.puck.check_for_stuck_in_corner()
-            if corner_particles and len(self.particles) < self.max_particles:
-                self.particles.extend(corner_particles[:self.max_particles - len(self.particles)])
+            # Run as many fixed ticks as the elapsed time covers (sped up when spectating)
+            speed = self.settings['speed_multiplier'] if self.spectating() else 1
+            self.tick_accumulator += delta_time * speed
+            max_ticks = math.ceil(MAX_TICKS_PER_FRAME * speed)
+            ticks = min(max_ticks, int((self.tick_accumulator + 1e-9) / self.tick_time))
             
-            # Update player paddle
-            self.player1_paddle.update_player(self.mouse_x, self.mouse_y)
+            if ticks:
+                self.collect_mouse_path(ticks)
             
-            # Update AI paddle
-            ai_particles = self.player2_paddle.update_ai(self.puck, self.settings['ai_difficulty'])
-            if ai_particles and len(self.particles) < self.max_particles:
-                self.particles.extend(ai_particles[:self.max_particles - len(self.particles)])
+            index = 0
+            frame_path = self.frame_path
+            for tick in range(ticks):
+                if self.current_state != GAME_STATE:
+                    break
+                # Hand this tick the mouse samples that arrived during it
+                tick_end = self.sim_time + self.tick_time
+                self.tick_path.clear()
+                while index < len(frame_path) and frame_path[index][0] <= tick_end + 1e-9:
+                    self.tick_path.append(frame_path[index])
+                    index += 1
+                
+                self.remember_positions()
+                self.update_game(self.tick_time)
+                self.sim_time = tick_end
+                self.tick_accumulator -= self.tick_time
+            # Drop time we can't catch up on instead of spiralling, and
+            # never let float error leave a negative remainder
+            self.tick_accumulator = max(0.0, min(self.tick_accumulator, self.tick_time))
             
-            # Update puck
-            self.puck.update()
+            # Hand this frame's physics events to audio, particles and stats in one batch
+            if self.telemetry is not None:
+                self.telemetry.time = self.sim_time
+                self.telemetry.sample(self.pucks, self.paddles)
+            self.events.dispatch()
+            if self.allocations is not None:
+                self.allocations.end('update')
+            now = time.perf_counter()
+            update_work = now - start
+            self.update_work += update_work
+            if ticks and self.latency is not None:
+                self.latency.on_applied(now)
             
-            # Handle puck-wall collisions with rounded corners
-            collision, wall_particles = self.puck.handle_boundary_collision(self.wall_hit_sound)
-            if wall_particles and len(self.particles) < self.max_particles:
-                self.particles.extend(wall_particles[:self.max_particles - len(self.particles)])
+            if self.frame_timer is not None:
+                self.frame_timer.record_update(update_work)
+                if self.stress is not None and self.game_time >= self.stress['seconds']:
+                    self.finish_timed_run()
+        
+        # Start the sounds requested this frame, one voice per sound
+        self.audio.drain()
+        
+        self.update_loop_rate()
+
+    def collect_mouse_path(self, ticks):
+        """Turn the mouse samples since the last ticks into this frame's path in simulation time"""
+        now = time.perf_counter()
+        self.frame_path.clear()
+        self.motion.drain(
+            self.last_update_wall, now, self.sim_time, ticks * self.tick_time, self.frame_path
+        )
+        self.last_update_wall = now
+        
+        # Moves that didn't come from motion events (or none arrived) land at the end of the frame
+        if not self.frame_path and (self.mouse_x, self.mouse_y) != self.last_mouse_sample:
+            self.frame_path.append((self.sim_time + ticks * self.tick_time, self.mouse_x, self.mouse_y))
+        if self.frame_path:
+            self.last_mouse_sample = (self.frame_path[-1][1], self.frame_path[-1][2])
+
+    def presented_rate(self, draw_rate, vsync):
+        """Frames shown per second: the draw rate, capped by the display refresh with vsync"""
+        if vsync:
+            try:
+                refresh = self.screen.get_mode().rate
+            except Exception:
+                refresh = None  # Headless, or the platform can't tell
+            if refresh:
+                return min(draw_rate, refresh)
+        return draw_rate
+
+    def update_loop_rate(self):
+        """Run the loop at the full rate during matches and slower everywhere else"""
+        if self.current_state == GAME_STATE or self.assets_future is not None:
+            rate = self.play_rate
+        elif self.focused and not self.minimized:
+            rate = min(self.play_rate, IDLE_RATE)
+        else:
+            rate = min(self.play_rate, BACKGROUND_RATE)
+        if rate != self.loop_rate:
+            self.loop_rate = rate
+            self.set_update_rate(1 / rate)
+            self.set_draw_rate(1 / rate)
+
+    def apply_quality(self):
+        """Pick up settings that are cached from the current quality level"""
+        self.max_particles = self.quality.settings['max_particles']
+        self.trails.set_length(self.quality.settings['trail_length'])
+
+    def finish_timed_run(self):
+        """Print the stress, benchmark, latency or allocation report and close the window"""
+        if self.injector is not None:
+            self.injector.stop()
+        if self.latency is not None:
+            print(self.latency.report(
+                f"Input latency: {round(1 / self.tick_time)} Hz ticks, "
+                f"vsync {'on' if self.vsync else 'off'}"
+            ))
+        if self.allocations is not None:
+            print(self.allocations.report(
+                f"Allocations: {len(self.pucks)} pucks, {round(1 / self.tick_time)} Hz ticks, "
+                f"GC {'paused' if self.freeze_gc else 'on'}"
+            ))
+        if self.frame_timer is not None:
+            if self.stress is not None:
+                title = f"Stress: {self.stress['pucks']} pucks, {self.stress['power_ups']} power-ups"
+            else:
+                title = (f"Benchmark: uncapped drawing, {round(1 / self.tick_time)} Hz ticks, "
+                         f"quality {self.quality.settings['name']}")
+            print(self.frame_timer.report(title))
+            print(f"  events dropped: {self.events.dropped}, sounds skipped at the voice cap: "
+                  f"{self.audio.voice_limited}")
+        for strategy in (self.bottom_ai, self.top_ai):
+            if strategy is not None:
+                print(f"  AI {ai.describe(strategy.stats())}")
+        self.close()
+
+    def close(self):
+        """Finish the telemetry file before the window goes away"""
+        if self.telemetry is not None:
+            self.telemetry.close()
+            print(f"Telemetry: {self.telemetry.rows} rows written to {self.telemetry.path}"
+                  f" ({self.telemetry.dropped} dropped)")
+            self.telemetry = None
+        super().close()
+
+    def flip(self):
+        """Present the frame (waits for the display when vsync is on)"""
+        if self.frame_skipped:
+            self.frame_skipped = False
+            return
+        super().flip()
+        if self.latency is not None:
+            self.latency.on_presented(time.perf_counter())
+
+    def win_message(self, winner):
+        """Game over text for a win by "PLAYER" (bottom) or "AI" (top)"""
+        if self.spectating():
+            return "Bottom AI Wins!" if winner == "PLAYER" else "Top AI Wins!"
+        return "You Win!" if winner == "PLAYER" else "AI Wins!"
+
+    def spectating(self):
+        """True when the AI plays both paddles"""
+        return self.settings['bottom_ai_difficulty'] is not None
+
+    def update_game(self, delta_time):
+        """Advance the match by one frame"""
+        # Performance optimization: Limit particles (the quality level may have lowered the cap)
+        self.particles.limit(self.max_particles)
+        
+        # Update game timer if active
+        if self.timer_active:
+            self.game_time += delta_time
             
-            # Handle paddle-puck collisions with reduced particles for performance
-            collision, player_particles = self.player1_paddle.check_collision_with_puck(
-                self.puck, 
-                self.paddle_hit_sound,
+            # Check for time-based game end
+            if self.settings['game_mode'] == 1 and self.game_time >= self.settings['time_limit'] * 60:
+                # Time's up, determine winner
+                if self.player1_score > self.player2_score:
+                    self.game_over_message = self.win_message("PLAYER")
+                elif self.player2_score > self.player1_score:
+                    self.game_over_message = self.win_message("AI")
+                else:
+                    self.game_over_message = "It's a Tie!"
+                
+                self.current_state = GAME_OVER_STATE
+                self.menu_manager.selected_item = 0
+                return
+        
+        step = self.physics_step
+        
+        # Update AI paddle - with several pucks it plays the most dangerous one
+        ai_target = self.puck if len(self.pucks) == 1 else most_threatening_puck(self.pucks)
+        self.top_ai.update(self.player2_paddle, ai_target, step)
+        if self.bottom_ai is not None:
+            # The bottom paddle plays its AI with the rink flipped
+            bottom_target = self.puck if len(self.pucks) == 1 else most_threatening_puck(self.pucks, False)
+            update_mirrored_ai(self.player1_paddle, bottom_target, self.bottom_ai, self.mirror, step)
+        
+        # Update pucks and handle puck-wall collisions with rounded corners
+        for puck in self.pucks:
+            puck.update(step)
+            puck.handle_boundary_collision(self.events)
+        
+        # Puck-to-puck collisions (spatial hash broad phase)
+        resolve_puck_collisions(self.pucks, self.puck_grid, self.events)
+        
+        # Sweep the player paddle along this tick's mouse path, hitting pucks on the way
+        player_color = PADDLE_COLORS[self.settings['player_color']]
+        ai_color = PADDLE_COLORS[self.settings['ai_color']]
+        swept = ()
+        if not self.spectating():
+            swept = self.player1_paddle.sweep_player(self.tick_path, self.pucks, self.events, player_color)
+        
+        # Handle paddle-puck collisions at the final positions (a puck the sweep hit isn't hit again)
+        for puck in self.pucks:
+            if puck not in swept:
+                self.player1_paddle.check_collision_with_puck(puck, self.events, player_color)
+            self.player2_paddle.check_collision_with_puck(puck, self.events, ai_color)
+        
+        # Check for goals - every puck scores on its own
+        for puck in self.pucks:
+            goal_scorer = puck.is_in_goal()
+            if goal_scorer and self.score_goal(puck, goal_scorer):
+                return  # Match over
+        
+        # Free pucks that are pinned or dead
+        self.stuck_monitor.update(self.pucks, self.events)
+        
+        # Remember where the pucks went for their trails
+        self.trails.record(self.pucks)
+        
+        # Update particles
+        self.particles.update(delta_time, step)
+        
+        # Update power-ups
+        self.update_power_ups(delta_time)
+
+    def score_goal(self, puck, goal_scorer):
+        """Award a goal scored by puck and reset it. Returns True if this ends the match."""
+        puck_speed = math.sqrt(puck.dx**2 + puck.dy**2)
+        
+        if goal_scorer == "PLAYER":
+            self.player1_score += 1
+            self.update_score_labels()
+            # Where the puck crossed the line, as headless matches report it
+            self.events.emit(
+                GOAL,
+                puck.x,
+                puck.y,
+                puck_speed,
+                goal_scorer,
                 PADDLE_COLORS[self.settings['player_color']]
             )
-            if player_particles and len(self.particles) < self.max_particles:
-                # Use only 5 particles instead of 10 for better performance
-                self.particles.extend(player_particles[:min(5, self.max_particles - len(self.particles))])
+            
+            # Check for score-based game end
+            if self.settings['game_mode'] == 0 and self.player1_score >= self.settings['max_score']:
+                self.game_over_message = self.win_message("PLAYER")
+                self.current_state = GAME_OVER_STATE
+                self.menu_manager.selected_item = 0
+                return True
                 
-            collision, ai_particles = self.player2_paddle.check_collision_with_puck(
-                self.puck, 
-                self.paddle_hit_sound,
+        elif goal_scorer == "AI":
+            self.player2_score += 1
+            self.update_score_labels()
+            self.events.emit(
+                GOAL,
+                puck.x,
+                puck.y,
+                puck_speed,
+                goal_scorer,
                 PADDLE_COLORS[self.settings['ai_color']]
             )
-            if ai_particles and len(self.particles) < self.max_particles:
-                # Use only 5 particles instead of 10 for better performance
-                self.particles.extend(ai_particles[:min(5, self.max_particles - len(self.particles))])
-            
-            # Check for goals
-            goal_scorer = self.puck.is_in_goal()
-            if goal_scorer:
-                arcade.play_sound(self.goal_sound)
-                
-                if goal_scorer == "PLAYER":
-                    self.player1_score += 1
-                    # Create goal celebration particles
-                    goal_particles = utils.spawn_particles(
-                        SCREEN_WIDTH // 2, 
-                        SCREEN_HEIGHT - GOAL_HEIGHT // 2, 
-                        PADDLE_COLORS[self.settings['player_color']], 
-                        15  # Reduced from 30 for performance
-                    )
-                    if len(self.particles) < self.max_particles:
-                        self.particles.extend(goal_particles[:self.max_particles - len(self.particles)])
-                    
-                    # Check for score-based game end
-                    if self.settings['game_mode'] == 0 and self.player1_score >= self.settings['max_score']:
-                        self.game_over_message = "You Win!"
-                        self.current_state = GAME_OVER_STATE
-                        self.menu_manager.selected_item = 0
-                        return
-                        
-                elif goal_scorer == "AI":
-                    self.player2_score += 1
-                    # Create goal celebration particles
-                    goal_particles = utils.spawn_particles(
-                        SCREEN_WIDTH // 2, 
-                        GOAL_HEIGHT // 2, 
-                        PADDLE_COLORS[self.settings['ai_color']], 
-                        15  # Reduced from 30 for performance
-                    )
-                    if len(self.particles) < self.max_particles:
-                        self.particles.extend(goal_particles[:self.max_particles - len(self.particles)])
-                    
-                    # Check for score-based game end
-                    if self.settings['game_mode'] == 0 and self.player2_score >= self.settings['max_score']:
-                        self.game_over_message = "AI Wins!"
-                        self.current_state = GAME_OVER_STATE
-                        self.menu_manager.selected_item = 0
-                        return
-                
-                # Reset puck after goal
-                self.puck.reset()
-                self.last_puck_pos = (self.puck.x, self.puck.y)
-            
-            # Update particles
-            self.particles = utils.update_particles(self.particles, delta_time)
             
-            # Update power-ups
-            self.update_power_ups(delta_time)
+            # Check for score-based game end
+            if self.settings['game_mode'] == 0 and self.player2_score >= self.settings['max_score']:
+                self.game_over_message = self.win_message("AI")
+                self.current_state = GAME_OVER_STATE
+                self.menu_manager.selected_item = 0
+                return True
+        
+        # Reset puck after goal
+        puck.reset()
+        return False
+
+    def update_score_labels(self):
+        """Rebuild the score labels after a goal or at the start of a match"""
+        if self.player_score_text is None:
+            self.player_score_text = arcade.Text("", 20, 20, arcade.color.WHITE, 20, bold=True)
+            self.ai_score_text = arcade.Text("", 20, SCREEN_HEIGHT - 40, arcade.color.WHITE, 20, bold=True)
+            self.timer_text = arcade.Text("", SCREEN_WIDTH - 120, SCREEN_HEIGHT - 30, arcade.color.WHITE, 20)
+        spectating = self.spectating()
+        self.player_score_text.text = f"{'BOTTOM AI' if spectating else 'PLAYER'}: {self.player1_score}"
+        self.player_score_text.color = PADDLE_COLORS[self.settings['player_color']]
+        self.ai_score_text.text = f"{'TOP AI' if spectating else 'AI'}: {self.player2_score}"
+        self.ai_score_text.color = PADDLE_COLORS[self.settings['ai_color']]
+        self.timer_seconds = None
+
+    def reset_match_stats(self):
+        """Clear the per-match event counters"""
+        self.match_stats = {
+            'wall_hits': 0,
+            'paddle_hits': 0,
+            'goals': 0,
+            'puck_hits': 0,
+            'power_ups_collected': 0,
+            'fastest_shot': 0.0
+        }
+
+    def add_particles(self, x, y, color, count):
+        """Spawn up to count particles (scaled by the quality level) without going over the particle cap"""
+        count = int(count * self.quality.settings['particle_scale'] + 0.5)
+        room = self.max_particles - len(self.particles)
+        if room > 0:
+            self.particles.spawn(x, y, color, min(count, room))
+
+    # Event subscribers - called from self.events.dispatch() once per frame
+    def on_wall_hit(self, event):
+        """Play the wall sound and spark where the puck hit the boards"""
+        self.audio.play_impact(self.wall_hit_sound, event.speed)
+        self.add_particles(event.x, event.y, event.color, WALL_HIT_PARTICLES)
+        self.match_stats['wall_hits'] += 1
+
+    def on_paddle_hit(self, event):
+        """Play the hit sound and spark in the paddle's color"""
+        self.audio.play_impact(self.paddle_hit_sound, event.speed)
+        self.add_particles(event.x, event.y, event.color, PADDLE_HIT_PARTICLES)
+        self.match_stats['paddle_hits'] += 1
+        self.match_stats['fastest_shot'] = max(self.match_stats['fastest_shot'], event.speed)
+
+    def on_goal(self, event):
+        """Play the goal sound and burst celebration particles at the goal"""
+        self.audio.play(self.goal_sound)
+        # The event is at the puck; celebrate at the middle of the goal it went into
+        if event.source == "PLAYER":
+            goal_y = SCREEN_HEIGHT - GOAL_HEIGHT // 2  # AI goal (top)
+        else:
+            goal_y = GOAL_HEIGHT // 2  # Player goal (bottom)
+        self.add_particles(SCREEN_WIDTH // 2, goal_y, event.color, GOAL_PARTICLES)
+        self.match_stats['goals'] += 1
+
+    def on_puck_hit(self, event):
+        """Click two pucks together"""
+        self.audio.play_impact(self.wall_hit_sound, event.speed)
+        self.match_stats['puck_hits'] += 1
+
+    def on_power_up_collected(self, event):
+        """Play the power-up pickup sound"""
+        self.audio.play(self.power_up_sound)
+        self.match_stats['power_ups_collected'] += 1
             
     def update_power_ups(self, delta_time):
         """Update power-ups and handle power-up collisions"""
-        # If power-ups are disabled, clear any existing ones and return
-        if not self.settings['power_ups_enabled']:
-            self.power_ups = []
-            return
-        
-        # Spawn new power-ups periodically based on frequency setting
-        self.power_up_timer += delta_time
-        
-        # Determine spawn time based on frequency setting
-        spawn_times = [15, 10, 5]  # Low, Medium, High (in seconds)
-        spawn_time = spawn_times[self.settings['power_up_frequency']]
-        
-        # Determine maximum number of power-ups based on frequency
-        max_power_ups = [1, 2, 3]  # Low, Medium, High
-        max_count = max_power_ups[self.settings['power_up_frequency']]
-        
-        if self.power_up_timer > spawn_time and len(self.power_ups) < max_count:
-            # Create a new power-up that will only spawn on the center line
-            self.power_ups.append(PowerUp())
-            self.power_up_timer = 0
-        
-        # Update power-up lifetimes
-        for i in range(len(self.power_ups) - 1, -1, -1):
-            if self.power_ups[i].update(delta_time):
-                self.power_ups.pop(i)
-        
-        # Update player paddle power-up timer
-        if self.player1_paddle.power_up_active:
-            self.player1_paddle.power_up_time -= delta_time
-            if self.player1_paddle.power_up_time <= 0:
-                self.player1_paddle.power_up_active = False
-                # Reset player paddle
-                self.player1_paddle.radius = PADDLE_RADIUS
-                self.player1_paddle.can_cross_midline = False
-                self.player1_paddle.multi_puck_active = False  # Reset multi-puck
-                self.player1_paddle.goal_shrink_active = False  # Reset goal shrink
-                
-                # Reset puck effects
-                if hasattr(self.puck, 'speed_boost'):
-                    self.puck.speed_boost = False
-                if hasattr(self.puck, 'freeze_opponent'):
-                    self.puck.freeze_opponent = False
-                if hasattr(self.puck, 'repulsor_active') and self.puck.repulsor_owner == self.player1_paddle:
-                    self.puck.repulsor_active = False
-                    self.puck.repulsor_owner = None
-        
-        # Update AI paddle power-up timer
-        if self.player2_paddle.power_up_active:
-            self.player2_paddle.power_up_time -= delta_time
-            if self.player2_paddle.power_up_time <= 0:
-                self.player2_paddle.power_up_active = False
-                # Reset AI paddle
-                self.player2_paddle.radius = PADDLE_RADIUS
-                self.player2_paddle.can_cross_midline = False
-                self.player2_paddle.multi_puck_active = False  # Reset multi-puck
-                self.player2_paddle.goal_shrink_active = False  # Reset goal shrink
-                
-                # Reset puck effects
-                if hasattr(self.puck, 'speed_boost'):
-                    self.puck.speed_boost = False
-                if hasattr(self.puck, 'freeze_opponent'):
-                    self.puck.freeze_opponent = False
-                if hasattr(self.puck, 'repulsor_active') and self.puck.repulsor_owner == self.player2_paddle:
-                    self.puck.repulsor_active = False
-                    self.puck.repulsor_owner = None
-                    
-        # Check for power-up collisions
-        for i in range(len(self.power_ups) - 1, -1, -1):
-            # Check player paddle collision
-            if self.power_ups[i].check_collision(self.player1_paddle):
-                self.power_ups[i].apply(self.player1_paddle, self.puck)
-                arcade.play_sound(self.power_up_sound)
-                self.power_ups.pop(i)
-                continue
-                
-            # Check AI paddle collision
-            if self.power_ups[i].check_collision(self.player2_paddle):
-                self.power_ups[i].apply(self.player2_paddle, self.puck)
-                arcade.play_sound(self.power_up_sound)
-                self.power_ups.pop(i)
+        target_count = self.stress['power_ups'] if self.stress is not None else None
+        self.power_up_field.update(
+            delta_time,
+            self.paddles,
+            self.pucks,
+            self.settings,
+            self.events,
+            target_count
+        )
+
+    def on_close(self):
+        """Release the sound voices before the window closes"""
+        self.audio.stop()
+        super().on_close()
+
+    def on_resize(self, width, height):
+        """Re-letterbox the rink when the window size changes"""
+        super().on_resize(width, height)
+        self.renderer.resize(width, height)
+        self.needs_redraw = True
+
+    def on_expose(self):
+        """The window contents were lost (e.g. uncovered) and must be drawn again"""
+        self.needs_redraw = True
+
+    def on_activate(self):
+        self.focused = True
+        self.update_loop_rate()
+
+    def on_deactivate(self):
+        """Pause a match the player left, and slow the loop down"""
+        self.focused = False
+        self.pause_unattended()
+        self.update_loop_rate()
+
+    def on_show(self):
+        self.minimized = False
+        self.needs_redraw = True
+        self.update_loop_rate()
+
+    def on_hide(self):
+        """Minimized: pause the player's match and barely tick"""
+        self.minimized = True
+        self.pause_unattended()
+        self.update_loop_rate()
+
+    def pause_game(self):
+        """Stop the match and show the pause menu over its last frame"""
+        self.current_state = PAUSE_STATE
+        self.timer_active = False
+        self.menu_manager.selected_item = 0
+        self.renderer.freeze()
+
+    def pause_unattended(self):
+        """Pause the player's match when the window loses focus; AI-only and timed runs go on"""
+        if (self.current_state == GAME_STATE and not self.spectating()
+                and self.run_seconds is None and self.stress is None):
+            self.pause_game()
 
     def on_mouse_motion(self, x, y, dx, dy):
         """Called whenever the mouse moves"""
+        x, y = self.renderer.to_rink(x, y)
         self.mouse_x = x
         self.mouse_y = y
         
-        if self.current_state in [MENU_STATE, SETTINGS_STATE, PAUSE_STATE, GAME_OVER_STATE, HOW_TO_PLAY_STATE]:
+        if self.current_state == GAME_STATE:
+            now = time.perf_counter()
+            self.motion.add(now, x, y)
+            if self.latency is not None:
+                self.latency.on_arrival(now)
+        elif self.current_state in [MENU_STATE, SETTINGS_STATE, PAUSE_STATE, GAME_OVER_STATE, HOW_TO_PLAY_STATE]:
             # Update selected menu item based on mouse position
             hovered_item = self.menu_manager.check_mouse_over_menu(x, y)
             if hovered_item is not None and hovered_item != self.menu_manager.selected_item:
@@ -510,6 +1130,13 @@ class AirHockeyGame(arcade.Window):
 
     def on_mouse_press(self, x, y, button, modifiers):
         """Called when the mouse buttons are pressed"""
+        x, y = self.renderer.to_rink(x, y)
+        self.handle_click(x, y, button)
+        self.needs_redraw = True  # A click may have changed a setting
+        self.update_loop_rate()
+
+    def handle_click(self, x, y, button):
+        """Handle a click at rink coordinates"""
         if button == arcade.MOUSE_BUTTON_LEFT:
             if self.current_state in [MENU_STATE, SETTINGS_STATE, PAUSE_STATE, GAME_OVER_STATE, HOW_TO_PLAY_STATE]:
                 clicked_item = self.menu_manager.check_mouse_over_menu(x, y)
@@ -524,8 +1151,13 @@ class AirHockeyGame(arcade.Window):
                     
                     # Handle state changes
                     if result == "start_game" or result == "restart_game":
-                        self.current_state = GAME_STATE
-                        self.setup()
+                        if self.assets_future is not None:
+                            # Still loading - start as soon as the loader finishes
+                            self.start_pending = True
+                            self.current_state = MENU_STATE
+                        else:
+                            self.current_state = GAME_STATE
+                            self.setup()
                     elif result == "resume_game":
                         self.current_state = GAME_STATE
                         self.timer_active = True
@@ -539,12 +1171,14 @@ class AirHockeyGame(arcade.Window):
         if key == arcade.key.D and modifiers & arcade.key.MOD_CTRL:
             # Toggle debug mode with Ctrl+D
             self.debug_mode = not self.debug_mode
+        
+        if key == arcade.key.F11:
+            # Toggle full screen; on_resize rescales the rink
+            self.set_fullscreen(not self.fullscreen)
             
         if self.current_state == GAME_STATE:
             if key == arcade.key.ESCAPE:
-                self.current_state = PAUSE_STATE
-                self.timer_active = False
-                self.menu_manager.selected_item = 0
+                self.pause_game()
         elif self.current_state in [MENU_STATE, SETTINGS_STATE, PAUSE_STATE, GAME_OVER_STATE, HOW_TO_PLAY_STATE]:
             if key == arcade.key.UP:
                 if self.menu_manager.selected_item is None:
@@ -554,7 +1188,7 @@ class AirHockeyGame(arcade.Window):
                     menu_length = len(self.menu_manager.menu_items.get(self.current_state, []))
                     if menu_length > 0:
                         self.menu_manager.selected_item = (self.menu_manager.selected_item - 1) % menu_length
-                        arcade.play_sound(self.menu_select_sound)
+                        self.audio.play(self.menu_select_sound)
                     
             elif key == arcade.key.DOWN:
                 if self.menu_manager.selected_item is None:
@@ -564,23 +1198,168 @@ class AirHockeyGame(arcade.Window):
                     menu_length = len(self.menu_manager.menu_items.get(self.current_state, []))
                     if menu_length > 0:
                         self.menu_manager.selected_item = (self.menu_manager.selected_item + 1) % menu_length
-                        arcade.play_sound(self.menu_select_sound)
+                        self.audio.play(self.menu_select_sound)
                         
             elif key == arcade.key.ENTER:
                 if self.menu_manager.selected_item is not None:
                     # Simulate clicking the selected item
                     if self.menu_manager.selected_item < len(self.menu_manager.menu_positions):
                         pos = self.menu_manager.menu_positions[self.menu_manager.selected_item]
-                        self.on_mouse_press(
+                        self.handle_click(
                             pos['x'] + 10,
                             pos['y'] + 10,
-                            arcade.MOUSE_BUTTON_LEFT, 0
+                            arcade.MOUSE_BUTTON_LEFT
                         )
+        
+        self.needs_redraw = True
+        self.update_loop_rate()
+
+def run_headless(spectator, seconds, seed=0, settings=None):
+    """Play an AI-vs-AI match without a window as fast as the CPU allows and print its summary"""
+    settings = settings or {'power_ups_enabled': True, 'power_up_frequency': 1}
+    match = simulation.HeadlessMatch(
+        seed, spectator['bottom_difficulty'], spectator['top_difficulty'], spectator['pucks'],
+        power_up_settings=settings, bottom_strategy=spectator['bottom_strategy'],
+        top_strategy=spectator['top_strategy']
+    )
+    start = time.perf_counter()
+    summary = match.run(int(seconds * 60))
+    elapsed = time.perf_counter() - start
+    print(f"AI vs AI: {seconds:g} s simulated in {elapsed:.2f} s ({summary['frames'] / elapsed:.0f} frames/s)")
+    print(f"  score: bottom {summary['bottom_score']}, top {summary['top_score']}")
+    print(f"  paddle hits {summary['paddle_hits']}, wall hits {summary['wall_hits']}, "
+          f"power-ups collected {summary['power_ups_collected']}, "
+          f"mean rally {summary['mean_rally_length']:.1f} hits")
+    print(f"  bottom AI {ai.describe(summary['bottom_ai'])}")
+    print(f"  top AI {ai.describe(summary['top_ai'])}")
+    return summary
 
 def main():
     """Main function to start the game"""
-    window = AirHockeyGame()
-    window.setup()
+    parser = argparse.ArgumentParser(description="Air Hockey")
+    parser.add_argument(
+        "--startup-report", action="store_true",
+        help="print a start-up timing breakdown once the first frame is drawn"
+    )
+    parser.add_argument("--fullscreen", action="store_true", help="start in full screen (F11 toggles)")
+    parser.add_argument(
+        "--render-scale", type=float, default=None,
+        help="internal resolution as a multiple of the 450x680 rink, e.g. 0.5 on slow GPUs "
+             "(default: match the window)"
+    )
+    parser.add_argument(
+        "--quality", choices=[level['name'].lower() for level in QUALITY_LEVELS],
+        help="pin the visual quality level instead of adapting it to the frame rate"
+    )
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE, help="simulation steps per second")
+    parser.add_argument("--draw-rate", type=int, default=DRAW_RATE, help="frames drawn per second")
+    parser.add_argument("--vsync", action="store_true", help="sync drawing to the display refresh")
+    parser.add_argument(
+        "--benchmark", type=float, nargs="?", const=BENCHMARK_SECONDS, default=None, metavar="SECONDS",
+        help="play an endless match drawn as fast as possible and report the sustained FPS"
+    )
+    parser.add_argument(
+        "--latency", type=float, nargs="?", const=BENCHMARK_SECONDS, default=None, metavar="SECONDS",
+        help="play an endless match and report the delay from each mouse event to the screen"
+    )
+    parser.add_argument(
+        "--inject-rate", type=int, default=0, metavar="HZ",
+        help="with --latency, move the paddle with synthetic mouse events at this rate"
+    )
+    parser.add_argument(
+        "--alloc-report", type=float, nargs="?", const=BENCHMARK_SECONDS, default=None, metavar="SECONDS",
+        help="play an endless match and report per-frame allocations and garbage collector pauses"
+    )
+    parser.add_argument(
+        "--freeze-gc", action="store_true",
+        help="freeze the heap and switch off automatic garbage collection while a match is played"
+    )
+    parser.add_argument(
+        "--telemetry", nargs="?", const="", default=None, metavar="PATH",
+        help="record match events to gzip JSON lines, or NumPy columns for a .npz path "
+             "(default: a new file in the user cache directory)"
+    )
+    difficulties = ["easy", "medium", "hard"]
+    parser.add_argument("--ai-vs-ai", action="store_true", help="watch the AI play both paddles")
+    parser.add_argument("--bottom-difficulty", choices=difficulties, default="medium")
+    parser.add_argument("--top-difficulty", choices=difficulties, default="medium")
+    parser.add_argument(
+        "--ai-strategy", choices=list(ai.STRATEGIES), default=AI_STRATEGY,
+        help="AI strategy of the top paddle (trades strength against CPU time, see ai.py)"
+    )
+    parser.add_argument("--bottom-strategy", choices=list(ai.STRATEGIES), default=AI_STRATEGY,
+                        help="AI strategy of the bottom paddle for --ai-vs-ai")
+    parser.add_argument("--speed", type=float, default=1, help="simulation speed multiplier for --ai-vs-ai")
+    parser.add_argument("--pucks", type=int, default=1, help="pucks in play for --ai-vs-ai")
+    parser.add_argument(
+        "--headless", type=float, nargs="?", const=120, default=None, metavar="SECONDS",
+        help="with --ai-vs-ai, simulate this many seconds without a window at full CPU speed"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed for --headless")
+    parser.add_argument(
+        "--stress", action="store_true",
+        help="play an endless match with hundreds of pucks and power-ups and report frame timings"
+    )
+    parser.add_argument("--stress-pucks", type=int, default=STRESS_PUCKS)
+    parser.add_argument("--stress-power-ups", type=int, default=STRESS_POWER_UPS)
+    parser.add_argument("--stress-seconds", type=float, default=STRESS_SECONDS)
+    args = parser.parse_args()
+    if not (math.isfinite(args.speed) and args.speed > 0):
+        parser.error("--speed must be a positive number")
+    
+    quality = None
+    if args.quality:
+        quality = [level['name'].lower() for level in QUALITY_LEVELS].index(args.quality)
+    
+    spectator = None
+    if args.ai_vs_ai:
+        spectator = {
+            'bottom_difficulty': difficulties.index(args.bottom_difficulty),
+            'top_difficulty': difficulties.index(args.top_difficulty),
+            'bottom_strategy': args.bottom_strategy,
+            'top_strategy': args.ai_strategy,
+            'speed': args.speed,
+            'pucks': args.pucks
+        }
+    
+    stress = None
+    if args.stress:
+        stress = {
+            'pucks': args.stress_pucks,
+            'power_ups': args.stress_power_ups,
+            'seconds': args.stress_seconds
+        }
+    
+    # Use the tuned physics profile if one has been generated
+    physics.load_profile()
+    
+    if spectator is not None and args.headless is not None:
+        run_headless(spectator, args.headless, args.seed)
+        return
+    
+    startup = StartupTimer(_start_time)
+    startup.add_phase("imports", _start_time, _imports_done_time)
+    
+    # The match itself is set up when the player chooses Start Game
+    AirHockeyGame(
+        startup_timer=startup,
+        startup_report=args.startup_report,
+        stress=stress,
+        fullscreen=args.fullscreen,
+        render_scale=args.render_scale,
+        quality=quality,
+        tick_rate=args.tick_rate,
+        draw_rate=args.draw_rate,
+        vsync=args.vsync,
+        benchmark=args.benchmark,
+        latency=args.latency,
+        inject_rate=args.inject_rate,
+        alloc_report=args.alloc_report,
+        freeze_gc=args.freeze_gc,
+        ai_strategy=args.ai_strategy,
+        telemetry=args.telemetry or (default_telemetry_path() if args.telemetry is not None else None),
+        spectator=spectator
+    )
     arcade.run()
 
 if __name__ == "__main__":
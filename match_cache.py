@@ -0,0 +1,187 @@
+"""
+Content-addressed cache of headless match results.
+
+A headless match is fully determined by its recipe - the physics values,
+each paddle's AI strategy and difficulty, the match settings, the seed -
+and by the simulation code. match_key hashes the recipe together with a
+hash of the simulation's source files, and MatchCache keeps every match
+summary in an SQLite database under that key. play_all only simulates the
+recipes the cache hasn't seen, so the tuner and the tournament rerunning a
+mostly unchanged sweep cost little more than the new matches. Editing any
+simulation source file changes every key, so stale results are never
+reused; prune() drops them from the database:
+
+    python match_cache.py            # entries, size and stale entries
+    python match_cache.py --prune    # delete the stale entries
+"""
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import physics
+from physics import PHYSICS, DEFAULT_PHYSICS
+from constants import AI_STRATEGY
+from sound_synth import user_cache_dir
+from simulation import HeadlessMatch
+
+# Bump when the recipe or summary format changes
+MATCH_CACHE_VERSION = 1
+
+# Everything a headless match's outcome depends on
+SIMULATION_SOURCES = (
+    'simulation.py', 'game_objects.py', 'ai.py', 'physics.py', 'power_ups.py', 'stuck.py',
+    'spatial.py', 'utils.py', 'events.py', 'constants.py'
+)
+
+_code_version = None
+
+
+def code_version():
+    """Hash of the simulation's source files (computed once per process)"""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(str(MATCH_CACHE_VERSION).encode('utf-8'))
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in SIMULATION_SOURCES:
+            with open(os.path.join(directory, name), 'rb') as f:
+                digest.update(name.encode('utf-8'))
+                digest.update(f.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def new_recipe(seed, frames, bottom_strategy=AI_STRATEGY, bottom_difficulty=1, top_strategy=AI_STRATEGY,
+               top_difficulty=1, pucks=1, power_ups=None, power_up_count=0, physics_values=None):
+    """Describe a headless match completely.
+
+    physics_values defaults to the physics currently in use; missing values
+    take their defaults, as in physics.apply_profile.
+    """
+    values = dict(DEFAULT_PHYSICS)
+    for key, value in (PHYSICS if physics_values is None else physics_values).items():
+        if key in DEFAULT_PHYSICS:
+            values[key] = round(float(value), 9)
+    return {
+        'seed': seed,
+        'frames': frames,
+        'bottom': {'strategy': bottom_strategy, 'difficulty': bottom_difficulty},
+        'top': {'strategy': top_strategy, 'difficulty': top_difficulty},
+        'settings': {'pucks': pucks, 'power_ups': power_ups, 'power_up_count': power_up_count},
+        'physics': values
+    }
+
+
+def match_key(recipe):
+    """Content address of a recipe's result under the current simulation code"""
+    text = json.dumps({'recipe': recipe, 'code': code_version()}, sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def play(recipe):
+    """Simulate a recipe's match and return its summary"""
+    previous = dict(PHYSICS)
+    physics.apply_profile(recipe['physics'])
+    settings = recipe['settings']
+    match = HeadlessMatch(
+        recipe['seed'], recipe['bottom']['difficulty'], recipe['top']['difficulty'], settings['pucks'],
+        power_up_count=settings['power_up_count'], power_up_settings=settings['power_ups'],
+        bottom_strategy=recipe['bottom']['strategy'], top_strategy=recipe['top']['strategy']
+    )
+    summary = match.run(recipe['frames'])
+    physics.apply_profile(previous)
+    return summary
+
+
+class MatchCache:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(user_cache_dir('matches'), 'matches.sqlite')
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "key TEXT PRIMARY KEY, code TEXT NOT NULL, recipe TEXT NOT NULL, summary TEXT NOT NULL)"
+        )
+        self.db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def get(self, key):
+        """The cached summary for a key, or None"""
+        row = self.db.execute("SELECT summary FROM matches WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put_many(self, entries):
+        """Store (key, recipe, summary) entries in one transaction"""
+        code = code_version()
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO matches (key, code, recipe, summary) VALUES (?, ?, ?, ?)",
+                [(key, code, json.dumps(recipe, sort_keys=True), json.dumps(summary))
+                 for key, recipe, summary in entries]
+            )
+
+    def stale(self):
+        """Entries stored by other versions of the simulation code"""
+        return self.db.execute("SELECT COUNT(*) FROM matches WHERE code != ?", (code_version(),)).fetchone()[0]
+
+    def prune(self):
+        """Delete the stale entries and return how many there were"""
+        with self.db:
+            removed = self.db.execute("DELETE FROM matches WHERE code != ?", (code_version(),)).rowcount
+        self.db.execute("VACUUM")
+        return removed
+
+    def close(self):
+        self.db.close()
+
+
+def play_all(recipes, cache=None, workers=None):
+    """Summaries for every recipe, in order, simulating only the ones not cached.
+
+    Identical recipes are simulated once. Returns (summaries, matches simulated).
+    """
+    keys = [match_key(recipe) for recipe in recipes]
+    summaries = [cache.get(key) if cache is not None else None for key in keys]
+
+    todo = {}  # key -> index of the first recipe with that key
+    for i, summary in enumerate(summaries):
+        if summary is None:
+            todo.setdefault(keys[i], i)
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = dict(zip(todo, pool.map(play, [recipes[i] for i in todo.values()])))
+        if cache is not None:
+            cache.put_many([(key, recipes[i], results[key]) for key, i in todo.items()])
+        for i, key in enumerate(keys):
+            if summaries[i] is None:
+                summaries[i] = results[key]
+    return summaries, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or prune the headless match cache")
+    parser.add_argument("--path", default=None, help="cache database (default: in the user cache directory)")
+    parser.add_argument("--prune", action="store_true", help="delete results from older simulation code")
+    args = parser.parse_args(argv)
+
+    cache = MatchCache(args.path)
+    print(f"Match cache {cache.path}: {len(cache)} matches, {cache.stale()} from older simulation code")
+    if args.prune:
+        print(f"  removed {cache.prune()} stale matches")
+    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
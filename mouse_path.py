@@ -0,0 +1,51 @@
+"""
+Timestamped mouse motion.
+
+Pointer events arrive between frames at the mouse's polling rate, often
+several per frame. MotionBuffer keeps every one of them with its arrival
+time instead of only the latest position, and hands them to the game once
+per frame mapped onto simulation time, so the player paddle can be swept
+along the actual path the mouse took.
+"""
+from constants import MOTION_BUFFER_SIZE
+
+
+class MotionBuffer:
+    def __init__(self, capacity=MOTION_BUFFER_SIZE):
+        self.capacity = capacity
+        self.times = [0.0] * capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.count = 0
+        self.dropped = 0  # Samples merged away because the buffer was full
+
+    def add(self, timestamp, x, y):
+        """Record a pointer position (timestamp from time.perf_counter)"""
+        if self.count == self.capacity:
+            # Full: the newest sample replaces the last one so the path still ends where the mouse is
+            self.count -= 1
+            self.dropped += 1
+        index = self.count
+        self.times[index] = timestamp
+        self.xs[index] = x
+        self.ys[index] = y
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def drain(self, wall_start, wall_end, sim_start, sim_span, path):
+        """Move every buffered sample into path as (sim_time, x, y) and empty the buffer.
+
+        Arrival times between wall_start and wall_end (the real time covered by
+        this frame's ticks) are mapped linearly onto sim_start..sim_start+sim_span.
+        """
+        wall_span = wall_end - wall_start
+        for i in range(self.count):
+            if wall_span > 0:
+                fraction = (self.times[i] - wall_start) / wall_span
+                fraction = min(1.0, max(0.0, fraction))
+            else:
+                fraction = 1.0
+            path.append((sim_start + fraction * sim_span, self.xs[i], self.ys[i]))
+        self.count = 0
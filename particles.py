@@ -0,0 +1,109 @@
+"""
+Preallocated particle storage.
+
+Sparks from hits and goals used to be one dict per particle, created on
+every impact and dropped a few frames later, which kept the allocator and
+the garbage collector busy during play. ParticlePool keeps every particle
+field in its own fixed-size array instead: spawning writes into free
+slots, updating compacts the live particles in place, and nothing is
+allocated once the pool exists.
+"""
+import math
+import random
+from array import array
+import arcade
+from constants import QUALITY_LEVELS
+
+# Enough for the most detailed quality level
+PARTICLE_CAPACITY = max(level['max_particles'] for level in QUALITY_LEVELS)
+
+
+class ParticlePool:
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.dx = array('d', bytes(8 * capacity))
+        self.dy = array('d', bytes(8 * capacity))
+        self.radius = array('d', bytes(8 * capacity))
+        self.original_radius = array('d', bytes(8 * capacity))
+        self.lifetime = array('d', bytes(8 * capacity))
+        self.max_lifetime = array('d', bytes(8 * capacity))
+        self.colors = [None] * capacity
+        self.count = 0  # Live particles, oldest first, in slots 0..count-1
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        for i in range(self.count):
+            self.colors[i] = None
+        self.count = 0
+
+    def spawn(self, x, y, color, count=10):
+        """Add up to count particles bursting from (x, y); returns how many fit"""
+        count = min(count, self.capacity - self.count)
+        for i in range(self.count, self.count + count):
+            angle = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(1, 3)
+            lifetime = random.uniform(0.2, 0.5)
+            radius = random.uniform(2, 5)
+            self.x[i] = x
+            self.y[i] = y
+            self.dx[i] = math.cos(angle) * speed
+            self.dy[i] = math.sin(angle) * speed
+            self.radius[i] = radius
+            self.original_radius[i] = radius
+            self.lifetime[i] = lifetime
+            self.max_lifetime[i] = lifetime
+            self.colors[i] = color
+        self.count += count
+        return count
+
+    def update(self, delta_time, step=1.0):
+        """Move every particle, shrink it as it ages and drop the expired ones.
+
+        Velocities are in pixels per 1/60 s and step is the tick length in
+        those units, as in Puck.update.
+        """
+        kept = 0
+        for i in range(self.count):
+            lifetime = self.lifetime[i] - delta_time
+            if lifetime <= 0:
+                continue
+            if kept != i:
+                self._move(i, kept)
+            self.x[kept] += self.dx[kept] * step
+            self.y[kept] += self.dy[kept] * step
+            self.lifetime[kept] = lifetime
+            self.radius[kept] = self.original_radius[kept] * (lifetime / self.max_lifetime[kept])
+            kept += 1
+        for i in range(kept, self.count):
+            self.colors[i] = None
+        self.count = kept
+
+    def limit(self, maximum):
+        """Drop the oldest particles so that at most maximum are left"""
+        extra = self.count - maximum
+        if extra <= 0:
+            return
+        for i in range(maximum):
+            self._move(i + extra, i)
+        for i in range(maximum, self.count):
+            self.colors[i] = None
+        self.count = maximum
+
+    def _move(self, source, target):
+        self.x[target] = self.x[source]
+        self.y[target] = self.y[source]
+        self.dx[target] = self.dx[source]
+        self.dy[target] = self.dy[source]
+        self.radius[target] = self.radius[source]
+        self.original_radius[target] = self.original_radius[source]
+        self.lifetime[target] = self.lifetime[source]
+        self.max_lifetime[target] = self.max_lifetime[source]
+        self.colors[target] = self.colors[source]
+
+    def draw(self):
+        for i in range(self.count):
+            arcade.draw_circle_filled(self.x[i], self.y[i], self.radius[i], self.colors[i])
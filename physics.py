@@ -0,0 +1,58 @@
+"""
+Live physics profile.
+
+The puck and paddle physics read their tunable constants from the PHYSICS
+dict instead of module-level constants, so a profile produced by the tuner
+(see tuner.py) can be loaded at start-up, and candidates can be swapped in
+between simulated matches.
+"""
+import os
+import json
+from constants import (
+    FRICTION, WALL_BOUNCE_DAMPING, PUCK_MAX_SPEED,
+    PADDLE_RESTITUTION, PADDLE_MOMENTUM_FACTOR, PHYSICS_PROFILE_FILE
+)
+
+DEFAULT_PHYSICS = {
+    'friction': FRICTION,
+    'wall_bounce_damping': WALL_BOUNCE_DAMPING,
+    'max_speed': PUCK_MAX_SPEED,
+    'restitution': PADDLE_RESTITUTION,
+    'momentum_factor': PADDLE_MOMENTUM_FACTOR
+}
+
+# The values the game is currently using
+PHYSICS = dict(DEFAULT_PHYSICS)
+
+
+def apply_profile(values):
+    """Use the given physics values; unknown keys are ignored, missing ones keep their defaults"""
+    PHYSICS.clear()
+    PHYSICS.update(DEFAULT_PHYSICS)
+    for key, value in values.items():
+        if key in DEFAULT_PHYSICS:
+            PHYSICS[key] = float(value)
+
+
+def load_profile(path=PHYSICS_PROFILE_FILE):
+    """Apply a saved profile if the file exists. Returns True if one was loaded."""
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        apply_profile(data.get('physics', {}))
+        return True
+    except (OSError, ValueError) as e:
+        print(f"Could not load physics profile {path}: {e}")
+        return False
+
+
+def save_profile(values, path=PHYSICS_PROFILE_FILE, **details):
+    """Write a profile; extra keyword arguments (score, metrics...) are stored alongside"""
+    data = {'physics': {key: values[key] for key in DEFAULT_PHYSICS if key in values}}
+    data.update(details)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
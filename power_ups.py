@@ -1,12 +1,216 @@
 import math
+import heapq
 import random
 import arcade
-from constants import PADDLE_RADIUS, PUCK_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT, GOAL_WIDTH
+import utils
+from events import POWERUP_COLLECTED, POWERUP_SPAWNED, FREEZE
+from spatial import SpatialHash
+from constants import (
+    PADDLE_RADIUS, PUCK_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT, GOAL_WIDTH,
+    POWER_UP_RADIUS, POWER_UP_SPAWN_TIMES, POWER_UP_MAX_COUNTS
+)
+
+# Stacking rules for picking up an effect that is already running on the paddle
+STACK_REFRESH = 'refresh'  # Restart the timer at the full duration
+STACK_EXTEND = 'extend'  # Add the full duration to the time left
+STACK_IGNORE = 'ignore'  # Keep the running effect untouched
+
+
+class PowerUpEffect:
+    """Definition of one power-up type: how it looks, what it does and for how long"""
+
+    def __init__(self, name, color, icon, duration, apply, revert, stacking=STACK_REFRESH, icon_size=20,
+                 event=None):
+        self.name = name
+        self.color = color
+        self.icon = icon
+        self.icon_size = icon_size
+        self.duration = duration  # Seconds
+        self.apply = apply  # apply(paddle, pucks)
+        self.revert = revert  # revert(paddle, pucks), called when the effect expires
+        self.stacking = stacking
+        self.event = event  # Extra event type emitted when the effect takes hold
+
+
+# Every power-up type that can spawn, by name. Registering an effect here is
+# all it takes to add a new power-up.
+POWER_UP_EFFECTS = {}
+
+
+def register_effect(effect):
+    POWER_UP_EFFECTS[effect.name] = effect
+    return effect
+
+
+def power_up_color(power_up):
+    """The color a power-up is drawn in (its effect's color)"""
+    return POWER_UP_EFFECTS[power_up.type].color
+
+
+def _apply_speed(paddle, pucks):
+    # Speed boost affects pucks when hit by this paddle
+    for puck in pucks:
+        puck.speed_boost = True
+    # Allow paddle to cross midline with speed power-up
+    paddle.can_cross_midline = True
+
+
+def _revert_speed(paddle, pucks):
+    for puck in pucks:
+        puck.speed_boost = False
+    paddle.can_cross_midline = False
+
+
+def _apply_size(paddle, pucks):
+    paddle.radius = PADDLE_RADIUS * 1.5
+
+
+def _revert_size(paddle, pucks):
+    paddle.radius = PADDLE_RADIUS
+
+
+def _apply_freeze(paddle, pucks):
+    if paddle.opponent_paddle:
+        paddle.opponent_paddle.is_frozen = True
+        for puck in pucks:
+            puck.freeze_opponent = True  # Mark that freeze is active
+
+
+def _revert_freeze(paddle, pucks):
+    if paddle.opponent_paddle:
+        paddle.opponent_paddle.is_frozen = False
+    for puck in pucks:
+        puck.freeze_opponent = False
+
+
+def _apply_multi_puck(paddle, pucks):
+    paddle.multi_puck_active = True
+
+
+def _revert_multi_puck(paddle, pucks):
+    paddle.multi_puck_active = False
+
+
+def _apply_goal_shrink(paddle, pucks):
+    # Shrink the player's OWN goal, not the opponent's
+    paddle.goal_shrink_active = True
+
+
+def _revert_goal_shrink(paddle, pucks):
+    paddle.goal_shrink_active = False
+
+
+def _apply_repulsor(paddle, pucks):
+    for puck in pucks:
+        puck.repulsor_active = True
+        puck.repulsor_owner = paddle
+
+
+def _revert_repulsor(paddle, pucks):
+    # The opponent may have taken the repulsor over in the meantime
+    for puck in pucks:
+        if puck.repulsor_owner is paddle:
+            puck.repulsor_active = False
+            puck.repulsor_owner = None
+
+
+register_effect(PowerUpEffect('speed', arcade.color.YELLOW, "⚡", 10.0, _apply_speed, _revert_speed))
+register_effect(PowerUpEffect('size', arcade.color.GREEN, "+", 10.0, _apply_size, _revert_size))
+# Freeze is always 3 seconds for balance, and can't be chained
+register_effect(PowerUpEffect('freeze', arcade.color.CYAN, "❄", 3.0, _apply_freeze, _revert_freeze,
+                              stacking=STACK_IGNORE, event=FREEZE))
+register_effect(PowerUpEffect('multi_puck', arcade.color.ORANGE, "◉◉◉", 5.0, _apply_multi_puck,
+                              _revert_multi_puck, icon_size=14))
+register_effect(PowerUpEffect('goal_shrink', arcade.color.PURPLE, "⊏⊐", 5.0, _apply_goal_shrink,
+                              _revert_goal_shrink))
+register_effect(PowerUpEffect('repulsor', arcade.color.RED, "↗", 5.0, _apply_repulsor, _revert_repulsor))
+
+
+class _ScheduledEffect:
+    """One running effect on one paddle"""
+
+    def __init__(self, effect, paddle, pucks, expires_at):
+        self.effect = effect
+        self.paddle = paddle
+        self.pucks = pucks
+        self.expires_at = expires_at
+        self.cancelled = False  # Superseded by a refresh/extend; skipped when popped
+
+
+class EffectScheduler:
+    """Running power-up effects, expired from a min-heap of expiry times.
+
+    A frame where nothing expires only compares the clock against the top of
+    the heap, however many effects are running.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.heap = []  # (expires_at, sequence, _ScheduledEffect)
+        self.active = {}  # (effect name, paddle) -> _ScheduledEffect
+        self.sequence = 0  # Tie-breaker so the heap never compares entries
+
+    def clear(self):
+        """Forget every running effect without reverting it (the paddles are being replaced)"""
+        self.time = 0.0
+        self.heap = []
+        self.active = {}
+
+    def apply(self, name, paddle, pucks):
+        """Start effect name for paddle, following the effect's stacking rule.
+
+        Returns False if the stacking rule left a running effect untouched.
+        """
+        effect = POWER_UP_EFFECTS[name]
+        key = (name, paddle)
+        running = self.active.get(key)
+        
+        if running is None:
+            expires_at = self.time + effect.duration
+            paddle.active_effects += 1
+            paddle.power_up_active = True
+        elif effect.stacking == STACK_IGNORE:
+            return False
+        else:
+            if effect.stacking == STACK_EXTEND:
+                expires_at = running.expires_at + effect.duration
+            else:
+                expires_at = self.time + effect.duration
+            running.cancelled = True
+        
+        effect.apply(paddle, pucks)
+        scheduled = _ScheduledEffect(effect, paddle, pucks, expires_at)
+        self.active[key] = scheduled
+        self.sequence += 1
+        heapq.heappush(self.heap, (expires_at, self.sequence, scheduled))
+        return True
+
+    def update(self, delta_time):
+        """Advance the clock and revert every effect whose time is up"""
+        self.time += delta_time
+        heap = self.heap
+        while heap and heap[0][0] <= self.time:
+            scheduled = heapq.heappop(heap)[2]
+            if scheduled.cancelled:
+                continue
+            paddle = scheduled.paddle
+            del self.active[(scheduled.effect.name, paddle)]
+            scheduled.effect.revert(paddle, scheduled.pucks)
+            paddle.active_effects -= 1
+            paddle.power_up_active = paddle.active_effects > 0
+
+    def time_left(self, name, paddle):
+        """Seconds until effect name runs out on paddle, or 0 if it isn't running"""
+        running = self.active.get((name, paddle))
+        return running.expires_at - self.time if running else 0.0
+
 
 class PowerUp:
+    __slots__ = ('radius', 'x', 'y', 'type', 'lifetime', 'pulse_time')
+
     def __init__(self, x=None, y=None, power_type=None):
         # Define radius first so it can be used in position calculations
-        self.radius = 15
+        self.radius = POWER_UP_RADIUS
         
         # If coordinates or type not specified, generate random ones
         if x is None or y is None:
@@ -20,8 +224,7 @@ class PowerUp:
             self.y = y
             
         if power_type is None:
-            power_up_types = ['speed', 'size', 'freeze', 'multi_puck', 'goal_shrink', 'repulsor']
-            self.type = random.choice(power_up_types)
+            self.type = random.choice(list(POWER_UP_EFFECTS))
         else:
             self.type = power_type
             
@@ -42,81 +245,17 @@ class PowerUp:
         
         return distance <= paddle.radius + self.radius
         
-    def apply(self, paddle, puck, duration=10.0):
-        """Apply power-up effects to paddle"""
-        paddle.power_up_active = True
-        
-        # Default power-up duration of 5 seconds for new power-ups
-        power_up_duration = 5.0
-        
-        # Set different durations based on power-up type
-        if self.type == 'freeze':
-            # Freeze is always 3 seconds for balance
-            freeze_duration = 3.0
-            paddle.power_up_time = power_up_duration
-            
-            # Freeze opponent paddle
-            if paddle.opponent_paddle:
-                paddle.opponent_paddle.is_frozen = True
-                paddle.opponent_paddle.freeze_timer = freeze_duration
-                puck.freeze_opponent = True  # Mark that freeze is active
-        
-        elif self.type == 'multi_puck':
-            paddle.multi_puck_active = True
-            paddle.power_up_time = power_up_duration
-        
-        elif self.type == 'goal_shrink':
-            # Shrink the player's OWN goal, not the opponent's
-            paddle.goal_shrink_active = True
-            paddle.goal_shrink_timer = power_up_duration
-            paddle.power_up_time = power_up_duration
-        
-        elif self.type == 'repulsor':
-            puck.repulsor_active = True
-            puck.repulsor_owner = paddle
-            paddle.power_up_time = power_up_duration
-        
-        else:
-            # Regular power-up duration for original power-ups
-            paddle.power_up_time = duration
-            
-            if self.type == 'speed':
-                # Speed boost affects puck when hit by this paddle
-                puck.speed_boost = True
-                # Allow paddle to cross midline with speed power-up
-                paddle.can_cross_midline = True
-                
-            elif self.type == 'size':
-                # Increase paddle size
-                paddle.radius = PADDLE_RADIUS * 1.5
-            
-    def draw(self):
+    def draw(self, pulse_enabled=True, show_icon=True):
         """Draw the power-up with pulsing effect"""
         # Set color and icon based on type
-        if self.type == 'speed':
-            color = arcade.color.YELLOW
-            icon = "⚡"
-        elif self.type == 'size':
-            color = arcade.color.GREEN
-            icon = "+"
-        elif self.type == 'freeze':
-            color = arcade.color.CYAN
-            icon = "❄"
-        elif self.type == 'multi_puck':
-            color = arcade.color.ORANGE
-            icon = "◉◉◉"
-        elif self.type == 'goal_shrink':
-            color = arcade.color.PURPLE
-            icon = "⊏⊐"
-        elif self.type == 'repulsor':
-            color = arcade.color.RED
-            icon = "↗"
-        else:
-            color = arcade.color.WHITE
-            icon = "?"
+        effect = POWER_UP_EFFECTS[self.type]
+        color = effect.color
         
         # Calculate pulse effect based on pulse_time
-        pulse = math.sin(self.pulse_time * 5) * 0.2 + 1.0  # Pulse between 0.8 and 1.2 scale
+        if pulse_enabled:
+            pulse = math.sin(self.pulse_time * 5) * 0.2 + 1.0  # Pulse between 0.8 and 1.2 scale
+        else:
+            pulse = 1.0
         
         # Draw background circle with pulse effect
         arcade.draw_circle_filled(
@@ -135,13 +274,105 @@ class PowerUp:
         )
         
         # Draw icon
-        text_size = 14 if self.type == 'multi_puck' else 20
-        arcade.draw_text(
-            icon,
-            self.x,
-            self.y,
-            arcade.color.BLACK,
-            text_size,
-            anchor_x="center",
-            anchor_y="center"
-        )
\ No newline at end of file
+        if show_icon:
+            arcade.draw_text(
+                effect.icon,
+                self.x,
+                self.y,
+                arcade.color.BLACK,
+                effect.icon_size,
+                anchor_x="center",
+                anchor_y="center"
+            )
+
+
+class PowerUpField:
+    """The power-ups lying on the rink: spawning, lifetimes, pickups and expiry"""
+
+    def __init__(self):
+        self.power_ups = []
+        self.spawn_timer = 0
+        self.collected = 0  # Pickups since the field was created
+        self.effects = EffectScheduler()
+        # Cell size covers the largest pickup distance (enlarged paddle + power-up)
+        self.grid = SpatialHash(PADDLE_RADIUS * 1.5 + POWER_UP_RADIUS)
+
+    def reset(self):
+        self.power_ups = []
+        self.spawn_timer = 0
+        self.effects.clear()
+
+    def spawn_anywhere(self, count, events=None):
+        """Scatter power-ups over the whole rink (used by the stress mode)"""
+        for _ in range(count):
+            power_up = PowerUp(0, 0)
+            # Retry until the power-up fits inside the rounded rink
+            while True:
+                x = random.uniform(power_up.radius, SCREEN_WIDTH - power_up.radius)
+                y = random.uniform(power_up.radius, SCREEN_HEIGHT - power_up.radius)
+                if utils.is_valid_position(x, y, power_up.radius):
+                    break
+            power_up.x = x
+            power_up.y = y
+            self.add(power_up, events)
+
+    def add(self, power_up, events=None):
+        self.power_ups.append(power_up)
+        if events is not None:
+            events.emit(POWERUP_SPAWNED, power_up.x, power_up.y, detail=power_up.type)
+
+    def update(self, delta_time, paddles, pucks, settings, events=None, target_count=None):
+        """Advance power-ups by one frame.
+
+        target_count keeps that many power-ups spread over the rink instead of
+        the normal center-line spawning (stress mode).
+        """
+        # Expire running effects - only the ones whose time is up are touched
+        self.effects.update(delta_time)
+        
+        # If power-ups are disabled, clear any existing ones and return
+        if not settings['power_ups_enabled']:
+            self.power_ups.clear()
+            return
+        
+        if target_count is not None:
+            if len(self.power_ups) < target_count:
+                self.spawn_anywhere(target_count - len(self.power_ups), events)
+        else:
+            # Spawn new power-ups periodically based on frequency setting
+            self.spawn_timer += delta_time
+            spawn_time = POWER_UP_SPAWN_TIMES[settings['power_up_frequency']]
+            max_count = POWER_UP_MAX_COUNTS[settings['power_up_frequency']]
+            
+            if self.spawn_timer > spawn_time and len(self.power_ups) < max_count:
+                # Create a new power-up that will only spawn on the center line
+                self.add(PowerUp(), events)
+                self.spawn_timer = 0
+        
+        # Check for power-up collisions - only power-ups in the grid cells
+        # around each paddle are tested
+        if not self.power_ups:
+            return
+        grid = self.grid
+        grid.build(self.power_ups)
+        for paddle in paddles:
+            for power_up in grid.query(paddle.x, paddle.y, paddle.radius + POWER_UP_RADIUS):
+                if power_up.lifetime > 0 and power_up.check_collision(paddle):
+                    applied = self.effects.apply(power_up.type, paddle, pucks)
+                    if events is not None:
+                        events.emit(POWERUP_COLLECTED, power_up.x, power_up.y, 0.0, paddle, detail=power_up.type)
+                        effect_event = POWER_UP_EFFECTS[power_up.type].event
+                        if applied and effect_event is not None:
+                            events.emit(effect_event, paddle.x, paddle.y, 0.0, paddle, detail=power_up.type)
+                    power_up.lifetime = 0  # Removed below
+                    self.collected += 1
+        
+        # Update lifetimes and drop expired/collected power-ups in one pass
+        kept = 0
+        power_ups = self.power_ups
+        for power_up in power_ups:
+            if power_up.lifetime > 0 and not power_up.update(delta_time):
+                power_ups[kept] = power_up
+                kept += 1
+        del power_ups[kept:]
+
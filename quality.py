@@ -0,0 +1,67 @@
+"""
+Adaptive visual quality.
+
+QualityGovernor watches how long each frame's update and draw work takes
+compared with the frame budget and steps through QUALITY_LEVELS (particle
+caps, paddle glow rings, power-up pulse, repulsor arrow, icon text). It steps
+down as soon as a window of frames runs over budget but only steps up after
+several windows with plenty of headroom, so it doesn't flip back and forth
+around the threshold.
+"""
+from constants import (
+    QUALITY_LEVELS, DEFAULT_QUALITY, QUALITY_WINDOW, QUALITY_DOWNGRADE_LOAD,
+    QUALITY_UPGRADE_LOAD, QUALITY_UPGRADE_WINDOWS, FRAME_BUDGET
+)
+
+
+class QualityGovernor:
+    def __init__(self, level=DEFAULT_QUALITY, budget=FRAME_BUDGET, enabled=True):
+        self.level = level
+        self.budget = budget
+        self.enabled = enabled  # When False the level stays where it is set
+        self.frames = 0
+        self.total = 0.0  # Frame work in the current window, seconds
+        self.good_windows = 0  # Consecutive windows with room to step up
+        self.load = 0.0  # Last window's average work as a share of the budget
+        self.changes = 0
+
+    @property
+    def settings(self):
+        """The current level's entry in QUALITY_LEVELS"""
+        return QUALITY_LEVELS[self.level]
+
+    def set_level(self, level):
+        self.level = max(0, min(len(QUALITY_LEVELS) - 1, level))
+        self.good_windows = 0
+
+    def record(self, seconds):
+        """Add one frame's update+draw time. Returns True when the level changed."""
+        self.frames += 1
+        self.total += seconds
+        if self.frames < QUALITY_WINDOW:
+            return False
+
+        self.load = self.total / self.frames / self.budget
+        self.frames = 0
+        self.total = 0.0
+        if not self.enabled:
+            return False
+
+        if self.load > QUALITY_DOWNGRADE_LOAD and self.level > 0:
+            self.set_level(self.level - 1)
+            self.changes += 1
+            return True
+
+        if self.load < QUALITY_UPGRADE_LOAD and self.level < len(QUALITY_LEVELS) - 1:
+            self.good_windows += 1
+            if self.good_windows >= QUALITY_UPGRADE_WINDOWS:
+                self.set_level(self.level + 1)
+                self.changes += 1
+                return True
+        else:
+            self.good_windows = 0
+        return False
+
+    def describe(self):
+        """Short status line for the debug overlay"""
+        return f"Quality: {self.settings['name']} ({self.load * 100:.0f}% of frame budget)"
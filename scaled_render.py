@@ -0,0 +1,120 @@
+"""
+Offscreen rendering at an internal resolution.
+
+The game always draws in rink coordinates (SCREEN_WIDTH x SCREEN_HEIGHT).
+ScaledRenderer points those draws at an offscreen framebuffer of a chosen
+size and then stretches the result onto the window, letterboxed to keep the
+rink's aspect ratio. A render scale below 1 saves fill rate on slow GPUs;
+with no fixed scale the framebuffer follows the on-screen size of the rink,
+so high-DPI and full-screen windows stay sharp.
+
+freeze() keeps a copy of the last frame (the game behind the pause menu),
+which draw_frozen() puts back without drawing the rink again.
+"""
+import arcade
+from arcade.camera import Camera2D
+from arcade.gl import geometry
+from arcade.types import LBWH, LRBT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class ScaledRenderer:
+    def __init__(self, window, render_scale=None):
+        self.window = window
+        self.ctx = window.ctx
+        self.render_scale = render_scale  # None: match the output size
+        self.quad = geometry.quad_2d_fs()
+        self.program = self.ctx.utility_textured_quad_program
+        self.framebuffer = None
+        self.frozen = None  # Copy of a finished frame, see freeze()
+        self.camera = None
+        # Letterboxed rink area in window coordinates (left, bottom, width, height)
+        self.output = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.resize(*window.get_size())
+
+    def internal_size(self):
+        """Size of the offscreen framebuffer in pixels"""
+        if self.render_scale is not None:
+            scale = self.render_scale
+        else:
+            # One framebuffer pixel per physical screen pixel under the rink
+            scale = self.output[2] / SCREEN_WIDTH * self.window.get_pixel_ratio()
+        return max(1, round(SCREEN_WIDTH * scale)), max(1, round(SCREEN_HEIGHT * scale))
+
+    def set_render_scale(self, render_scale):
+        self.render_scale = render_scale
+        self.resize(*self.window.get_size())
+
+    def resize(self, width, height):
+        """Recompute the letterbox for a new window size and resize the framebuffer if needed"""
+        scale = min(width / SCREEN_WIDTH, height / SCREEN_HEIGHT)
+        out_width = SCREEN_WIDTH * scale
+        out_height = SCREEN_HEIGHT * scale
+        self.output = ((width - out_width) / 2, (height - out_height) / 2, out_width, out_height)
+
+        size = self.internal_size()
+        if self.framebuffer is not None and self.framebuffer.size == size:
+            return
+        texture = self.ctx.texture(size, components=4)
+        # Smooth upscaling; downscaling from a larger buffer is a plain supersample
+        texture.filter = (self.ctx.LINEAR, self.ctx.LINEAR)
+        self.framebuffer = self.ctx.framebuffer(color_attachments=[texture])
+        self.camera = Camera2D(
+            viewport=LBWH(0, 0, size[0], size[1]),
+            # The projection is relative to the camera position, so center it on the rink
+            position=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2),
+            projection=LRBT(-SCREEN_WIDTH / 2, SCREEN_WIDTH / 2, -SCREEN_HEIGHT / 2, SCREEN_HEIGHT / 2),
+            render_target=self.framebuffer,
+            window=self.window
+        )
+
+    def begin(self, background=arcade.color.BLACK):
+        """Start drawing a frame into the offscreen framebuffer"""
+        self.camera.use()
+        self.framebuffer.clear(color=background)
+
+    def end(self):
+        """Scale the finished frame onto the window"""
+        window = self.window
+        self.ctx.screen.use()
+        window.default_camera.use()
+        window.clear()
+
+        # The viewport is in framebuffer pixels, which differ from window
+        # coordinates on high-DPI displays
+        ratio = window.get_pixel_ratio()
+        left, bottom, width, height = self.output
+        self.ctx.viewport = (
+            int(left * ratio), int(bottom * ratio),
+            int(width * ratio), int(height * ratio)
+        )
+        self.framebuffer.color_attachments[0].use(0)
+        self.quad.render(self.program)
+        window.default_camera.use()
+
+    def freeze(self):
+        """Keep a copy of the frame currently in the offscreen framebuffer"""
+        size = self.framebuffer.size
+        if self.frozen is None or self.frozen.size != size:
+            texture = self.ctx.texture(size, components=4)
+            texture.filter = (self.ctx.LINEAR, self.ctx.LINEAR)
+            self.frozen = self.ctx.framebuffer(color_attachments=[texture])
+        self.ctx.copy_framebuffer(self.framebuffer, self.frozen)
+
+    def draw_frozen(self):
+        """Fill the frame being drawn (between begin() and end()) with the frozen copy"""
+        if self.frozen is None:
+            return False
+        self.frozen.color_attachments[0].use(0)
+        self.quad.render(self.program)
+        return True
+
+    def to_rink(self, x, y):
+        """Convert window coordinates (e.g. the mouse) to rink coordinates"""
+        left, bottom, width, height = self.output
+        return (x - left) * SCREEN_WIDTH / width, (y - bottom) * SCREEN_HEIGHT / height
+
+    def from_rink(self, x, y):
+        """Convert rink coordinates to window coordinates"""
+        left, bottom, width, height = self.output
+        return left + x * width / SCREEN_WIDTH, bottom + y * height / SCREEN_HEIGHT
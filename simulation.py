@@ -0,0 +1,217 @@
+"""
+Headless AI-vs-AI matches.
+
+Runs the same puck/paddle physics as the game without a window, sound or
+particles, as fast as the CPU allows. Used by the physics tuner and other
+batch tools. Each paddle is driven by an AI strategy (ai.py); the top one
+plays it directly, the bottom one in a vertically mirrored frame of
+reference.
+"""
+import math
+import random
+import utils
+import ai
+from constants import PUCK_RADIUS, EVENT_QUEUE_CAPACITY, AI_STRATEGY
+from events import EventQueue, GOAL
+from game_objects import (
+    Puck, Paddle, MirroredPuck, resolve_puck_collisions, most_threatening_puck, update_mirrored_ai
+)
+from power_ups import PowerUpField
+from spatial import SpatialHash
+from stuck import StuckMonitor
+
+# Puck speed histogram bin edges used in match summaries
+SPEED_BINS = [0, 2, 5, 10, 15, 20, 30, 50]
+
+FRAME_TIME = 1 / 60  # Simulated seconds per step
+
+# Power-up settings used when a headless match has power-ups on the rink
+POWER_UP_SETTINGS = {'power_ups_enabled': True, 'power_up_frequency': 1}
+
+
+class HeadlessMatch:
+    def __init__(self, seed=0, bottom_difficulty=1, top_difficulty=1, puck_count=1, power_up_count=0,
+                 power_up_settings=None, bottom_strategy=AI_STRATEGY, top_strategy=AI_STRATEGY):
+        self.seed = seed
+        self.bottom_difficulty = bottom_difficulty
+        self.top_difficulty = top_difficulty
+        self.bottom_ai = ai.create(bottom_strategy, bottom_difficulty)
+        self.top_ai = ai.create(top_strategy, top_difficulty)
+
+        # Puck.reset draws from the global random module, so seed it per match
+        random.seed(seed)
+
+        self.bottom_paddle = Paddle(is_ai=False)
+        self.top_paddle = Paddle(is_ai=True)
+        self.bottom_paddle.opponent_paddle = self.top_paddle
+        self.top_paddle.opponent_paddle = self.bottom_paddle
+        self.pucks = []
+        for x, y in utils.faceoff_positions(puck_count, PUCK_RADIUS):
+            puck = Puck()
+            puck.x = x
+            puck.y = y
+            puck.opponent_paddle = self.top_paddle
+            self.pucks.append(puck)
+        self.puck = self.pucks[0]
+        self.puck_grid = SpatialHash(PUCK_RADIUS * 2)
+        self.mirror = MirroredPuck()
+        self.stuck_monitor = StuckMonitor(FRAME_TIME)
+        
+        # Power-ups are off by default. power_up_count keeps that many spread over
+        # the rink; power_up_settings spawns them as in the game instead.
+        self.power_up_count = power_up_count or None
+        self.power_up_settings = power_up_settings or POWER_UP_SETTINGS
+        self.power_up_field = PowerUpField() if power_up_count or power_up_settings else None
+
+        self.frame = 0
+        self.bottom_score = 0
+        self.top_score = 0
+        self.paddle_hits = 0
+        self.wall_hits = 0
+        self.rally_hits = 0  # Paddle hits since the last face-off
+        self.rally_lengths = []
+
+        # Puck speed distribution, accumulated once per frame for every puck
+        self.speed_samples = 0
+        self.speed_sum = 0.0
+        self.speed_max = 0.0
+        self.speed_histogram = [0] * len(SPEED_BINS)
+
+    def step(self, events=None):
+        """Advance the match by one frame. Returns the last scorer ("PLAYER"/"AI") or None.
+
+        Runs in the same order as AirHockeyGame.update_game: AIs, pucks and
+        walls, puck-puck and paddle collisions, goals, stuck pucks, power-ups.
+        """
+        pucks = self.pucks
+        if len(pucks) == 1:
+            bottom_target = top_target = self.puck
+        else:
+            bottom_target = most_threatening_puck(pucks, defending_top=False)
+            top_target = most_threatening_puck(pucks, defending_top=True)
+        self.top_ai.update(self.top_paddle, top_target)
+        update_mirrored_ai(self.bottom_paddle, bottom_target, self.bottom_ai, self.mirror)
+
+        for puck in pucks:
+            puck.update()
+            if puck.handle_boundary_collision(events):
+                self.wall_hits += 1
+        resolve_puck_collisions(pucks, self.puck_grid, events)
+        for puck in pucks:
+            if self.bottom_paddle.check_collision_with_puck(puck, events):
+                self.paddle_hits += 1
+                self.rally_hits += 1
+            if self.top_paddle.check_collision_with_puck(puck, events):
+                self.paddle_hits += 1
+                self.rally_hits += 1
+
+        # Speeds are sampled before scoring pucks are reset to the face-off
+        histogram = self.speed_histogram
+        for puck in pucks:
+            speed = math.sqrt(puck.dx**2 + puck.dy**2)
+            self.speed_sum += speed
+            if speed > self.speed_max:
+                self.speed_max = speed
+            bin_index = len(SPEED_BINS) - 1
+            while SPEED_BINS[bin_index] > speed:
+                bin_index -= 1
+            histogram[bin_index] += 1
+        self.speed_samples += len(pucks)
+
+        last_scorer = None
+        for puck in pucks:
+            scorer = puck.is_in_goal()
+            if scorer:
+                if events is not None:
+                    # Where the puck crossed the line, with its shot speed
+                    events.emit(GOAL, puck.x, puck.y, math.sqrt(puck.dx**2 + puck.dy**2), scorer)
+                if scorer == "PLAYER":
+                    self.bottom_score += 1
+                else:
+                    self.top_score += 1
+                self.rally_lengths.append(self.rally_hits)
+                self.rally_hits = 0
+                puck.reset()
+                last_scorer = scorer
+        self.stuck_monitor.update(pucks, events)
+
+        field = self.power_up_field
+        if field is not None:
+            field.update(FRAME_TIME, (self.bottom_paddle, self.top_paddle), pucks,
+                         self.power_up_settings, events, self.power_up_count)
+
+        self.frame += 1
+        return last_scorer
+
+    def run(self, frames, telemetry=None):
+        """Play the given number of frames and return the match summary.
+
+        With a started TelemetryRecorder every event and periodic sample of
+        the match is recorded as well.
+        """
+        if telemetry is None:
+            for _ in range(frames):
+                self.step()
+            return self.summary()
+        
+        events = EventQueue(EVENT_QUEUE_CAPACITY)
+        telemetry.attach(events)
+        telemetry.new_match()
+        paddles = (self.bottom_paddle, self.top_paddle)
+        for _ in range(frames):
+            self.step(events)
+            telemetry.time = self.frame * FRAME_TIME
+            telemetry.sample(self.pucks, paddles)
+            events.dispatch()
+        telemetry.detach(events)
+        return self.summary()
+
+    def summary(self):
+        """Outcome and statistics of the match so far"""
+        goals = self.bottom_score + self.top_score
+        minutes = self.frame / 3600.0  # 60 frames per second
+        rallies = self.rally_lengths + ([self.rally_hits] if self.rally_hits else [])
+        return {
+            'seed': self.seed,
+            'frames': self.frame,
+            'bottom_score': self.bottom_score,
+            'top_score': self.top_score,
+            'goals': goals,
+            'goals_per_minute': goals / minutes if minutes else 0.0,
+            'paddle_hits': self.paddle_hits,
+            'wall_hits': self.wall_hits,
+            'power_ups_collected': self.power_up_field.collected if self.power_up_field else 0,
+            'stuck_nudges': self.stuck_monitor.nudged,
+            'stuck_faceoffs': self.stuck_monitor.faceoffs,
+            'rallies': len(rallies),
+            'mean_rally_length': sum(rallies) / len(rallies) if rallies else 0.0,
+            'mean_speed': self.speed_sum / self.speed_samples if self.speed_samples else 0.0,
+            'max_speed': self.speed_max,
+            'speed_histogram': list(self.speed_histogram),
+            'bottom_ai': self.bottom_ai.stats(),
+            'top_ai': self.top_ai.stats()
+        }
+
+
+def combine_summaries(summaries):
+    """Merge per-match summaries into totals over all matches"""
+    frames = sum(s['frames'] for s in summaries)
+    goals = sum(s['goals'] for s in summaries)
+    rallies = sum(s['rallies'] for s in summaries)
+    rally_hits = sum(s['mean_rally_length'] * s['rallies'] for s in summaries)
+    histogram = [sum(s['speed_histogram'][i] for s in summaries) for i in range(len(SPEED_BINS))]
+    return {
+        'matches': len(summaries),
+        'frames': frames,
+        'goals': goals,
+        'goals_per_minute': goals / (frames / 3600.0) if frames else 0.0,
+        'paddle_hits': sum(s['paddle_hits'] for s in summaries),
+        'wall_hits': sum(s['wall_hits'] for s in summaries),
+        'stuck_nudges': sum(s['stuck_nudges'] for s in summaries),
+        'stuck_faceoffs': sum(s['stuck_faceoffs'] for s in summaries),
+        'mean_rally_length': rally_hits / rallies if rallies else 0.0,
+        'mean_speed': (sum(s['mean_speed'] * sum(s['speed_histogram']) for s in summaries)
+                       / max(1, sum(histogram))),
+        'max_speed': max((s['max_speed'] for s in summaries), default=0.0),
+        'speed_histogram': histogram
+    }
@@ -0,0 +1,272 @@
+"""
+Long-running physics soak test.
+
+Plays headless AI-vs-AI matches for many seeds in parallel worker
+processes and checks these invariants after every frame:
+
+- every puck is inside the rink (utils.is_valid_position), or in a goal mouth
+- no puck velocity is NaN or infinite
+- no puck is faster than the fastest legal paddle hit
+- each paddle is on its own half unless it can cross the midline
+- no puck overlaps a paddle after collisions have been resolved
+
+A seed stops at its first violation (--grace lets an invariant stay broken
+for a few frames first). Matches are deterministic for a seed,
+so the worker then replays the seed up to the failing frame and saves the
+last few frames of puck and paddle state next to the recipe (seed,
+settings, physics) as a small JSON replay. --replay re-runs one of those
+files and checks that the violation still happens:
+
+    python soak.py --seeds 64 --frames 200000 --workers 8
+    python soak.py --replay soak-replays/seed-12-frame-48211.json
+
+Known failure: every seed currently breaks puck_outside_rink within a few
+hundred frames, when an AI paddle hit pushes the puck past a side wall
+after the boundary pass. Until that is fixed a run saves one replay per
+seed and exits with an error.
+"""
+import os
+import sys
+import json
+import math
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import utils
+import physics
+from physics import PHYSICS
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GOAL_WIDTH, PUCK_RADIUS,
+    SOAK_SEEDS, SOAK_FRAMES, SOAK_REPLAY_FRAMES, SOAK_TOLERANCE
+)
+from simulation import HeadlessMatch
+
+GOAL_LEFT = SCREEN_WIDTH // 2 - GOAL_WIDTH // 2
+GOAL_RIGHT = SCREEN_WIDTH // 2 + GOAL_WIDTH // 2
+
+
+def speed_limit(paddles):
+    """The fastest a puck can legally be moving at the end of a frame.
+
+    Puck.update caps speed at PHYSICS['max_speed'], but a paddle hit in the
+    same frame can send it off faster: boosted by 1.5 and the restitution,
+    plus up to 0.8 of the paddle's own velocity (see Paddle.hit_puck).
+    """
+    paddle_speed = max(math.sqrt(paddle.dx**2 + paddle.dy**2) for paddle in paddles)
+    return max(PHYSICS['max_speed'], 5) * 1.5 * PHYSICS['restitution'] + 0.8 * paddle_speed
+
+
+def in_goal_mouth(x, y):
+    """Pucks may leave the rink through a goal before they count as scored"""
+    return GOAL_LEFT <= x <= GOAL_RIGHT and (y < PUCK_RADIUS or y > SCREEN_HEIGHT - PUCK_RADIUS)
+
+
+def check_invariants(match):
+    """Return (kind, object index, details) for every broken invariant"""
+    violations = []
+    paddles = (match.bottom_paddle, match.top_paddle)
+    limit = speed_limit(paddles)
+    for index, puck in enumerate(match.pucks):
+        if not (math.isfinite(puck.dx) and math.isfinite(puck.dy)):
+            violations.append(('non_finite_velocity', index, None))
+            continue
+        if not (math.isfinite(puck.x) and math.isfinite(puck.y)):
+            violations.append(('non_finite_position', index, None))
+            continue
+        if not (utils.is_valid_position(puck.x, puck.y, PUCK_RADIUS - SOAK_TOLERANCE)
+                or in_goal_mouth(puck.x, puck.y)):
+            violations.append(('puck_outside_rink', index, None))
+        speed = math.sqrt(puck.dx**2 + puck.dy**2)
+        if speed > limit:
+            violations.append(('speed_over_cap', index, round(speed, 3)))
+        for side, paddle in enumerate(paddles):
+            reach = paddle.radius + PUCK_RADIUS - SOAK_TOLERANCE
+            if (puck.x - paddle.x)**2 + (puck.y - paddle.y)**2 < reach * reach:
+                violations.append(('puck_inside_paddle', index, side))
+
+    middle = SCREEN_HEIGHT / 2
+    bottom, top = paddles
+    if not bottom.can_cross_midline and bottom.y > middle - bottom.radius + SOAK_TOLERANCE:
+        violations.append(('paddle_over_midline', 0, None))
+    if not top.can_cross_midline and top.y < middle + top.radius - SOAK_TOLERANCE:
+        violations.append(('paddle_over_midline', 1, None))
+    return violations
+
+
+class InvariantMonitor:
+    """Turns per-frame invariant checks into a failure.
+
+    With grace 0 any broken invariant fails the frame. A positive grace lets
+    the same invariant stay broken for the same object that many frames in a
+    row first, so overlaps the next frame resolves are tolerated and only
+    real escapes are reported.
+    """
+
+    def __init__(self, grace=0):
+        self.grace = grace
+        self.streaks = {}  # (kind, object index) -> consecutive frames broken
+
+    def check(self, match):
+        """Return the violation that fails this frame as a dict, or None"""
+        streaks = {}
+        failure = None
+        for kind, index, details in check_invariants(match):
+            key = (kind, index)
+            streaks[key] = self.streaks.get(key, 0) + 1
+            if failure is None and streaks[key] > self.grace:
+                failure = {'kind': kind, 'object': index, 'details': details, 'frames': streaks[key]}
+        self.streaks = streaks
+        return failure
+
+
+def new_match(recipe):
+    """Set up the physics and the match a recipe describes"""
+    physics.apply_profile(recipe['physics'])
+    return HeadlessMatch(
+        recipe['seed'], recipe['bottom_difficulty'], recipe['top_difficulty'], recipe['pucks'],
+        power_up_settings=recipe['power_ups']
+    )
+
+
+def snapshot(match):
+    """Puck and paddle state after a frame, as stored in replays"""
+    return {
+        'frame': match.frame,
+        'pucks': [[puck.x, puck.y, puck.dx, puck.dy] for puck in match.pucks],
+        'paddles': [
+            [paddle.x, paddle.y, paddle.dx, paddle.dy, paddle.radius, paddle.can_cross_midline, paddle.is_frozen]
+            for paddle in (match.bottom_paddle, match.top_paddle)
+        ]
+    }
+
+
+def soak(recipe, frames):
+    """Play frames frames of a recipe's match. Returns (frames played, violation or None)."""
+    match = new_match(recipe)
+    monitor = InvariantMonitor(recipe['grace'])
+    for _ in range(frames):
+        match.step()
+        violation = monitor.check(match)
+        if violation is not None:
+            return match.frame, violation
+    return match.frame, None
+
+
+def capture_replay(recipe, failed_frame, window=SOAK_REPLAY_FRAMES):
+    """Play the recipe again and keep the last window frames up to failed_frame.
+
+    Returns the frames and the violation the replay fails with at failed_frame.
+    """
+    match = new_match(recipe)
+    monitor = InvariantMonitor(recipe['grace'])
+    first = max(0, failed_frame - window)
+    frames = []
+    violation = None
+    while match.frame < failed_frame:
+        match.step()
+        violation = monitor.check(match)  # Checked every frame so the streaks match the soak
+        if match.frame >= first:
+            frames.append(snapshot(match))
+    return frames, violation
+
+
+def _soak_job(job):
+    recipe, frames, replay_dir = job
+    start = time.perf_counter()
+    played, violation = soak(recipe, frames)
+    result = {'seed': recipe['seed'], 'frames': played, 'seconds': time.perf_counter() - start,
+              'violation': violation, 'replay': None}
+    if violation is not None:
+        trace, repeated = capture_replay(recipe, played)
+        path = os.path.join(replay_dir, f"seed-{recipe['seed']}-frame-{played}.json")
+        os.makedirs(replay_dir, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                'recipe': recipe,
+                'failed_frame': played,
+                'violation': violation,
+                'reproduced': repeated == violation,
+                'frames': trace
+            }, f)
+        result['replay'] = path
+    return result
+
+
+def run(seeds, frames, recipe, replay_dir, workers=None, log=print):
+    """Soak every seed in parallel and return the per-seed results"""
+    jobs = [(dict(recipe, seed=seed), frames, replay_dir) for seed in seeds]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(_soak_job, jobs):
+            results.append(result)
+            if result['violation'] is not None:
+                log(f"seed {result['seed']}: {result['violation']['kind']} at frame {result['frames']}"
+                    f" -> {result['replay']}")
+    return results
+
+
+def replay(path):
+    """Re-run a saved replay and print its trace. Returns True if the violation reproduces."""
+    with open(path) as f:
+        saved = json.load(f)
+    frames, violation = capture_replay(saved['recipe'], saved['failed_frame'], len(saved['frames']) - 1)
+    for state in frames:
+        pucks = "  ".join(f"({x:7.2f},{y:7.2f} v {dx:6.2f},{dy:6.2f})" for x, y, dx, dy in state['pucks'])
+        paddles = "  ".join(f"({p[0]:7.2f},{p[1]:7.2f})" for p in state['paddles'])
+        print(f"{state['frame']:>8}  pucks {pucks}  paddles {paddles}")
+    reproduced = violation == saved['violation']
+    print(f"Saved violation: {saved['violation']}")
+    print(f"Replayed:        {violation} ({'reproduced' if reproduced else 'NOT reproduced'})")
+    return reproduced
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak-test the physics with headless AI-vs-AI matches")
+    parser.add_argument("--seeds", type=int, default=SOAK_SEEDS, help="matches (seeds) to play")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=SOAK_FRAMES, help="frames per seed")
+    parser.add_argument("--pucks", type=int, default=1)
+    parser.add_argument("--no-power-ups", action="store_true")
+    parser.add_argument("--bottom-difficulty", type=int, default=2, choices=[0, 1, 2])
+    parser.add_argument("--top-difficulty", type=int, default=2, choices=[0, 1, 2])
+    parser.add_argument(
+        "--grace", type=int, default=0,
+        help="frames an invariant may stay broken before it counts (1 ignores overlaps fixed next frame)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--replay-dir", default="soak-replays", help="where failing replays are saved")
+    parser.add_argument("--replay", metavar="FILE", help="re-run a saved replay instead of soaking")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        return 0 if replay(args.replay) else 1
+
+    # Soak the profile the game actually plays with
+    physics.load_profile()
+    recipe = {
+        'seed': None,
+        'bottom_difficulty': args.bottom_difficulty,
+        'top_difficulty': args.top_difficulty,
+        'pucks': args.pucks,
+        'power_ups': {'power_ups_enabled': not args.no_power_ups, 'power_up_frequency': 2},
+        'physics': dict(PHYSICS),
+        'grace': args.grace
+    }
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+
+    start = time.perf_counter()
+    results = run(seeds, args.frames, recipe, args.replay_dir, args.workers)
+    elapsed = time.perf_counter() - start
+
+    total = sum(result['frames'] for result in results)
+    failed = [result for result in results if result['violation'] is not None]
+    kinds = {}
+    for result in failed:
+        kinds[result['violation']['kind']] = kinds.get(result['violation']['kind'], 0) + 1
+    print(f"Soak: {len(results)} seeds, {total} frames in {elapsed:.1f} s ({total / elapsed:.0f} frames/s)")
+    print(f"  {len(failed)} seeds broke an invariant" + (f": {kinds}" if kinds else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Procedural sound synthesis for the default sound effects.
+
+Each sound is described by a small parameter dict (see SOUND_SPECS in
+constants.py). Samples are generated in bulk - with NumPy when it is
+installed, otherwise with the standard library array module - and written
+with a single writeframes call. Generated WAVs are cached in the user cache
+directory under a hash of their parameters, so after the first run start-up
+only copies (or skips) files.
+"""
+import os
+import sys
+import json
+import math
+import wave
+import array
+import random
+import shutil
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Bump when the synthesis code changes in a way that alters the output
+SYNTH_VERSION = 1
+SAMPLE_RATE = 44100
+
+DEFAULT_SPEC = {
+    'waveform': 'sine',
+    'frequency': 440.0,
+    'end_frequency': None,  # Set to sweep (chirp) linearly to this frequency
+    'duration': 0.2,
+    'noise': 0.0,  # 0 = pure tone, 1 = pure noise
+    'attack': 0.0,  # Seconds of linear fade-in
+    'decay': None,  # Exponential decay time constant in seconds (None = no decay)
+    'release': 0.0,  # Seconds of linear fade-out at the end
+    'volume': 1.0,
+    'seed': 0  # Seed for the noise generator so output is reproducible
+}
+
+
+def user_cache_dir(subdir='sounds'):
+    """Return a per-user cache directory for the game (generated sounds by default)"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'air_hockey', subdir)
+
+
+def full_spec(spec):
+    """Fill in defaults for any parameters a spec leaves out"""
+    merged = dict(DEFAULT_SPEC)
+    if spec:
+        merged.update(spec)
+    return merged
+
+
+def spec_hash(spec):
+    """Content hash identifying the WAV a spec produces"""
+    key = json.dumps(
+        {'spec': full_spec(spec), 'version': SYNTH_VERSION, 'rate': SAMPLE_RATE},
+        sort_keys=True
+    )
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def _synthesize_numpy(spec, count):
+    """Generate 16-bit samples with vectorized NumPy math"""
+    t = np.arange(count, dtype=np.float64) / SAMPLE_RATE
+    duration = spec['duration']
+    start_freq = spec['frequency']
+    end_freq = spec['end_frequency']
+
+    # Phase of a constant tone or a linear chirp
+    if end_freq is None:
+        phase = 2 * math.pi * start_freq * t
+    else:
+        phase = 2 * math.pi * (start_freq * t + (end_freq - start_freq) * t * t / (2 * duration))
+
+    waveform = spec['waveform']
+    if waveform == 'square':
+        tone = np.sign(np.sin(phase))
+    elif waveform == 'triangle':
+        tone = (2 / math.pi) * np.arcsin(np.sin(phase))
+    elif waveform == 'noise':
+        tone = np.zeros(count)
+    else:
+        tone = np.sin(phase)
+
+    noise_mix = 1.0 if waveform == 'noise' else spec['noise']
+    if noise_mix > 0:
+        noise = np.random.default_rng(spec['seed']).uniform(-1.0, 1.0, count)
+        signal = tone * (1 - noise_mix) + noise * noise_mix
+    else:
+        signal = tone
+
+    # Envelope: attack ramp, optional exponential decay, release ramp
+    envelope = np.ones(count)
+    if spec['attack'] > 0:
+        envelope *= np.minimum(1.0, t / spec['attack'])
+    if spec['decay']:
+        envelope *= np.exp(-t / spec['decay'])
+    if spec['release'] > 0:
+        envelope *= np.minimum(1.0, (duration - t) / spec['release'])
+
+    samples = np.clip(signal * envelope * spec['volume'], -1.0, 1.0) * 32767
+    return samples.astype('<i2').tobytes()
+
+
+def _synthesize_array(spec, count):
+    """Generate 16-bit samples with the array module (used without NumPy)"""
+    duration = spec['duration']
+    start_freq = spec['frequency']
+    end_freq = spec['end_frequency']
+    waveform = spec['waveform']
+    noise_mix = 1.0 if waveform == 'noise' else spec['noise']
+    attack = spec['attack']
+    decay = spec['decay']
+    release = spec['release']
+    volume = spec['volume']
+    rng = random.Random(spec['seed'])
+    two_pi = 2 * math.pi
+
+    def sample(i):
+        t = i / SAMPLE_RATE
+        if end_freq is None:
+            phase = two_pi * start_freq * t
+        else:
+            phase = two_pi * (start_freq * t + (end_freq - start_freq) * t * t / (2 * duration))
+
+        if waveform == 'square':
+            tone = 1.0 if math.sin(phase) >= 0 else -1.0
+        elif waveform == 'triangle':
+            tone = (2 / math.pi) * math.asin(math.sin(phase))
+        elif waveform == 'noise':
+            tone = 0.0
+        else:
+            tone = math.sin(phase)
+
+        value = tone * (1 - noise_mix) + rng.uniform(-1.0, 1.0) * noise_mix if noise_mix > 0 else tone
+
+        envelope = 1.0
+        if attack > 0:
+            envelope *= min(1.0, t / attack)
+        if decay:
+            envelope *= math.exp(-t / decay)
+        if release > 0:
+            envelope *= min(1.0, (duration - t) / release)
+
+        value = max(-1.0, min(1.0, value * envelope * volume))
+        return int(value * 32767)
+
+    samples = array.array('h', [sample(i) for i in range(count)])
+    if sys.byteorder == 'big':
+        samples.byteswap()  # WAV data is little-endian
+    return samples.tobytes()
+
+
+def synthesize(spec):
+    """Return the raw 16-bit mono PCM bytes for a sound spec"""
+    spec = full_spec(spec)
+    count = int(spec['duration'] * SAMPLE_RATE)
+    if np is not None:
+        return _synthesize_numpy(spec, count)
+    return _synthesize_array(spec, count)
+
+
+def write_wav(path, frames):
+    """Write 16-bit mono PCM bytes to a WAV file in one call"""
+    with wave.open(path, 'wb') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 2 bytes per sample
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(frames)
+
+
+class SoundCache:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or user_cache_dir()
+        self.manifest_path = os.path.join(self.cache_dir, 'manifest.json')
+        self.manifest = None  # Loaded lazily: {target path: spec hash it was generated from}
+
+    def _load_manifest(self):
+        if self.manifest is None:
+            try:
+                with open(self.manifest_path) as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                self.manifest = {}
+        return self.manifest
+
+    def _save_manifest(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.manifest_path, 'w') as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"Could not update sound cache manifest: {e}")
+
+    def needs_update(self, path, spec):
+        """True if path is missing/empty, or was generated from different parameters"""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return True
+        # Files we didn't generate (e.g. user-provided sounds) are left alone
+        generated_from = self._load_manifest().get(os.path.abspath(path))
+        return generated_from is not None and generated_from != spec_hash(spec)
+
+    def ensure(self, path, spec):
+        """Make sure path holds the sound for spec, synthesizing only on a cache miss"""
+        key = spec_hash(spec)
+        cached_path = os.path.join(self.cache_dir, key + '.wav')
+
+        if not os.path.exists(cached_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temp name first so a crash never leaves a half-written cache entry
+            temp_path = cached_path + '.tmp'
+            write_wav(temp_path, synthesize(spec))
+            os.replace(temp_path, cached_path)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        shutil.copyfile(cached_path, path)
+
+        self._load_manifest()[os.path.abspath(path)] = key
+        self._save_manifest()
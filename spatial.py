@@ -0,0 +1,69 @@
+"""
+Uniform-grid spatial hash for broad-phase collision checks.
+
+Objects are bucketed by the grid cell holding their center. With the cell
+size at least as large as the biggest collision distance, every colliding
+pair lies in the same cell or in adjacent cells, so each frame costs
+O(N) instead of checking all N*(N-1)/2 pairs.
+"""
+
+# Half of the 8-neighbourhood: together with the cell itself this visits
+# every pair of adjacent cells exactly once
+_FORWARD_NEIGHBOURS = ((1, 0), (1, 1), (0, 1), (-1, 1))
+
+
+class SpatialHash:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of objects
+
+    def clear(self):
+        # Keep the bucket lists around and just empty them, so rebuilding
+        # every frame doesn't reallocate them
+        for bucket in self.cells.values():
+            bucket.clear()
+
+    def insert(self, obj):
+        """Add an object with x/y attributes"""
+        key = (int(obj.x // self.cell_size), int(obj.y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            bucket = []
+            self.cells[key] = bucket
+        bucket.append(obj)
+
+    def build(self, objects):
+        """Replace the contents of the grid with the given objects"""
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def pairs(self):
+        """Yield every pair of objects in the same or adjacent cells, once each"""
+        cells = self.cells
+        for (cell_x, cell_y), bucket in cells.items():
+            count = len(bucket)
+            if count == 0:
+                continue
+            for i in range(count):
+                for j in range(i + 1, count):
+                    yield bucket[i], bucket[j]
+            for offset_x, offset_y in _FORWARD_NEIGHBOURS:
+                other = cells.get((cell_x + offset_x, cell_y + offset_y))
+                if other:
+                    for a in bucket:
+                        for b in other:
+                            yield a, b
+
+    def query(self, x, y, radius):
+        """Yield objects in every cell touched by the square around (x, y)"""
+        cell_size = self.cell_size
+        min_x = int((x - radius) // cell_size)
+        max_x = int((x + radius) // cell_size)
+        min_y = int((y - radius) // cell_size)
+        max_y = int((y + radius) // cell_size)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
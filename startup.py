@@ -0,0 +1,39 @@
+"""
+Start-up timing report.
+
+Records how long each start-up phase took (imports, window creation,
+asset loading on the background thread) and when the first frame was
+drawn, all relative to the moment the game process began importing.
+"""
+import time
+
+
+class StartupTimer:
+    def __init__(self, origin=None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.phases = []  # (name, start, end) in perf_counter seconds
+        self.milestones = {}  # name -> perf_counter seconds
+
+    def add_phase(self, name, start, end):
+        """Record a phase that ran from start to end"""
+        self.phases.append((name, start, end))
+
+    def mark(self, name):
+        """Record a one-off milestone (only the first mark of a name counts)"""
+        if name not in self.milestones:
+            self.milestones[name] = time.perf_counter()
+
+    def has_mark(self, name):
+        return name in self.milestones
+
+    def report(self):
+        """Return the timing breakdown as printable text"""
+        lines = ["Start-up timing:"]
+        for name, start, end in self.phases:
+            lines.append(
+                f"  {name:<14}{(end - start) * 1000:8.1f} ms"
+                f"   (done at {(end - self.origin) * 1000:.1f} ms)"
+            )
+        for name, when in self.milestones.items():
+            lines.append(f"  {name:<14}{(when - self.origin) * 1000:8.1f} ms after start")
+        return "\n".join(lines)
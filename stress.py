@@ -0,0 +1,53 @@
+"""
+Headless stress test.
+
+Plays an AI-vs-AI match with hundreds of pucks and power-ups on the rink
+and reports per-frame update timings against the 60 FPS budget. The same
+load can be watched (and its drawing timed) with `python main.py --stress`.
+
+    python stress.py --pucks 300 --power-ups 100 --seconds 30
+"""
+import sys
+import json
+import time
+import argparse
+from constants import STRESS_PUCKS, STRESS_POWER_UPS, STRESS_SECONDS
+from frame_timing import FrameTimer
+from simulation import HeadlessMatch
+
+
+def run(pucks=STRESS_PUCKS, power_ups=STRESS_POWER_UPS, seconds=STRESS_SECONDS, seed=0):
+    """Run the stress match and return (frame_timer, match_summary)"""
+    frames = int(seconds * 60)
+    match = HeadlessMatch(seed, puck_count=pucks, power_up_count=power_ups)
+    timer = FrameTimer(capacity=frames)
+    clock = time.perf_counter
+    for _ in range(frames):
+        start = clock()
+        match.step()
+        timer.record_update(clock() - start)
+        timer.record_draw(0.0)  # Nothing is drawn headless
+    return timer, match.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the game loop with hundreds of pucks and power-ups")
+    parser.add_argument("--pucks", type=int, default=STRESS_PUCKS)
+    parser.add_argument("--power-ups", type=int, default=STRESS_POWER_UPS)
+    parser.add_argument("--seconds", type=float, default=STRESS_SECONDS, help="simulated seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    timer, summary = run(args.pucks, args.power_ups, args.seconds, args.seed)
+    if args.json:
+        print(json.dumps({'timing': timer.summary(), 'match': summary}, indent=2))
+    else:
+        print(timer.report(f"Stress: {args.pucks} pucks, {args.power_ups} power-ups (headless)"))
+        print(f"  goals {summary['goals']}, paddle hits {summary['paddle_hits']}, "
+              f"wall hits {summary['wall_hits']}, power-ups collected {summary['power_ups_collected']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
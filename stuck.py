@@ -0,0 +1,143 @@
+"""
+Stuck puck detection.
+
+A puck can end up pinned between a paddle and the boards (the AI happily
+holds it against a top corner for minutes) or lie dead where neither
+paddle goes for it. StuckMonitor keeps a StuckDetector per puck, updated
+once per tick in O(1): a ring of the puck's positions and speeds over the
+last STUCK_WINDOW seconds with a running speed sum, plus how long the puck
+has been in a corner region without a break.
+
+- pinned: still moving but going nowhere (small net displacement over the
+  window), or held in a corner for STUCK_CORNER_SECONDS. The puck gets a
+  deterministic nudge towards the centre of the rink; if it is pinned again
+  straight away STUCK_MAX_NUDGES times, it is faced off instead.
+- dead: barely moving for the whole window. The puck is faced off at centre.
+"""
+import math
+from array import array
+import utils
+from events import PUCK_NUDGED, PUCK_FACEOFF
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, INTERPOLATION_SNAP_DISTANCE, STUCK_WINDOW, STUCK_MAX_DISPLACEMENT,
+    STUCK_DEAD_SPEED, STUCK_CORNER_SECONDS, STUCK_NUDGE_SPEED, STUCK_MAX_NUDGES
+)
+
+# Actions returned by StuckDetector.update
+NUDGE = "nudge"
+FACEOFF = "faceoff"
+
+
+class StuckDetector:
+    def __init__(self, tick_time):
+        self.tick_time = tick_time
+        self.size = max(1, round(STUCK_WINDOW / tick_time))  # Ticks in the sliding window
+        self.xs = array('d', [0.0]) * self.size
+        self.ys = array('d', [0.0]) * self.size
+        self.speeds = array('d', [0.0]) * self.size
+        self.nudges = 0  # Nudges in a row that didn't free the puck
+        self.clear()
+
+    def clear(self):
+        """Forget the window, e.g. after the puck was reset or nudged"""
+        self.count = 0
+        self.index = 0  # Next slot to write; once the window is full, also the oldest sample
+        self.speed_sum = 0.0
+        self.corner_time = 0.0
+
+    def update(self, puck):
+        """Add this tick's puck state. Returns NUDGE, FACEOFF or None."""
+        size = self.size
+        i = self.index
+        if self.count:
+            # A jump (goal reset, face-off) starts the window over
+            last = i - 1 if i else size - 1
+            if abs(puck.x - self.xs[last]) + abs(puck.y - self.ys[last]) > INTERPOLATION_SNAP_DISTANCE:
+                self.clear()
+                self.nudges = 0
+                i = 0
+
+        speed = math.sqrt(puck.dx * puck.dx + puck.dy * puck.dy)
+        if self.count == size:
+            self.speed_sum -= self.speeds[i]
+        else:
+            self.count += 1
+        self.xs[i] = puck.x
+        self.ys[i] = puck.y
+        self.speeds[i] = speed
+        self.speed_sum += speed
+        self.index = i + 1 if i + 1 < size else 0
+
+        if utils.is_point_in_corner_region(puck.x, puck.y) >= 0:
+            self.corner_time += self.tick_time
+            if self.corner_time >= STUCK_CORNER_SECONDS:
+                return self.pinned()
+        else:
+            self.corner_time = 0.0
+
+        if self.count < size:
+            return None
+        oldest = self.index
+        if math.hypot(puck.x - self.xs[oldest], puck.y - self.ys[oldest]) >= STUCK_MAX_DISPLACEMENT:
+            self.nudges = 0  # Moving freely again
+            return None
+        if self.speed_sum / size < STUCK_DEAD_SPEED:
+            self.nudges = 0
+            self.clear()
+            return FACEOFF
+        return self.pinned()
+
+    def pinned(self):
+        self.clear()
+        if self.nudges >= STUCK_MAX_NUDGES:
+            self.nudges = 0
+            return FACEOFF
+        self.nudges += 1
+        return NUDGE
+
+
+def nudge(puck):
+    """Send the puck towards the centre of the rink at STUCK_NUDGE_SPEED"""
+    dx = SCREEN_WIDTH / 2 - puck.x
+    dy = SCREEN_HEIGHT / 2 - puck.y
+    distance = math.sqrt(dx * dx + dy * dy)
+    if distance < 1:
+        return False  # Already at centre, nowhere to nudge it
+    puck.dx = dx / distance * STUCK_NUDGE_SPEED
+    puck.dy = dy / distance * STUCK_NUDGE_SPEED
+    return True
+
+
+class StuckMonitor:
+    def __init__(self, tick_time):
+        self.tick_time = tick_time
+        self.detectors = []
+        self.nudged = 0
+        self.faceoffs = 0
+
+    def reset(self):
+        """Start over for a new match"""
+        self.detectors = []
+        self.nudged = 0
+        self.faceoffs = 0
+
+    def update(self, pucks, events=None):
+        """Check every puck after this tick's collisions and free the stuck ones"""
+        detectors = self.detectors
+        while len(detectors) < len(pucks):
+            detectors.append(StuckDetector(self.tick_time))
+        for i in range(len(pucks)):
+            puck = pucks[i]
+            action = detectors[i].update(puck)
+            if action is None:
+                continue
+            x, y = puck.x, puck.y
+            if action == NUDGE and nudge(puck):
+                self.nudged += 1
+                if events is not None:
+                    events.emit(PUCK_NUDGED, x, y, STUCK_NUDGE_SPEED, puck)
+            else:
+                puck.reset()
+                self.faceoffs += 1
+                if events is not None:
+                    events.emit(PUCK_FACEOFF, x, y, 0.0, puck)
@@ -0,0 +1,238 @@
+"""
+Match telemetry recording.
+
+TelemetryRecorder subscribes to the physics EventQueue and copies every
+event (goals, paddle/wall/puck hits, power-up spawns and pickups, freezes)
+into a preallocated columnar ring buffer, together with periodic samples of
+every puck's speed and both paddles' positions. Recording on the game
+thread is a handful of array stores - no allocation, no locks, no I/O.
+
+A background writer thread empties the ring every few hundred
+milliseconds and writes the rows in bulk, either as gzip-compressed JSON
+lines (one object per row) or, for paths ending in .npz, as NumPy column
+arrays written when the recorder is closed. If the writer ever falls a
+whole ring behind, new rows are dropped and counted rather than waiting.
+
+    python main.py --telemetry matches.jsonl.gz
+"""
+import os
+import gzip
+import json
+import time
+import threading
+from array import array
+from events import EVENT_NAMES
+from game_objects import Paddle
+from power_ups import POWER_UP_EFFECTS
+from constants import TELEMETRY_BUFFER_SIZE, TELEMETRY_FLUSH_INTERVAL, TELEMETRY_SAMPLE_INTERVAL
+from sound_synth import user_cache_dir
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (only needed for .npz output)
+    np = None
+
+# Row types beyond the physics events
+PUCK_SAMPLE = 16  # Periodic puck position and speed
+PADDLE_SAMPLE = 17  # Periodic paddle position
+
+ROW_NAMES = dict(EVENT_NAMES)
+ROW_NAMES[PUCK_SAMPLE] = "puck_sample"
+ROW_NAMES[PADDLE_SAMPLE] = "paddle_sample"
+
+SIDE_NAMES = ("bottom", "top")  # side column: 0, 1, or -1 when it doesn't apply
+KIND_NAMES = list(POWER_UP_EFFECTS)  # kind column: power-up type index, or -1
+
+# Column name -> array typecode of the ring buffer
+COLUMNS = {
+    'match': 'i',
+    'time': 'd',
+    'type': 'b',
+    'x': 'f',
+    'y': 'f',
+    'speed': 'f',
+    'side': 'b',
+    'kind': 'b'
+}
+
+
+def default_path(extension='.jsonl.gz'):
+    """A new timestamped file in the user cache directory"""
+    name = time.strftime('match-%Y%m%d-%H%M%S') + extension
+    return os.path.join(user_cache_dir('telemetry'), name)
+
+
+def _side(source):
+    """Which end of the rink an event belongs to"""
+    if source == "PLAYER":
+        return 0
+    if source == "AI":
+        return 1
+    if isinstance(source, Paddle):
+        return 1 if source.is_ai else 0
+    return -1
+
+
+class TelemetryRecorder:
+    def __init__(self, path, capacity=TELEMETRY_BUFFER_SIZE, flush_interval=TELEMETRY_FLUSH_INTERVAL,
+                 sample_interval=TELEMETRY_SAMPLE_INTERVAL):
+        self.path = path
+        self.columnar = path.endswith('.npz')
+        if self.columnar and np is None:
+            raise RuntimeError("NumPy is needed to write .npz telemetry")
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.sample_interval = sample_interval
+
+        # The ring buffer: one preallocated array per column. The game thread
+        # only advances written and the writer only advances read, so the two
+        # never need a lock.
+        self.columns = {name: array(code, [0]) * capacity for name, code in COLUMNS.items()}
+        self.written = 0
+        self.read = 0
+        self.dropped = 0  # Rows lost because the writer was a whole ring behind
+        self.rows = 0  # Rows handed to the file so far
+
+        self.time = 0.0  # Match clock, kept current by the owner
+        self.match = 0
+        self.next_sample = 0.0
+        self.kinds = {name: index for index, name in enumerate(KIND_NAMES)}
+        self.chunks = []  # Column arrays waiting for the .npz file (writer thread)
+
+        self.file = None
+        self.thread = None
+        self.stopping = threading.Event()
+
+    def start(self):
+        """Open the output and start the writer thread"""
+        if self.thread is not None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not self.columnar:
+            self.file = gzip.open(self.path, 'wt', encoding='utf-8')
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._run, name="TelemetryWriter", daemon=True)
+        self.thread.start()
+
+    def close(self):
+        """Write everything still buffered and close the file"""
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.thread = None
+        self.flush()
+        if self.columnar:
+            self._write_npz()
+        else:
+            self.file.close()
+            self.file = None
+
+    def attach(self, events):
+        """Record every event type the queue carries"""
+        for event_type in EVENT_NAMES:
+            events.subscribe(event_type, self.on_event)
+
+    def detach(self, events):
+        for event_type in EVENT_NAMES:
+            events.unsubscribe(event_type, self.on_event)
+
+    def new_match(self):
+        """Start numbering rows for the next match"""
+        self.match += 1
+        self.time = 0.0
+        self.next_sample = 0.0
+
+    def record(self, row_type, x=0.0, y=0.0, speed=0.0, side=-1, kind=-1):
+        """Add one row. Never blocks: the row is dropped if the ring is full."""
+        if self.written - self.read >= self.capacity:
+            self.dropped += 1
+            return
+        i = self.written % self.capacity
+        columns = self.columns
+        columns['match'][i] = self.match
+        columns['time'][i] = self.time
+        columns['type'][i] = row_type
+        columns['x'][i] = x
+        columns['y'][i] = y
+        columns['speed'][i] = speed
+        columns['side'][i] = side
+        columns['kind'][i] = kind
+        self.written += 1
+
+    def on_event(self, event):
+        """EventQueue subscriber"""
+        kind = self.kinds.get(event.detail, -1)
+        self.record(event.type, event.x, event.y, event.speed, _side(event.source), kind)
+
+    def sample(self, pucks, paddles):
+        """Record puck speeds and paddle positions once per sample interval"""
+        if self.time < self.next_sample:
+            return
+        self.next_sample = self.time + self.sample_interval
+        for puck in pucks:
+            speed = (puck.dx * puck.dx + puck.dy * puck.dy) ** 0.5
+            self.record(PUCK_SAMPLE, puck.x, puck.y, speed)
+        for paddle in paddles:
+            self.record(PADDLE_SAMPLE, paddle.x, paddle.y, 0.0, _side(paddle))
+
+    def _run(self):
+        """Writer loop: empty the ring every flush interval until asked to stop"""
+        while not self.stopping.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Move every complete row from the ring to the output (writer thread, or after it stopped)"""
+        start = self.read
+        end = self.written
+        if end == start:
+            return
+        # Copy the rows out in at most two slices, then free the slots
+        first = start % self.capacity
+        last = first + (end - start)
+        chunk = {}
+        for name, column in self.columns.items():
+            if last <= self.capacity:
+                chunk[name] = column[first:last]
+            else:
+                chunk[name] = column[first:] + column[:last - self.capacity]
+        self.read = end
+        self.rows += end - start
+
+        if self.columnar:
+            self.chunks.append(chunk)
+        else:
+            self._write_jsonl(chunk, end - start)
+
+    def _write_jsonl(self, chunk, count):
+        lines = []
+        for i in range(count):
+            side = chunk['side'][i]
+            kind = chunk['kind'][i]
+            lines.append(json.dumps({
+                'match': chunk['match'][i],
+                'time': round(chunk['time'][i], 4),
+                'type': ROW_NAMES.get(chunk['type'][i], chunk['type'][i]),
+                'x': round(chunk['x'][i], 1),
+                'y': round(chunk['y'][i], 1),
+                'speed': round(chunk['speed'][i], 2),
+                'side': SIDE_NAMES[side] if side >= 0 else None,
+                'kind': KIND_NAMES[kind] if kind >= 0 else None
+            }))
+        lines.append('')
+        self.file.write('\n'.join(lines))
+
+    def _write_npz(self):
+        """Concatenate the collected chunks into one array per column"""
+        data = {}
+        for name, code in COLUMNS.items():
+            data[name] = np.concatenate(
+                [np.frombuffer(chunk[name], dtype=code) for chunk in self.chunks]
+            ) if self.chunks else np.zeros(0, dtype=code)
+        data['row_names'] = np.array([ROW_NAMES.get(i, '') for i in range(max(ROW_NAMES) + 1)])
+        data['side_names'] = np.array(SIDE_NAMES)
+        data['kind_names'] = np.array(KIND_NAMES)
+        np.savez_compressed(self.path, **data)
+        self.chunks = []
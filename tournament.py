@@ -0,0 +1,114 @@
+"""
+Head-to-head AI strategy tournament.
+
+Plays every pair of AI strategies (ai.py) against each other in headless
+matches run in parallel worker processes. Each pairing is played from both
+ends of the rink for every seed, so neither strategy profits from the side
+it plays on. The standings show each strategy's wins, goal difference and
+how much CPU time it spent per call, to weigh strength against cost.
+Results come from the match cache (match_cache.py) when a match was played
+before, so their CPU times are the ones measured back then:
+
+    python tournament.py --matches 8 --seconds 120
+    python tournament.py --strategies heuristic lookahead --difficulty 2
+"""
+import sys
+import time
+import argparse
+import ai
+import physics
+from match_cache import MatchCache, new_recipe, play_all
+
+
+def pairings(strategies, seeds, frames, difficulty=1, pucks=1, power_ups=None):
+    """One match recipe per ordered pair of different strategies and seed"""
+    return [
+        new_recipe(seed, frames, bottom, difficulty, top, difficulty, pucks, power_ups)
+        for bottom in strategies for top in strategies if bottom != top
+        for seed in seeds
+    ]
+
+
+def standings(recipes, summaries):
+    """Per-strategy totals over all matches, best first"""
+    table = {}
+    for recipe, summary in zip(recipes, summaries):
+        sides = (
+            (recipe['bottom']['strategy'], summary['bottom_score'], summary['top_score'], summary['bottom_ai']),
+            (recipe['top']['strategy'], summary['top_score'], summary['bottom_score'], summary['top_ai'])
+        )
+        for name, scored, conceded, stats in sides:
+            row = table.setdefault(name, {
+                'strategy': name, 'matches': 0, 'wins': 0, 'draws': 0, 'losses': 0,
+                'goals_for': 0, 'goals_against': 0, 'calls': 0, 'seconds': 0.0, 'max_us': 0.0
+            })
+            row['matches'] += 1
+            if scored > conceded:
+                row['wins'] += 1
+            elif scored == conceded:
+                row['draws'] += 1
+            else:
+                row['losses'] += 1
+            row['goals_for'] += scored
+            row['goals_against'] += conceded
+            row['calls'] += stats['calls']
+            row['seconds'] += stats['mean_us'] * stats['calls'] / 1e6
+            row['max_us'] = max(row['max_us'], stats['max_us'])
+    rows = list(table.values())
+    for row in rows:
+        row['points'] = 3 * row['wins'] + row['draws']
+        row['mean_us'] = 1e6 * row['seconds'] / row['calls'] if row['calls'] else 0.0
+    rows.sort(key=lambda row: (row['points'], row['goals_for'] - row['goals_against']), reverse=True)
+    return rows
+
+
+def report(rows):
+    lines = [f"  {'strategy':<12}{'played':>7}{'won':>5}{'drawn':>6}{'lost':>5}{'goals':>10}"
+             f"{'points':>8}{'us/call':>9}{'max us':>9}"]
+    for row in rows:
+        goals = f"{row['goals_for']}:{row['goals_against']}"
+        lines.append(
+            f"  {row['strategy']:<12}{row['matches']:>7}{row['wins']:>5}{row['draws']:>6}{row['losses']:>5}"
+            f"{goals:>10}{row['points']:>8}{row['mean_us']:>9.1f}{row['max_us']:>9.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play AI strategies against each other")
+    parser.add_argument(
+        "--strategies", nargs="+", choices=list(ai.STRATEGIES), default=list(ai.STRATEGIES),
+        help="strategies to enter (default: all)"
+    )
+    parser.add_argument("--difficulty", type=int, default=1, choices=[0, 1, 2])
+    parser.add_argument("--matches", type=int, default=4, help="seeds per pairing and side")
+    parser.add_argument("--seconds", type=int, default=120, help="simulated seconds per match")
+    parser.add_argument("--pucks", type=int, default=1)
+    parser.add_argument("--no-power-ups", action="store_true")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", default=None, help="match cache database (default: in the user cache directory)")
+    parser.add_argument("--no-cache", action="store_true", help="simulate every match, even ones played before")
+    args = parser.parse_args(argv)
+    if len(set(args.strategies)) < 2:
+        parser.error("a tournament needs at least two different strategies")
+
+    # Play with the profile the game actually uses
+    physics.load_profile()
+    recipes = pairings(
+        list(dict.fromkeys(args.strategies)), range(args.matches), args.seconds * 60, args.difficulty,
+        args.pucks, {'power_ups_enabled': not args.no_power_ups, 'power_up_frequency': 1}
+    )
+    cache = None if args.no_cache else MatchCache(args.cache)
+
+    start = time.perf_counter()
+    summaries, simulated = play_all(recipes, cache, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Tournament: {len(recipes)} matches of {args.seconds} s at difficulty {args.difficulty} "
+          f"({simulated} simulated) in {elapsed:.1f} s")
+    print(report(standings(recipes, summaries)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Puck trails.
+
+Fast shots are easier to follow with a fading streak behind the puck.
+PuckTrails keeps each puck's last positions and speeds in a fixed-size ring
+(one slice of a shared array per puck), recorded once per tick. Drawing
+turns every trail into a tapering ribbon of triangles whose alpha fades
+with age and with the puck's speed at that point - slow stretches are left
+out entirely - writes them into one preallocated vertex buffer and draws
+all trails with a single call. Nothing is allocated per frame once the
+buffers for a match's puck count exist.
+"""
+import math
+from array import array
+from arcade.gl import BufferDescription
+from constants import (
+    QUALITY_LEVELS, INTERPOLATION_SNAP_DISTANCE, TRAIL_WIDTH, TRAIL_COLOR, TRAIL_OPACITY,
+    TRAIL_MIN_SPEED, TRAIL_FULL_SPEED
+)
+
+# Enough samples for the most detailed quality level
+TRAIL_CAPACITY = max(level['trail_length'] for level in QUALITY_LEVELS)
+
+FLOATS_PER_VERTEX = 6  # x, y, r, g, b, a
+VERTICES_PER_SEGMENT = 6  # Two triangles
+
+VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec4 in_color;
+
+out vec4 v_color;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+    v_color = in_color;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+in vec4 v_color;
+out vec4 out_color;
+
+void main() {
+    out_color = v_color;
+}
+"""
+
+
+def _put(v, n, x, y, alpha):
+    """Write one vertex's position and alpha at float index n; returns the next index"""
+    v[n] = x
+    v[n + 1] = y
+    v[n + 5] = alpha
+    return n + FLOATS_PER_VERTEX
+
+
+class PuckTrails:
+    def __init__(self, ctx, capacity=TRAIL_CAPACITY):
+        self.ctx = ctx
+        self.capacity = capacity
+        self.length = capacity  # Samples drawn per trail (set by the quality level); 0 turns trails off
+        self.program = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+        self.pucks = 0  # Trails the buffers have room for
+        self.xs = array('d')
+        self.ys = array('d')
+        self.speeds = array('d')
+        self.heads = array('i')  # Per puck: next slot to write in its ring
+        self.counts = array('i')  # Per puck: samples in its ring
+        self.vertices = array('f')
+        self.buffer = None
+        self.geometry = None
+
+    def resize(self, puck_count):
+        """Make room for puck_count trails (at match start) and clear them"""
+        if puck_count != self.pucks:
+            size = puck_count * self.capacity
+            self.xs = array('d', bytes(8 * size))
+            self.ys = array('d', bytes(8 * size))
+            self.speeds = array('d', bytes(8 * size))
+            self.heads = array('i', bytes(4 * puck_count))
+            self.counts = array('i', bytes(4 * puck_count))
+            # At most one segment per sample
+            self.vertices = array('f', bytes(4 * size * VERTICES_PER_SEGMENT * FLOATS_PER_VERTEX))
+            # The color never changes; drawing only writes positions and alpha
+            for i in range(0, len(self.vertices), FLOATS_PER_VERTEX):
+                self.vertices[i + 2] = TRAIL_COLOR[0] / 255
+                self.vertices[i + 3] = TRAIL_COLOR[1] / 255
+                self.vertices[i + 4] = TRAIL_COLOR[2] / 255
+            self.buffer = self.ctx.buffer(reserve=max(4, len(self.vertices) * 4))
+            self.geometry = self.ctx.geometry(
+                [BufferDescription(self.buffer, '2f 4f', ['in_vert', 'in_color'])],
+                mode=self.ctx.TRIANGLES
+            )
+            self.pucks = puck_count
+        self.clear()
+
+    def clear(self):
+        for i in range(self.pucks):
+            self.heads[i] = 0
+            self.counts[i] = 0
+
+    def set_length(self, length):
+        """Draw the last length samples; trails start over when they are switched back on"""
+        length = min(length, self.capacity)
+        if length != self.length:
+            if self.length == 0:
+                self.clear()
+            self.length = length
+
+    def record(self, pucks):
+        """Add every puck's position after a tick"""
+        if self.length == 0:
+            return
+        capacity = self.capacity
+        xs, ys = self.xs, self.ys
+        for i in range(min(len(pucks), self.pucks)):
+            puck = pucks[i]
+            base = i * capacity
+            head = self.heads[i]
+            count = self.counts[i]
+            if count:
+                last = base + (head - 1 if head else capacity - 1)
+                # A reset or face-off jumps across the rink; don't streak after it
+                if abs(puck.x - xs[last]) + abs(puck.y - ys[last]) > INTERPOLATION_SNAP_DISTANCE:
+                    count = 0
+            xs[base + head] = puck.x
+            ys[base + head] = puck.y
+            self.speeds[base + head] = math.sqrt(puck.dx * puck.dx + puck.dy * puck.dy)
+            self.heads[i] = head + 1 if head + 1 < capacity else 0
+            self.counts[i] = count + 1 if count < capacity else capacity
+
+    def draw(self, pucks):
+        """Draw every trail, ending at the puck's drawn position, with one draw call"""
+        length = self.length
+        if length == 0:
+            return
+        capacity = self.capacity
+        xs, ys, speeds = self.xs, self.ys, self.speeds
+        v = self.vertices
+        speed_range = (TRAIL_FULL_SPEED - TRAIL_MIN_SPEED) / TRAIL_OPACITY
+        n = 0  # Floats written
+        for i in range(min(len(pucks), self.pucks)):
+            count = min(self.counts[i], length)
+            if count < 2:
+                continue
+            base = i * capacity
+            head = self.heads[i]
+            # Walk from the puck back to the oldest sample; a is the newer end of each segment.
+            # The puck is drawn between its last two samples, so the newest one is skipped.
+            ax = pucks[i].x
+            ay = pucks[i].y
+            a_fade = 1.0
+            a_speed = speeds[base + (head - 1 if head else capacity - 1)]
+            for k in range(1, count):
+                slot = head - 1 - k
+                if slot < 0:
+                    slot += capacity
+                bx = xs[base + slot]
+                by = ys[base + slot]
+                b_fade = 1.0 - k / (count - 1)
+                b_speed = speeds[base + slot]
+                dx = ax - bx
+                dy = ay - by
+                distance = math.sqrt(dx * dx + dy * dy)
+                a_alpha = a_fade * min(TRAIL_OPACITY, max(0.0, (a_speed - TRAIL_MIN_SPEED) / speed_range))
+                b_alpha = b_fade * min(TRAIL_OPACITY, max(0.0, (b_speed - TRAIL_MIN_SPEED) / speed_range))
+                if distance > 0.01 and a_alpha + b_alpha > 0.0:
+                    # Offsets across the segment, narrowing towards the tail
+                    nx = -dy / distance * TRAIL_WIDTH
+                    ny = dx / distance * TRAIL_WIDTH
+                    # Triangles (a+, a-, b+) and (b+, a-, b-)
+                    n = _put(v, n, ax + nx * a_fade, ay + ny * a_fade, a_alpha)
+                    n = _put(v, n, ax - nx * a_fade, ay - ny * a_fade, a_alpha)
+                    n = _put(v, n, bx + nx * b_fade, by + ny * b_fade, b_alpha)
+                    n = _put(v, n, bx + nx * b_fade, by + ny * b_fade, b_alpha)
+                    n = _put(v, n, ax - nx * a_fade, ay - ny * a_fade, a_alpha)
+                    n = _put(v, n, bx - nx * b_fade, by - ny * b_fade, b_alpha)
+                ax = bx
+                ay = by
+                a_fade = b_fade
+                a_speed = b_speed
+        if n == 0:
+            return
+        self.buffer.write(memoryview(v)[:n])
+        with self.ctx.enabled(self.ctx.BLEND):
+            self.ctx.blend_func = self.ctx.BLEND_DEFAULT
+            self.geometry.render(self.program, vertices=n // FLOATS_PER_VERTEX)
@@ -0,0 +1,149 @@
+"""
+Physics constant auto-tuner.
+
+Searches the friction / wall damping / max speed / paddle restitution /
+momentum space with headless AI-vs-AI matches run in parallel worker
+processes. Each candidate is scored against target rally length, goal rate
+and puck speed distribution; the best one is written to
+PHYSICS_PROFILE_FILE, which the game loads at start-up.
+
+Every match result is kept in the match cache (match_cache.py), so rerunning
+with more trials, seeds or rounds only simulates the matches that haven't
+been played before:
+
+    python tuner.py --trials 64 --workers 4
+"""
+import sys
+import random
+import argparse
+from constants import PHYSICS_PROFILE_FILE
+import physics
+import simulation
+from match_cache import MatchCache, new_recipe, play_all
+
+# Search range for each tunable value: (low, high)
+PARAMETER_SPACE = {
+    'friction': (0.975, 0.998),
+    'wall_bounce_damping': (0.6, 0.95),
+    'max_speed': (30.0, 90.0),
+    'restitution': (0.9, 1.4),
+    'momentum_factor': (0.2, 1.0)
+}
+
+# What a good-feeling match looks like, and how much each miss counts
+TARGETS = {
+    'mean_rally_length': (8.0, 1.0),  # Paddle hits per rally
+    'goals_per_minute': (6.0, 1.0),
+    'mean_speed': (12.0, 0.5),  # Average puck speed, pixels per frame
+    'fast_share': (0.15, 0.5)  # Share of frames with the puck above 20 px/frame
+}
+
+
+def candidate_recipes(params, seeds, frames):
+    """One headless match per seed with the given physics"""
+    return [new_recipe(seed, frames, physics_values=params) for seed in seeds]
+
+
+def candidate_metrics(summaries):
+    """Combined metrics of a candidate's matches"""
+    metrics = simulation.combine_summaries(summaries)
+    histogram = metrics['speed_histogram']
+    fast_bin = simulation.SPEED_BINS.index(20)
+    metrics['fast_share'] = sum(histogram[fast_bin:]) / max(1, sum(histogram))
+    return metrics
+
+
+def score(metrics):
+    """Weighted squared relative error against TARGETS (lower is better)"""
+    total = 0.0
+    for name, (target, weight) in TARGETS.items():
+        error = (metrics[name] - target) / target
+        total += weight * error * error
+    return total
+
+
+def sample_candidate(rng, around=None, spread=1.0):
+    """Draw a candidate uniformly, or near another candidate when around is given"""
+    params = {}
+    for name, (low, high) in PARAMETER_SPACE.items():
+        if around is None:
+            value = rng.uniform(low, high)
+        else:
+            value = rng.gauss(around[name], (high - low) * 0.1 * spread)
+        params[name] = round(max(low, min(high, value)), 4)
+    return params
+
+
+def tune(trials=32, refine_rounds=2, seeds=(0, 1, 2, 3), frames=7200, workers=None,
+         search_seed=0, cache=None, log=print):
+    """Random search followed by rounds of refinement around the best candidate.
+
+    cache is a MatchCache, or None to simulate every match. Returns
+    (best_params, best_score, best_metrics).
+    """
+    rng = random.Random(search_seed)
+    seeds = tuple(seeds)
+    results = []  # (score, params, metrics)
+
+    # The current profile (loaded by the caller) is always a candidate, so tuning never makes things worse
+    rounds = [[dict(physics.PHYSICS)] + [sample_candidate(rng) for _ in range(trials)]]
+
+    round_index = 0
+    while round_index < len(rounds):
+        candidates = rounds[round_index]
+        recipes = [recipe for params in candidates for recipe in candidate_recipes(params, seeds, frames)]
+        summaries, simulated = play_all(recipes, cache, workers)
+        log(f"Round {round_index + 1}: {len(candidates)} candidates, {len(recipes)} matches, "
+            f"{simulated} simulated")
+
+        for i, params in enumerate(candidates):
+            metrics = candidate_metrics(summaries[i * len(seeds):(i + 1) * len(seeds)])
+            results.append((score(metrics), params, metrics))
+        results.sort(key=lambda result: result[0])
+
+        if round_index < refine_rounds:
+            best_params = results[0][1]
+            spread = 1.0 / (round_index + 1)
+            rounds.append([sample_candidate(rng, best_params, spread) for _ in range(trials)])
+        round_index += 1
+
+    best_score, best_params, best_metrics = results[0]
+    return best_params, best_score, best_metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune physics constants with headless AI-vs-AI matches")
+    parser.add_argument("--trials", type=int, default=32, help="candidates per round")
+    parser.add_argument("--refine", type=int, default=2, help="refinement rounds after the random round")
+    parser.add_argument("--matches", type=int, default=4, help="matches (seeds) per candidate")
+    parser.add_argument("--seconds", type=int, default=120, help="simulated seconds per match")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the search itself")
+    parser.add_argument("--output", default=PHYSICS_PROFILE_FILE, help="where to write the best profile")
+    parser.add_argument("--cache", default=None, help="match cache database (default: in the user cache directory)")
+    parser.add_argument("--no-cache", action="store_true", help="simulate every match, even ones played before")
+    args = parser.parse_args(argv)
+
+    # Start from the profile this run would replace
+    physics.load_profile(args.output)
+    best_params, best_score, best_metrics = tune(
+        trials=args.trials,
+        refine_rounds=args.refine,
+        seeds=range(args.matches),
+        frames=args.seconds * 60,
+        workers=args.workers,
+        search_seed=args.seed,
+        cache=None if args.no_cache else MatchCache(args.cache)
+    )
+
+    physics.save_profile(best_params, args.output, score=best_score, metrics=best_metrics)
+    print(f"Best score {best_score:.4f} written to {args.output}")
+    for name in PARAMETER_SPACE:
+        print(f"  {name:<20}{best_params[name]:>10.4f}")
+    for name in TARGETS:
+        print(f"  {name:<20}{best_metrics[name]:>10.3f}  (target {TARGETS[name][0]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,168 +1,106 @@
-import os
 import math
-import wave
-import struct
-import random
 import arcade
-from constants import SOUND_FILES, CORNER_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT
+from sound_synth import SoundCache
+from constants import SOUND_FILES, SOUND_SPECS, CORNER_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT
 
 def create_default_sound_files():
-    """Create placeholder sound files if they don't exist"""
-    # Create sounds directory if it doesn't exist
-    os.makedirs("sounds", exist_ok=True)
+    """Synthesize any missing sound files, reusing cached results from earlier runs"""
+    cache = SoundCache()
     
-    # Check if each file exists, if not create a placeholder
     for sound_file in SOUND_FILES:
-        if not os.path.exists(sound_file):
-            # Create an empty placeholder WAV file
-            try:
-                # Create a simple beep sound
-                sample_rate = 44100
-                duration = 0.2  # seconds
-                frequency = 440.0  # A4 note
-                
-                # Open WAV file for writing
-                with wave.open(sound_file, 'w') as wav_file:
-                    wav_file.setnchannels(1)  # Mono
-                    wav_file.setsampwidth(2)  # 2 bytes per sample
-                    wav_file.setframerate(sample_rate)
-                    
-                    # Generate sine wave
-                    for i in range(int(duration * sample_rate)):
-                        value = int(32767 * math.sin(2 * math.pi * frequency * i / sample_rate))
-                        data = struct.pack('<h', value)
-                        wav_file.writeframes(data)
-            except Exception as e:
-                print(f"Could not create sound file {sound_file}: {e}")
-                print("You may need to provide your own sound files in the 'sounds' directory.")
+        spec = SOUND_SPECS.get(sound_file)
+        if not cache.needs_update(sound_file, spec):
+            continue
+        try:
+            cache.ensure(sound_file, spec)
+        except Exception as e:
+            print(f"Could not create sound file {sound_file}: {e}")
+            print("You may need to provide your own sound files in the 'sounds' directory.")
 
-def spawn_particles(x, y, color, count=10):
-    """Creates a list of particle dictionaries"""
-    particles = []
-    for _ in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1, 3)
-        lifetime = random.uniform(0.2, 0.5)
-        radius = random.uniform(2, 5)
-        
-        particles.append({
-            'x': x,
-            'y': y,
-            'dx': math.cos(angle) * speed,
-            'dy': math.sin(angle) * speed,
-            'radius': radius,
-            'original_radius': radius,
-            'lifetime': lifetime,
-            'max_lifetime': lifetime,
-            'color': color
-        })
-    return particles
+# The rink markings never change, so they are built once into a shape list
+# (lazily, as that needs the window's GL context) and drawn in a single call
+_rink_shapes = None
 
-def update_particles(particles, delta_time):
-    """Updates all particles and returns the updated list"""
-    for i in range(len(particles) - 1, -1, -1):
-        particle = particles[i]
-        
-        # Move particle
-        particle['x'] += particle['dx']
-        particle['y'] += particle['dy']
-        
-        # Reduce lifetime
-        particle['lifetime'] -= delta_time
-        
-        # Remove particle if lifetime is up
-        if particle['lifetime'] <= 0:
-            particles.pop(i)
-        else:
-            # Shrink particle as it ages
-            particle['radius'] = particle['original_radius'] * (particle['lifetime'] / particle['max_lifetime'])
-    
-    return particles
+def _ring(center_x, center_y, inside, outside, start_angle, end_angle, color, segments=128):
+    """The band between two radii as a triangle strip, segmented like arcade.draw_arc_outline"""
+    points = []
+    for segment in range(int(start_angle / 360 * segments), int(end_angle / 360 * segments) + 1):
+        theta = 2.0 * math.pi * segment / segments
+        points.append((center_x + inside * math.cos(theta), center_y + inside * math.sin(theta)))
+        points.append((center_x + outside * math.cos(theta), center_y + outside * math.sin(theta)))
+    return arcade.shape_list.create_triangles_strip_filled_with_colors(points, [color] * len(points))
 
-def draw_rounded_hockey_rink():
-    """Draw a hockey rink with basic rounded corners - reliable approach"""
+def build_rink_shapes():
+    """Build the boundary, corner arcs, center line and center circle of the rink"""
     # Line width for the rink boundary
     BORDER_WIDTH = 6
-    
-    # Draw the main straight boundaries
-    # Top line
-    arcade.draw_line(
-        CORNER_RADIUS, SCREEN_HEIGHT,
-        SCREEN_WIDTH - CORNER_RADIUS, SCREEN_HEIGHT,
-        arcade.color.WHITE, BORDER_WIDTH
-    )
-    
-    # Bottom line
-    arcade.draw_line(
-        CORNER_RADIUS, 0,
-        SCREEN_WIDTH - CORNER_RADIUS, 0,
-        arcade.color.WHITE, BORDER_WIDTH
-    )
-    
-    # Left line
-    arcade.draw_line(
-        0, CORNER_RADIUS,
-        0, SCREEN_HEIGHT - CORNER_RADIUS,
-        arcade.color.WHITE, BORDER_WIDTH
-    )
-    
-    # Right line
-    arcade.draw_line(
-        SCREEN_WIDTH, CORNER_RADIUS,
-        SCREEN_WIDTH, SCREEN_HEIGHT - CORNER_RADIUS,
-        arcade.color.WHITE, BORDER_WIDTH
-    )
-    
-    # Draw the corner arcs using arcade's built-in arc function
-    # Top-left corner
-    arcade.draw_arc_outline(
-        CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS,
-        CORNER_RADIUS * 2, CORNER_RADIUS * 2,
-        arcade.color.WHITE, 90, 180, BORDER_WIDTH
-    )
-    
-    # Top-right corner
-    arcade.draw_arc_outline(
-        SCREEN_WIDTH - CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS,
-        CORNER_RADIUS * 2, CORNER_RADIUS * 2,
-        arcade.color.WHITE, 0, 90, BORDER_WIDTH
-    )
-    
-    # Bottom-left corner
-    arcade.draw_arc_outline(
-        CORNER_RADIUS, CORNER_RADIUS,
-        CORNER_RADIUS * 2, CORNER_RADIUS * 2,
-        arcade.color.WHITE, 180, 270, BORDER_WIDTH
-    )
-    
-    # Bottom-right corner
-    arcade.draw_arc_outline(
-        SCREEN_WIDTH - CORNER_RADIUS, CORNER_RADIUS,
-        CORNER_RADIUS * 2, CORNER_RADIUS * 2,
-        arcade.color.WHITE, 270, 360, BORDER_WIDTH
-    )
-    
-    # Draw center line
-    arcade.draw_line(
-        0, SCREEN_HEIGHT // 2,
-        SCREEN_WIDTH, SCREEN_HEIGHT // 2,
-        arcade.color.WHITE, 2
-    )
-    
-    # Draw center circle
-    arcade.draw_circle_outline(
-        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-        100, arcade.color.WHITE, 2
-    )
+    # arcade.draw_arc_outline centers its border on the radius but only half as wide
+    arc_inside = CORNER_RADIUS - BORDER_WIDTH / 4
+    arc_outside = CORNER_RADIUS + BORDER_WIDTH / 4
+    white = arcade.color.WHITE
+    shapes = arcade.shape_list.ShapeElementList()
+    
+    # Straight boundaries: top, bottom, left, right
+    shapes.append(arcade.shape_list.create_line(
+        CORNER_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH - CORNER_RADIUS, SCREEN_HEIGHT, white, BORDER_WIDTH
+    ))
+    shapes.append(arcade.shape_list.create_line(
+        CORNER_RADIUS, 0, SCREEN_WIDTH - CORNER_RADIUS, 0, white, BORDER_WIDTH
+    ))
+    shapes.append(arcade.shape_list.create_line(
+        0, CORNER_RADIUS, 0, SCREEN_HEIGHT - CORNER_RADIUS, white, BORDER_WIDTH
+    ))
+    shapes.append(arcade.shape_list.create_line(
+        SCREEN_WIDTH, CORNER_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT - CORNER_RADIUS, white, BORDER_WIDTH
+    ))
+    
+    # Corner arcs: top-left, top-right, bottom-left, bottom-right
+    left = CORNER_RADIUS
+    right = SCREEN_WIDTH - CORNER_RADIUS
+    bottom = CORNER_RADIUS
+    top = SCREEN_HEIGHT - CORNER_RADIUS
+    shapes.append(_ring(left, top, arc_inside, arc_outside, 90, 180, white))
+    shapes.append(_ring(right, top, arc_inside, arc_outside, 0, 90, white))
+    shapes.append(_ring(left, bottom, arc_inside, arc_outside, 180, 270, white))
+    shapes.append(_ring(right, bottom, arc_inside, arc_outside, 270, 360, white))
+    
+    # Center line and center circle (2 px wide, inside the radius like arcade.draw_circle_outline)
+    shapes.append(arcade.shape_list.create_line(0, SCREEN_HEIGHT // 2, SCREEN_WIDTH, SCREEN_HEIGHT // 2, white, 2))
+    shapes.append(_ring(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 98, 100, 0, 360, white))
+    return shapes
+
+def draw_rounded_hockey_rink():
+    """Draw a hockey rink with rounded corners"""
+    global _rink_shapes
+    if _rink_shapes is None:
+        _rink_shapes = build_rink_shapes()
+    _rink_shapes.draw()
+
+def faceoff_positions(count, radius):
+    """Spread count objects in rows around the center spot without overlapping"""
+    spacing = radius * 2 + 4
+    per_row = max(1, int((SCREEN_WIDTH - 2 * radius) // spacing))
+    positions = []
+    for i in range(count):
+        row, column = divmod(i, per_row)
+        in_row = min(per_row, count - row * per_row)
+        x = SCREEN_WIDTH / 2 + (column - (in_row - 1) / 2) * spacing
+        # Rows alternate below and above the center line
+        offset = (row + 1) // 2 * spacing * (1 if row % 2 else -1)
+        positions.append((x, SCREEN_HEIGHT / 2 + offset))
+    return positions
+
+# Centers of the rounded corners, built once instead of on every collision check
+RINK_CORNERS = (
+    (CORNER_RADIUS, CORNER_RADIUS),  # Bottom-left
+    (SCREEN_WIDTH - CORNER_RADIUS, CORNER_RADIUS),  # Bottom-right
+    (CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS),  # Top-left
+    (SCREEN_WIDTH - CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS)  # Top-right
+)
 
 def get_rink_corner_positions():
     """Return the positions of the four corners of the rink"""
-    return [
-        (CORNER_RADIUS, CORNER_RADIUS),  # Bottom-left
-        (SCREEN_WIDTH - CORNER_RADIUS, CORNER_RADIUS),  # Bottom-right
-        (CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS),  # Top-left
-        (SCREEN_WIDTH - CORNER_RADIUS, SCREEN_HEIGHT - CORNER_RADIUS)  # Top-right
-    ]
+    return RINK_CORNERS
 
 def is_point_in_corner_region(x, y):
     """Check if a point is in one of the corner regions of the rink"""
@@ -214,6 +152,16 @@ def constrain_to_rink(x, y, radius, half=None):
     Returns:
     - (x, y): Constrained position
     """
+    move_within_rink(_point, x, y, radius, half)
+    return _point.x, _point.y
+
+class _Point:
+    __slots__ = ('x', 'y')
+
+_point = _Point()  # Scratch result for constrain_to_rink
+
+def move_within_rink(obj, x, y, radius, half=None):
+    """Like constrain_to_rink, but stores the position in obj.x/obj.y instead of returning a tuple"""
     # First constrain to half if specified
     if half == 'top':
         y = max(SCREEN_HEIGHT / 2 + radius, min(SCREEN_HEIGHT - radius, y))
@@ -227,8 +175,7 @@ def constrain_to_rink(x, y, radius, half=None):
     # Check if in corner region
     corner_index = is_point_in_corner_region(x, y)
     if corner_index >= 0:
-        corner_positions = get_rink_corner_positions()
-        corner_x, corner_y = corner_positions[corner_index]
+        corner_x, corner_y = RINK_CORNERS[corner_index]
         
         # Calculate distance and direction from corner center to position
         dx = x - corner_x
@@ -246,4 +193,5 @@ def constrain_to_rink(x, y, radius, half=None):
                 x = corner_x + dx * (CORNER_RADIUS - radius)
                 y = corner_y + dy * (CORNER_RADIUS - radius)
     
-    return x, y
\ No newline at end of file
+    obj.x = x
+    obj.y = y
\ No newline at end of file